@@ -0,0 +1,203 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import warnings
+from datetime import date
+from typing import Any, Optional
+
+from holidays.benchmarks.common import PRESETS, Entity, get_entities, write_report
+from holidays.benchmarks.populate import DEFAULT_YEARS, run_populate_benchmark
+from holidays.benchmarks.sessions import run_sessions_benchmark
+from holidays.benchmarks.startup import run_startup_benchmark
+
+
+def _run_populate_benchmark(args: argparse.Namespace, entities: list[Entity]) -> dict[str, Any]:
+    return run_populate_benchmark(
+        entities,
+        range(args.start_year, args.end_year + 1),
+        repeat=args.repeat,
+        top=args.top,
+        baseline=args.baseline,
+        threshold=args.threshold,
+    )
+
+
+def _run_sessions_benchmark(args: argparse.Namespace, entities: list[Entity]) -> dict[str, Any]:
+    # Benchmark all the markets if no entities are specified.
+    if not (args.country or args.market or args.preset):
+        entities = [entity for entity in entities if entity.kind == "financial"]
+
+    return run_sessions_benchmark(
+        entities, range(args.start_year, args.end_year + 1), repeat=args.repeat
+    )
+
+
+def _run_startup_benchmark(args: argparse.Namespace, entities: list[Entity]) -> dict[str, Any]:
+    return run_startup_benchmark(
+        entities, args.year, repeat=args.repeat, top=args.top, in_process=args.in_process
+    )
+
+
+def main(args: Optional[list[str]] = None) -> None:
+    """Run holidays benchmarks: ``python -m holidays.benchmarks <benchmark>``."""
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m holidays.benchmarks", description="Run holidays performance benchmarks."
+    )
+    subparsers = arg_parser.add_subparsers(dest="benchmark", required=True)
+
+    startup_parser = subparsers.add_parser(
+        "startup", help="Measure time from entity import to the first answered query."
+    )
+    startup_parser.add_argument(
+        "--year",
+        default=date.today().year,
+        help="The year of the first query",
+        type=int,
+    )
+    startup_parser.add_argument(
+        "-r",
+        "--repeat",
+        default=3,
+        help="The number of measurements per entity, the best one is reported",
+        type=int,
+    )
+    startup_parser.add_argument(
+        "--top",
+        default=10,
+        help="The number of the slowest entities to flag",
+        type=int,
+    )
+    startup_parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Measure all entities in the current interpreter",
+    )
+    startup_parser.set_defaults(run=_run_startup_benchmark)
+
+    populate_parser = subparsers.add_parser(
+        "populate", help="Measure populate throughput per entity snapshot file and category."
+    )
+    populate_parser.add_argument(
+        "--start-year",
+        default=DEFAULT_YEARS[0],
+        help="The first year to populate",
+        type=int,
+    )
+    populate_parser.add_argument(
+        "--end-year",
+        default=DEFAULT_YEARS[-1],
+        help="The last year to populate",
+        type=int,
+    )
+    populate_parser.add_argument(
+        "-r",
+        "--repeat",
+        default=3,
+        help="The number of measurements per case, the best one is reported",
+        type=int,
+    )
+    populate_parser.add_argument(
+        "--top",
+        default=10,
+        help="The number of the slowest cases to flag",
+        type=int,
+    )
+    populate_parser.add_argument(
+        "--baseline",
+        help="The baseline report file path to compare the results against",
+        type=str,
+    )
+    populate_parser.add_argument(
+        "--threshold",
+        default=0.25,
+        help="The maximum allowed relative throughput decrease against the baseline",
+        type=float,
+    )
+    populate_parser.set_defaults(run=_run_populate_benchmark)
+
+    sessions_parser = subparsers.add_parser(
+        "sessions", help="Compare trading sessions queries against working days iteration."
+    )
+    sessions_parser.add_argument(
+        "--start-year",
+        default=DEFAULT_YEARS[0],
+        help="The first year to query",
+        type=int,
+    )
+    sessions_parser.add_argument(
+        "--end-year",
+        default=DEFAULT_YEARS[-1],
+        help="The last year to query",
+        type=int,
+    )
+    sessions_parser.add_argument(
+        "-r",
+        "--repeat",
+        default=3,
+        help="The number of measurements per query, the best one is reported",
+        type=int,
+    )
+    sessions_parser.set_defaults(run=_run_sessions_benchmark)
+
+    for subparser in subparsers.choices.values():
+        subparser.add_argument(
+            "-c",
+            "--country",
+            action="extend",
+            nargs="+",
+            default=[],
+            help="Country codes to benchmark",
+            type=str,
+        )
+        subparser.add_argument(
+            "-m",
+            "--market",
+            action="extend",
+            nargs="+",
+            default=[],
+            help="Market codes to benchmark",
+            type=str,
+        )
+        subparser.add_argument(
+            "-p",
+            "--preset",
+            action="extend",
+            choices=sorted(PRESETS),
+            nargs="+",
+            default=[],
+            help="Predefined country sets to benchmark",
+            type=str,
+        )
+        subparser.add_argument(
+            "-o",
+            "--output",
+            help="The JSON report file path (stdout by default)",
+            type=str,
+        )
+
+    parsed_args = arg_parser.parse_args(args)
+    countries = parsed_args.country + [
+        code for preset in parsed_args.preset for code in PRESETS[preset]
+    ]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        entities = get_entities(countries, parsed_args.market)
+        report = parsed_args.run(parsed_args, entities)
+    write_report(report, parsed_args.output)
+
+    if regressions := report.get("regressions"):
+        arg_parser.exit(1, f"Performance regressions found: {', '.join(regressions)}.\n")
+
+
+if __name__ == "__main__":
+    main()
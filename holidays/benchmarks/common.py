@@ -0,0 +1,90 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import json
+import sys
+from collections.abc import Iterable
+from typing import Any, NamedTuple, Optional
+
+from holidays.registry import COUNTRIES, FINANCIAL
+
+# Predefined entity sets: country codes with many holidays sharing the same calculation.
+PRESETS = {
+    # Easter based holidays heavy countries.
+    "christian": ("AT", "BE", "CH", "DE", "DK", "ES", "FR", "IT", "NL", "NO", "PL", "PT", "SE"),
+    # Hindu calendar (Deepavali, Thaipusam) countries.
+    "hindu": ("MY", "SG"),
+    # Observed (substituted) holidays heavy countries.
+    "observed": ("AU", "GB", "KR", "NZ", "US"),
+}
+
+
+class Entity(NamedTuple):
+    """A benchmarked holidays entity."""
+
+    code: str
+    """The entity ISO code (e.g., US or NYSE)."""
+    kind: str
+    """The entity kind: `country` or `financial`."""
+    module_name: str
+    """The entity module name (e.g., holidays.countries.united_states)."""
+    class_name: str
+    """The entity class name (e.g., UnitedStates)."""
+
+
+def get_entities(
+    countries: Optional[Iterable[str]] = None, markets: Optional[Iterable[str]] = None
+) -> list[Entity]:
+    """Return the entities to benchmark.
+
+    All supported countries and markets are returned if neither country nor
+    market codes are specified.
+
+    :param countries:
+        The country codes to benchmark.
+
+    :param markets:
+        The market codes to benchmark.
+
+    :return:
+        A list of :class:`Entity` objects sorted by entity kind and code.
+    """
+    countries = set(countries or ())
+    markets = set(markets or ())
+    select_all = not countries and not markets
+
+    entities = []
+    for kind, package, registry, codes in (
+        ("country", "countries", COUNTRIES, countries),
+        ("financial", "financial", FINANCIAL, markets),
+    ):
+        for module, (class_name, code, *aliases) in registry.items():
+            requested_codes = codes.intersection((code, *aliases))
+            if select_all or requested_codes:
+                entities.append(Entity(code, kind, f"holidays.{package}.{module}", class_name))
+                codes.difference_update(requested_codes)
+
+        if codes:
+            raise ValueError(f"Entity is not supported: {', '.join(sorted(codes))}.")
+
+    return sorted(entities, key=lambda entity: (entity.kind, entity.code))
+
+
+def write_report(report: dict[str, Any], output: Optional[str] = None) -> None:
+    """Write a benchmark report as JSON to a file or stdout."""
+    content = json.dumps(report, indent=2)
+    if output:
+        with open(output, "w", encoding="UTF-8") as file:
+            file.write(content)
+            file.write("\n")
+    else:
+        sys.stdout.write(f"{content}\n")
@@ -0,0 +1,177 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import importlib
+import json
+import platform
+from collections.abc import Iterable, Iterator
+from time import perf_counter
+from typing import Any, NamedTuple, Optional
+
+from holidays.benchmarks.common import Entity
+from holidays.holiday_base import HolidayBase
+from holidays.snapshots import SNAPSHOT_LANGUAGE, SNAPSHOT_YEARS, get_snapshot_cases
+from holidays.version import __version__
+
+DEFAULT_YEARS = SNAPSHOT_YEARS
+"""The default benchmark years range (the snapshots one)."""
+
+
+class PopulateCase(NamedTuple):
+    """A populate benchmark case: an entity holidays for a subdivision in a
+    single category."""
+
+    name: str
+    """The case name: the snapshot file name and the category (e.g.,
+    ``countries/US_CA/public``)."""
+    entity_cls: type[HolidayBase]
+    """The entity class."""
+    subdiv: Optional[str]
+    """The subdivision code, None for the entity common holidays."""
+    category: str
+    """The holidays category."""
+
+    def get_holidays(self) -> HolidayBase:
+        """Return the case holidays object with no years populated."""
+        return self.entity_cls(
+            subdiv=self.subdiv, categories=self.category, language=SNAPSHOT_LANGUAGE
+        )
+
+
+def get_populate_cases(entities: Iterable[Entity]) -> Iterator[PopulateCase]:
+    """Enumerate the entities snapshot files (see
+    :func:`holidays.snapshots.get_snapshot_cases`) categories.
+
+    :param entities:
+        The entities to enumerate.
+
+    :return:
+        An iterator of :class:`PopulateCase` objects, one per snapshot file
+        and supported category.
+    """
+    for entity in entities:
+        entity_cls = getattr(importlib.import_module(entity.module_name), entity.class_name)
+        for snapshot_case in get_snapshot_cases(entity_cls):
+            for category in entity_cls.supported_categories:
+                yield PopulateCase(
+                    f"{snapshot_case.name}/{category}", entity_cls, snapshot_case.subdiv, category
+                )
+
+
+def measure_populate_throughput(
+    case: PopulateCase, years: range = DEFAULT_YEARS, repeat: int = 1
+) -> float:
+    """Return the best populate throughput (in years per second).
+
+    Only the ``_populate`` calls are timed: the entity object is constructed
+    beforehand with no years, so neither ``__init__`` nor the date keys
+    transformation is included.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        holidays = case.get_holidays()
+        start = perf_counter()
+        for year in years:
+            holidays._populate(year)
+        best = min(best, perf_counter() - start)
+
+    return len(years) / best
+
+
+def compare_populate_results(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> dict[str, dict[str, float]]:
+    """Compare populate throughput against a baseline.
+
+    :param results:
+        The current throughput results.
+
+    :param baseline:
+        The baseline throughput results.
+
+    :param threshold:
+        The maximum allowed relative throughput decrease (e.g., 0.25 for 25%).
+
+    :return:
+        The cases whose throughput decreased past the threshold.
+    """
+    regressions = {}
+    for key in sorted(results.keys() & baseline.keys()):
+        change = results[key] / baseline[key] - 1
+        if change < -threshold:
+            regressions[key] = {
+                "baseline": baseline[key],
+                "current": results[key],
+                "change": change,
+            }
+
+    return regressions
+
+
+def run_populate_benchmark(
+    entities: Iterable[Entity],
+    years: range = DEFAULT_YEARS,
+    repeat: int = 1,
+    top: int = 10,
+    baseline: Optional[str] = None,
+    threshold: float = 0.25,
+) -> dict[str, Any]:
+    """Run the populate throughput benchmark.
+
+    Measures `_populate` throughput (years per second) for each entity
+    snapshot file (the entity common holidays and each subdivision holidays)
+    and each supported category separately.
+
+    :param entities:
+        The entities to benchmark.
+
+    :param years:
+        The years to populate.
+
+    :param repeat:
+        The number of measurements per case; the best one is reported.
+
+    :param top:
+        The number of the slowest cases to flag.
+
+    :param baseline:
+        The path of a previously saved report to compare the results against.
+
+    :param threshold:
+        The maximum allowed relative throughput decrease against the baseline.
+
+    :return:
+        The JSON serializable benchmark report.
+    """
+    results = {
+        case.name: measure_populate_throughput(case, years, repeat)
+        for case in get_populate_cases(entities)
+    }
+
+    report: dict[str, Any] = {
+        "benchmark": "populate",
+        "holidays": __version__,
+        "python": platform.python_version(),
+        "years": [years[0], years[-1]],
+        "repeat": repeat,
+        "results": results,
+        "slowest": sorted(results, key=results.__getitem__)[:top],
+    }
+
+    if baseline:
+        with open(baseline, encoding="UTF-8") as file:
+            baseline_results = json.load(file)["results"]
+        report["baseline"] = baseline
+        report["threshold"] = threshold
+        report["regressions"] = compare_populate_results(results, baseline_results, threshold)
+
+    return report
@@ -0,0 +1,140 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+
+import importlib
+import platform
+from collections.abc import Iterable
+from datetime import date
+from time import perf_counter
+from typing import Any, Callable
+
+from holidays.benchmarks.common import Entity
+from holidays.benchmarks.populate import DEFAULT_YEARS
+from holidays.calendars.gregorian import _timedelta
+from holidays.sessions import TradingSessions
+from holidays.version import __version__
+
+SESSION_OFFSET = 20
+"""The number of sessions to offset the dates by."""
+SESSIONS_RANGE_DAYS = 90
+"""The sessions range length (in days)."""
+
+
+def _measure_query(query: Callable[[date], Any], dts: list[date], repeat: int) -> float:
+    """Return the best average query time (in seconds)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        for dt in dts:
+            query(dt)
+        best = min(best, (perf_counter() - start) / len(dts))
+
+    return best
+
+
+def measure_sessions(
+    entity: Entity, years: range = DEFAULT_YEARS, repeat: int = 1
+) -> dict[str, Any]:
+    """Measure the trading sessions engine against naive working days iteration.
+
+    :param entity:
+        The entity to measure.
+
+    :param years:
+        The years to precompute the sessions for; the queried dates are the
+        1st and the 15th day of each month of the years.
+
+    :param repeat:
+        The number of measurements per query; the best one is reported.
+
+    :return:
+        A dict of the sessions precomputation time and the per query average
+        times (in seconds) of the sessions engine, the naive working days
+        iteration and the speedup ratio.
+    """
+    cls = getattr(importlib.import_module(entity.module_name), entity.class_name)
+    instance = cls(years=years)
+
+    start = perf_counter()
+    sessions = TradingSessions(instance, years)
+    build = perf_counter() - start
+
+    def get_working_days(dt: date) -> list[date]:
+        dts = (_timedelta(dt, days) for days in range(SESSIONS_RANGE_DAYS + 1))
+        return [dt for dt in dts if instance.is_working_day(dt)]
+
+    queries: dict[str, tuple[Callable[[date], Any], Callable[[date], Any]]] = {
+        "is_session": (sessions.is_session, instance.is_working_day),
+        "next_session": (
+            sessions.next_session,
+            lambda dt: instance.get_nth_working_day(dt, +1),
+        ),
+        "previous_session": (
+            sessions.previous_session,
+            lambda dt: instance.get_nth_working_day(dt, -1),
+        ),
+        "session_offset": (
+            lambda dt: sessions.session_offset(dt, SESSION_OFFSET),
+            lambda dt: instance.get_nth_working_day(dt, SESSION_OFFSET),
+        ),
+        "sessions_in_range": (
+            lambda dt: sessions.sessions_in_range(dt, _timedelta(dt, SESSIONS_RANGE_DAYS)),
+            get_working_days,
+        ),
+    }
+    dts = [date(year, month, day) for year in years for month in range(1, 13) for day in (1, 15)]
+
+    results: dict[str, dict[str, float]] = {}
+    for name, (sessions_query, naive_query) in queries.items():
+        sessions_time = _measure_query(sessions_query, dts, repeat)
+        naive_time = _measure_query(naive_query, dts, repeat)
+        results[name] = {
+            "sessions": sessions_time,
+            "naive": naive_time,
+            "speedup": naive_time / sessions_time,
+        }
+
+    return {"build": build, "queries": results}
+
+
+def run_sessions_benchmark(
+    entities: Iterable[Entity], years: range = DEFAULT_YEARS, repeat: int = 1
+) -> dict[str, Any]:
+    """Run the trading sessions benchmark.
+
+    Compares :class:`holidays.sessions.TradingSessions` queries against the
+    equivalent :meth:`HolidayBase.is_working_day` based iteration.
+
+    :param entities:
+        The entities to benchmark.
+
+    :param years:
+        The years to query.
+
+    :param repeat:
+        The number of measurements per query; the best one is reported.
+
+    :return:
+        The JSON serializable benchmark report.
+    """
+    return {
+        "benchmark": "sessions",
+        "holidays": __version__,
+        "python": platform.python_version(),
+        "years": [years[0], years[-1]],
+        "repeat": repeat,
+        "entities": {
+            entity.code: {"kind": entity.kind, **measure_sessions(entity, years, repeat)}
+            for entity in entities
+        },
+    }
@@ -0,0 +1,172 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import importlib
+import json
+import platform
+import re
+import subprocess  # nosec B404
+import sys
+from collections.abc import Iterable
+from datetime import date
+from time import perf_counter
+from typing import Any, Optional
+
+from holidays.benchmarks.common import Entity
+from holidays.calendars.gregorian import JAN
+from holidays.version import __version__
+
+LOOKUP_ROUNDS = 10
+"""The number of warm lookup rounds over all dates of the year."""
+
+
+def measure_package_import() -> float:
+    """Return the ``import holidays`` time (in seconds) of a new interpreter."""
+    stderr = subprocess.run(  # nosec B603
+        (sys.executable, "-X", "importtime", "-c", "import holidays"),
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+
+    if not (match := re.search(r"\|\s*(\d+) \| holidays$", stderr, re.MULTILINE)):
+        raise RuntimeError("Unable to measure `import holidays` time.")
+
+    return int(match.group(1)) / 1_000_000
+
+
+def measure_entity_startup(entity: Entity, year: int) -> dict[str, float]:
+    """Measure entity startup phases (in seconds) in the current interpreter.
+
+    The module import time is only meaningful if the entity module (and the
+    modules it depends on) hasn't been imported by the interpreter yet.
+
+    :param entity:
+        The entity to measure.
+
+    :param year:
+        The year of the first query.
+
+    :return:
+        A dict of the module import, class construction, first year populate
+        times, the average warm lookup time and the first query total time.
+    """
+    start = perf_counter()
+    cls = getattr(importlib.import_module(entity.module_name), entity.class_name)
+    imported = perf_counter()
+    instance = cls()
+    constructed = perf_counter()
+    date(year, JAN, 1) in instance
+    populated = perf_counter()
+
+    start_ordinal = date(year, JAN, 1).toordinal()
+    dts = [date.fromordinal(ordinal) for ordinal in range(start_ordinal, start_ordinal + 365)]
+    lookup = float("inf")
+    for _ in range(LOOKUP_ROUNDS):
+        lookup_start = perf_counter()
+        for dt in dts:
+            dt in instance
+        lookup = min(lookup, (perf_counter() - lookup_start) / len(dts))
+
+    return {
+        "module_import": imported - start,
+        "construction": constructed - imported,
+        "populate": populated - constructed,
+        "lookup": lookup,
+        "first_query": populated - start,
+    }
+
+
+def measure_entity_startup_isolated(entity: Entity, year: int) -> dict[str, float]:
+    """Measure entity startup phases (in seconds) in a new interpreter."""
+    stdout = subprocess.run(  # nosec B603
+        (
+            sys.executable,
+            "-m",
+            "holidays.benchmarks",
+            "startup",
+            "--in-process",
+            "--repeat",
+            "1",
+            "--year",
+            str(year),
+            "--country" if entity.kind == "country" else "--market",
+            entity.code,
+        ),
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    metrics = json.loads(stdout)["entities"][entity.code]
+    del metrics["kind"]
+
+    return metrics
+
+
+def run_startup_benchmark(
+    entities: Iterable[Entity],
+    year: int,
+    repeat: int = 1,
+    top: int = 10,
+    in_process: bool = False,
+) -> dict[str, Any]:
+    """Run the startup and first query latency benchmark.
+
+    Measures the time from the entity module import to the first answered
+    ``date in country_holidays(X)`` query broken down by phases. Each entity
+    is measured in a new interpreter by default so that its module import time
+    includes all the calendars and groups it pulls in.
+
+    :param entities:
+        The entities to benchmark.
+
+    :param year:
+        The year of the first query.
+
+    :param repeat:
+        The number of measurements per entity; the best one is reported. Only
+        the first in-process measurement includes the module import time.
+
+    :param top:
+        The number of the slowest (by the first query time) entities to flag.
+
+    :param in_process:
+        Whether to measure all entities in the current interpreter instead of
+        a new interpreter per entity.
+
+    :return:
+        The JSON serializable benchmark report.
+    """
+    measure = measure_entity_startup if in_process else measure_entity_startup_isolated
+
+    results: dict[str, dict[str, Any]] = {}
+    for entity in entities:
+        samples = [measure(entity, year) for _ in range(repeat)]
+        results[entity.code] = {"kind": entity.kind}
+        results[entity.code].update(
+            {metric: min(sample[metric] for sample in samples) for metric in samples[0]}
+        )
+
+    package_import: Optional[float] = None if in_process else measure_package_import()
+
+    return {
+        "benchmark": "startup",
+        "holidays": __version__,
+        "python": platform.python_version(),
+        "year": year,
+        "repeat": repeat,
+        "package_import": package_import,
+        "entities": results,
+        "slowest": sorted(results, key=lambda code: results[code]["first_query"], reverse=True)[
+            :top
+        ],
+    }
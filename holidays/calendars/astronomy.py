@@ -0,0 +1,556 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Low precision astronomical algorithms used by the lunar calendars.
+
+Based on Jean Meeus, "Astronomical Algorithms", 2nd edition (1998). Times are
+Julian Days: JDE for the Terrestrial Time scale and JD for the Universal Time.
+"""
+
+from math import asin, atan2, cos, degrees, floor, radians, sin, tan
+
+# Julian Day of the Gregorian proleptic calendar ordinal 0 midnight.
+JD_ORDINAL_OFFSET = 1721424.5
+# Julian Day of J2000.0 epoch.
+J2000 = 2451545.0
+
+# Mean synodic month and tropical year length (days).
+SYNODIC_MONTH = 29.530588861
+TROPICAL_YEAR = 365.242189
+# JD (UT) of the mean new moon of 2000 January 6.
+NEW_MOON_EPOCH = 2451550.09766
+
+# Apparent altitude of the Sun's upper limb at sunrise/sunset.
+SUN_HORIZON_ALTITUDE = -0.8333
+
+# fmt: off
+# Periodic terms of the Earth heliocentric longitude (truncated VSOP87, Meeus table 32.A):
+# amplitude (1e-8 rad), phase (rad) and frequency (rad per Julian millennium) by power of time.
+EARTH_LONGITUDE_TERMS = (
+    (
+        (175347046, 0, 0), (3341656, 4.6692568, 6283.07585), (34894, 4.6261, 12566.1517),
+        (3497, 2.7441, 5753.3849), (3418, 2.8289, 3.5231), (3136, 3.6277, 77713.7715),
+        (2676, 4.4181, 7860.4194), (2343, 6.1352, 3930.2097), (1324, 0.7425, 11506.7698),
+        (1273, 2.0371, 529.691), (1199, 1.1096, 1577.3435), (990, 5.233, 5884.927),
+        (902, 2.045, 26.298), (857, 3.508, 398.149), (780, 1.179, 5223.694),
+        (753, 2.533, 5507.553), (505, 4.583, 18849.228), (492, 4.205, 775.523),
+        (357, 2.92, 0.067), (317, 5.849, 11790.629), (284, 1.899, 796.298),
+        (271, 0.315, 10977.079), (243, 0.345, 5486.778), (206, 4.806, 2544.314),
+        (205, 1.869, 5573.143), (202, 2.458, 6069.777), (156, 0.833, 213.299),
+        (132, 3.411, 2942.463), (126, 1.083, 20.775), (115, 0.645, 0.98),
+        (103, 0.636, 4694.003), (102, 0.976, 15720.839), (102, 4.267, 7.114),
+        (99, 6.21, 2146.17), (98, 0.68, 155.42), (86, 5.98, 161000.69),
+        (85, 1.3, 6275.96), (85, 3.67, 71430.7), (80, 1.81, 17260.15),
+        (79, 3.04, 12036.46), (75, 1.76, 5088.63), (74, 3.5, 3154.69),
+        (74, 4.68, 801.82), (70, 0.83, 9437.76), (62, 3.98, 8827.39),
+        (61, 1.82, 7084.9), (57, 2.78, 6286.6), (56, 4.39, 14143.5),
+        (56, 3.47, 6279.55), (52, 0.19, 12139.55), (52, 1.33, 1748.02),
+        (51, 0.28, 5856.48), (49, 0.49, 1194.45), (41, 5.37, 8429.24),
+        (41, 2.4, 19651.05), (39, 6.17, 10447.39), (37, 6.04, 10213.29),
+        (37, 2.57, 1059.38), (36, 1.71, 2352.87), (36, 1.78, 6812.77),
+        (33, 0.59, 17789.85), (30, 0.44, 83996.85), (30, 2.74, 1349.87),
+        (25, 3.16, 4690.48),
+    ),
+    (
+        (628331966747, 0, 0), (206059, 2.678235, 6283.07585), (4303, 2.6351, 12566.1517),
+        (425, 1.59, 3.523), (119, 5.796, 26.298), (109, 2.966, 1577.344),
+        (93, 2.59, 18849.23), (72, 1.14, 529.69), (68, 1.87, 398.15),
+        (67, 4.41, 5507.55), (59, 2.89, 5223.69), (56, 2.17, 155.42),
+        (45, 0.4, 796.3), (36, 0.47, 775.52), (29, 2.65, 7.11),
+        (21, 5.34, 0.98), (19, 1.85, 5486.78), (19, 4.97, 213.3),
+        (17, 2.99, 6275.96), (16, 0.03, 2544.31), (16, 1.43, 2146.17),
+        (15, 1.21, 10977.08), (12, 2.83, 1748.02), (12, 3.26, 5088.63),
+        (12, 5.27, 1194.45), (12, 2.08, 4694.0), (11, 0.77, 553.57),
+        (10, 1.3, 6286.6), (10, 4.24, 1349.87), (9, 2.7, 242.73),
+        (9, 5.64, 951.72), (8, 5.3, 2352.87), (6, 2.65, 9437.76),
+        (6, 4.67, 4690.48),
+    ),
+    (
+        (52919, 0, 0), (8720, 1.0721, 6283.0758), (309, 0.867, 12566.152),
+        (27, 0.05, 3.52), (16, 5.19, 26.3), (16, 3.68, 155.42),
+        (10, 0.76, 18849.23), (9, 2.06, 77713.77), (7, 0.83, 775.52),
+        (5, 4.66, 1577.34), (4, 1.03, 7.11), (4, 3.44, 5573.14),
+        (3, 5.14, 796.3), (3, 6.05, 5507.55), (3, 1.19, 242.73),
+        (3, 6.12, 529.69), (3, 0.31, 398.15), (3, 2.28, 553.57),
+        (2, 4.38, 5223.69), (2, 3.75, 0.98),
+    ),
+    (
+        (289, 5.844, 6283.076), (35, 0, 0), (17, 5.49, 12566.15),
+        (3, 5.2, 155.42), (1, 4.72, 3.52), (1, 5.3, 18849.23),
+        (1, 5.97, 242.73),
+    ),
+    ((114, 3.142, 0), (8, 4.13, 6283.08), (1, 3.84, 12566.15)),
+    ((1, 3.14, 0),),
+)
+# Periodic terms of the Moon longitude and distance (Meeus table 47.A):
+# multiples of D, M, M', F, longitude (1e-6 deg) and distance (1e-3 km) coefficients.
+MOON_LONGITUDE_DISTANCE_TERMS = (
+    (0, 0, 1, 0, 6288774, -20905355),
+    (2, 0, -1, 0, 1274027, -3699111),
+    (2, 0, 0, 0, 658314, -2955968),
+    (0, 0, 2, 0, 213618, -569925),
+    (0, 1, 0, 0, -185116, 48888),
+    (0, 0, 0, 2, -114332, -3149),
+    (2, 0, -2, 0, 58793, 246158),
+    (2, -1, -1, 0, 57066, -152138),
+    (2, 0, 1, 0, 53322, -170733),
+    (2, -1, 0, 0, 45758, -204586),
+    (0, 1, -1, 0, -40923, -129620),
+    (1, 0, 0, 0, -34720, 108743),
+    (0, 1, 1, 0, -30383, 104755),
+    (2, 0, 0, -2, 15327, 10321),
+    (0, 0, 1, 2, -12528, 0),
+    (0, 0, 1, -2, 10980, 79661),
+    (4, 0, -1, 0, 10675, -34782),
+    (0, 0, 3, 0, 10034, -23210),
+    (4, 0, -2, 0, 8548, -21636),
+    (2, 1, -1, 0, -7888, 24208),
+    (2, 1, 0, 0, -6766, 30824),
+    (1, 0, -1, 0, -5163, -8379),
+    (1, 1, 0, 0, 4987, -16675),
+    (2, -1, 1, 0, 4036, -12831),
+    (2, 0, 2, 0, 3994, -10445),
+    (4, 0, 0, 0, 3861, -11650),
+    (2, 0, -3, 0, 3665, 14403),
+    (0, 1, -2, 0, -2689, -7003),
+    (2, 0, -1, 2, -2602, 0),
+    (2, -1, -2, 0, 2390, 10056),
+    (1, 0, 1, 0, -2348, 6322),
+    (2, -2, 0, 0, 2236, -9884),
+    (0, 1, 2, 0, -2120, 5751),
+    (0, 2, 0, 0, -2069, 0),
+    (2, -2, -1, 0, 2048, -4950),
+    (2, 0, 1, -2, -1773, 4130),
+    (2, 0, 0, 2, -1595, 0),
+    (4, -1, -1, 0, 1215, -3958),
+    (0, 0, 2, 2, -1110, 0),
+    (3, 0, -1, 0, -892, 3258),
+    (2, 1, 1, 0, -810, 2616),
+    (4, -1, -2, 0, 759, -1897),
+    (0, 2, -1, 0, -713, -2117),
+    (2, 2, -1, 0, -700, 2354),
+    (2, 1, -2, 0, 691, 0),
+    (2, -1, 0, -2, 596, 0),
+    (4, 0, 1, 0, 549, -1423),
+    (0, 0, 4, 0, 537, -1117),
+    (4, -1, 0, 0, 520, -1571),
+    (1, 0, -2, 0, -487, -1739),
+    (2, 1, 0, -2, -399, 0),
+    (0, 0, 2, -2, -381, -4421),
+    (1, 1, 1, 0, 351, 0),
+    (3, 0, -2, 0, -340, 0),
+    (4, 0, -3, 0, 330, 0),
+    (2, -1, 2, 0, 327, 0),
+    (0, 2, 1, 0, -323, 1165),
+    (1, 1, -1, 0, 299, 0),
+    (2, 0, 3, 0, 294, 0),
+    (2, 0, -1, -2, 0, 8752),
+)
+
+# Periodic terms of the Moon latitude (Meeus table 47.B):
+# multiples of D, M, M', F and latitude (1e-6 deg) coefficient.
+MOON_LATITUDE_TERMS = (
+    (0, 0, 0, 1, 5128122),
+    (0, 0, 1, 1, 280602),
+    (0, 0, 1, -1, 277693),
+    (2, 0, 0, -1, 173237),
+    (2, 0, -1, 1, 55413),
+    (2, 0, -1, -1, 46271),
+    (2, 0, 0, 1, 32573),
+    (0, 0, 2, 1, 17198),
+    (2, 0, 1, -1, 9266),
+    (0, 0, 2, -1, 8822),
+    (2, -1, 0, -1, 8216),
+    (2, 0, -2, -1, 4324),
+    (2, 0, 1, 1, 4200),
+    (2, 1, 0, -1, -3359),
+    (2, -1, -1, 1, 2463),
+    (2, -1, 0, 1, 2211),
+    (2, -1, -1, -1, 2065),
+    (0, 1, -1, -1, -1870),
+    (4, 0, -1, -1, 1828),
+    (0, 1, 0, 1, -1794),
+    (0, 0, 0, 3, -1749),
+    (0, 1, -1, 1, -1565),
+    (1, 0, 0, 1, -1491),
+    (0, 1, 1, 1, -1475),
+    (0, 1, 1, -1, -1410),
+    (0, 1, 0, -1, -1344),
+    (1, 0, 0, -1, -1335),
+    (0, 0, 3, 1, 1107),
+    (4, 0, 0, -1, 1021),
+    (4, 0, -1, 1, 833),
+)
+
+# Periodic terms of the true new moon (Meeus chapter 49): coefficient,
+# power of the Earth's orbit eccentricity factor and multiples of M, M', F, Omega.
+NEW_MOON_TERMS = (
+    (-0.40720, 0, 0, 1, 0, 0),
+    (0.17241, 1, 1, 0, 0, 0),
+    (0.01608, 0, 0, 2, 0, 0),
+    (0.01039, 0, 0, 0, 2, 0),
+    (0.00739, 1, -1, 1, 0, 0),
+    (-0.00514, 1, 1, 1, 0, 0),
+    (0.00208, 2, 2, 0, 0, 0),
+    (-0.00111, 0, 0, 1, -2, 0),
+    (-0.00057, 0, 0, 1, 2, 0),
+    (0.00056, 1, 1, 2, 0, 0),
+    (-0.00042, 0, 0, 3, 0, 0),
+    (0.00042, 1, 1, 0, 2, 0),
+    (0.00038, 1, 1, 0, -2, 0),
+    (-0.00024, 1, -1, 2, 0, 0),
+    (-0.00017, 0, 0, 0, 0, 1),
+    (-0.00007, 0, 2, 1, 0, 0),
+    (0.00004, 0, 0, 2, -2, 0),
+    (0.00004, 0, 3, 0, 0, 0),
+    (0.00003, 0, 1, 1, -2, 0),
+    (0.00003, 0, 0, 2, 2, 0),
+    (-0.00003, 0, 1, 1, 2, 0),
+    (0.00003, 0, -1, 1, 2, 0),
+    (-0.00002, 0, -1, 1, -2, 0),
+    (-0.00002, 0, 1, 3, 0, 0),
+    (0.00002, 0, 0, 4, 0, 0),
+)
+
+# Planetary arguments of the true new moon (Meeus chapter 49):
+# coefficient (1e-6 day), constant and k multiple of the argument (deg).
+NEW_MOON_PLANETARY_TERMS = (
+    (325, 299.77, 0.107408),
+    (165, 251.88, 0.016321),
+    (164, 251.83, 26.651886),
+    (126, 349.42, 36.412478),
+    (110, 84.66, 18.206239),
+    (62, 141.74, 53.303771),
+    (60, 207.14, 2.453732),
+    (56, 154.84, 7.306860),
+    (47, 34.52, 27.261239),
+    (42, 207.19, 0.121824),
+    (40, 291.34, 1.844379),
+    (37, 161.72, 24.198154),
+    (35, 239.56, 25.513099),
+    (23, 331.55, 3.592518),
+)
+# fmt: on
+
+
+def _ordinal_to_jd(ordinal: float) -> float:
+    """Return Julian Day of the Gregorian proleptic calendar ordinal (0h UT)."""
+    return ordinal + JD_ORDINAL_OFFSET
+
+
+def _jd_to_ordinal(jd: float, utc_offset: float = 0.0) -> int:
+    """Return Gregorian proleptic calendar ordinal of the Julian Day local date."""
+    return floor(jd - JD_ORDINAL_OFFSET + utc_offset / 24)
+
+
+def _delta_t(jd: float) -> float:
+    """Return TT - UT difference in days (Espenak and Meeus polynomials)."""
+    y = 2000 + (jd - J2000) / 365.25
+    if y < 1600 or y >= 2150:
+        u = (y - 1820) / 100
+        seconds = -20 + 32 * u * u
+    elif y < 1700:
+        t = y - 1600
+        seconds = 120 - 0.9808 * t - 0.01532 * t**2 + t**3 / 7129
+    elif y < 1800:
+        t = y - 1700
+        seconds = 8.83 + 0.1603 * t - 0.0059285 * t**2 + 0.00013336 * t**3 - t**4 / 1174000
+    elif y < 1860:
+        t = y - 1800
+        seconds = (
+            13.72
+            - 0.332447 * t
+            + 0.0068612 * t**2
+            + 0.0041116 * t**3
+            - 0.00037436 * t**4
+            + 0.0000121272 * t**5
+            - 0.0000001699 * t**6
+            + 0.000000000875 * t**7
+        )
+    elif y < 1900:
+        t = y - 1860
+        seconds = (
+            7.62
+            + 0.5737 * t
+            - 0.251754 * t**2
+            + 0.01680668 * t**3
+            - 0.0004473624 * t**4
+            + t**5 / 233174
+        )
+    elif y < 1920:
+        t = y - 1900
+        seconds = -2.79 + 1.494119 * t - 0.0598939 * t**2 + 0.0061966 * t**3 - 0.000197 * t**4
+    elif y < 1941:
+        t = y - 1920
+        seconds = 21.20 + 0.84493 * t - 0.076100 * t**2 + 0.0020936 * t**3
+    elif y < 1961:
+        t = y - 1950
+        seconds = 29.07 + 0.407 * t - t**2 / 233 + t**3 / 2547
+    elif y < 1986:
+        t = y - 1975
+        seconds = 45.45 + 1.067 * t - t**2 / 260 - t**3 / 718
+    elif y < 2005:
+        t = y - 2000
+        seconds = (
+            63.86
+            + 0.3345 * t
+            - 0.060374 * t**2
+            + 0.0017275 * t**3
+            + 0.000651814 * t**4
+            + 0.00002373599 * t**5
+        )
+    elif y < 2050:
+        t = y - 2000
+        seconds = 62.92 + 0.32217 * t + 0.005589 * t**2
+    else:
+        seconds = -20 + 32 * ((y - 1820) / 100) ** 2 - 0.5628 * (2150 - y)
+
+    return seconds / 86400
+
+
+def _new_moon(k: int) -> float:
+    """Return JD (UT) of the k-th new moon since 2000 January 6."""
+    t = k / 1236.85
+    jde = (
+        NEW_MOON_EPOCH
+        + SYNODIC_MONTH * k
+        + 0.00015437 * t**2
+        - 0.000000150 * t**3
+        + 0.00000000073 * t**4
+    )
+    e = 1 - 0.002516 * t - 0.0000074 * t**2
+    m = radians(2.5534 + 29.10535670 * k - 0.0000014 * t**2 - 0.00000011 * t**3)
+    m_moon = radians(
+        201.5643 + 385.81693528 * k + 0.0107582 * t**2 + 0.00001238 * t**3 - 0.000000058 * t**4
+    )
+    f = radians(
+        160.7108 + 390.67050284 * k - 0.0016118 * t**2 - 0.00000227 * t**3 + 0.000000011 * t**4
+    )
+    omega = radians(124.7746 - 1.56375588 * k + 0.0020672 * t**2 + 0.00000215 * t**3)
+
+    for coefficient, e_power, m_mult, m_moon_mult, f_mult, omega_mult in NEW_MOON_TERMS:
+        jde += (
+            coefficient
+            * e**e_power
+            * sin(m_mult * m + m_moon_mult * m_moon + f_mult * f + omega_mult * omega)
+        )
+    # The first planetary argument has an additional secular term.
+    jde -= 0.000325 * sin(radians(299.77 + 0.107408 * k))
+    jde += 0.000325 * sin(radians(299.77 + 0.107408 * k - 0.009173 * t**2))
+    for coefficient, constant, k_mult in NEW_MOON_PLANETARY_TERMS:
+        jde += 0.000001 * coefficient * sin(radians(constant + k_mult * k))
+
+    return jde - _delta_t(jde)
+
+
+def _new_moon_number(jd: float) -> int:
+    """Return the number of the last new moon before or at JD (UT)."""
+    k = floor((jd - NEW_MOON_EPOCH) / SYNODIC_MONTH)
+    while _new_moon(k) > jd:
+        k -= 1
+    while _new_moon(k + 1) <= jd:
+        k += 1
+
+    return k
+
+
+def _nutation(t: float) -> tuple[float, float]:
+    """Return nutation in longitude and obliquity of the ecliptic (deg)."""
+    omega = radians(125.04452 - 1934.136261 * t)
+    l_sun = radians(280.4665 + 36000.7698 * t)
+    l_moon = radians(218.3165 + 481267.8813 * t)
+    nutation_longitude = (
+        -17.20 * sin(omega)
+        - 1.32 * sin(2 * l_sun)
+        - 0.23 * sin(2 * l_moon)
+        + 0.21 * sin(2 * omega)
+    ) / 3600
+    obliquity = (
+        23.43929111
+        - (46.8150 * t + 0.00059 * t**2 - 0.001813 * t**3) / 3600
+        + (
+            9.20 * cos(omega)
+            + 0.57 * cos(2 * l_sun)
+            + 0.10 * cos(2 * l_moon)
+            - 0.09 * cos(2 * omega)
+        )
+        / 3600
+    )
+
+    return nutation_longitude, obliquity
+
+
+def _sun_position(jd: float) -> tuple[float, float, float]:
+    """Return the Sun apparent longitude, right ascension and declination (deg)."""
+    t = (jd + _delta_t(jd) - J2000) / 36525
+    l0 = 280.46646 + 36000.76983 * t + 0.0003032 * t**2
+    m = radians(357.52911 + 35999.05029 * t - 0.0001537 * t**2)
+    center = (
+        (1.914602 - 0.004817 * t - 0.000014 * t**2) * sin(m)
+        + (0.019993 - 0.000101 * t) * sin(2 * m)
+        + 0.000289 * sin(3 * m)
+    )
+    nutation_longitude, obliquity = _nutation(t)
+    # Aberration correction.
+    longitude = (l0 + center - 0.00569 + nutation_longitude) % 360
+
+    return (longitude, *_ecliptic_to_equatorial(longitude, 0.0, obliquity))
+
+
+def _solar_term(jd: float, longitude: float) -> float:
+    """Return JD (UT) of the first moment after JD when the Sun apparent
+    longitude reaches the given longitude (deg)."""
+    jd += (longitude - _sun_longitude(jd)) % 360 * TROPICAL_YEAR / 360
+    for _ in range(4):
+        jd += ((longitude - _sun_longitude(jd) + 180) % 360 - 180) * TROPICAL_YEAR / 360
+
+    return jd
+
+
+def _sun_longitude(jd: float) -> float:
+    """Return the Sun apparent longitude (deg) with about 1 arcsecond accuracy."""
+    t = (jd + _delta_t(jd) - J2000) / 365250
+    earth_longitude = sum(
+        sum(amplitude * cos(phase + frequency * t) for amplitude, phase, frequency in terms)
+        * t**power
+        for power, terms in enumerate(EARTH_LONGITUDE_TERMS)
+    )
+    nutation_longitude, _ = _nutation(t * 10)
+    # FK5 frame, nutation and aberration corrections.
+    return (
+        degrees(earth_longitude / 1e8) + 180 + (nutation_longitude - (0.09033 + 20.4898) / 3600)
+    ) % 360
+
+
+def _moon_ecliptic_position(jd: float) -> tuple[float, float, float]:
+    """Return the Moon apparent longitude, latitude (deg) and distance (km)."""
+    t = (jd + _delta_t(jd) - J2000) / 36525
+    l_moon = 218.3164477 + 481267.88123421 * t - 0.0015786 * t**2 + t**3 / 538841
+    d = radians(297.8501921 + 445267.1114034 * t - 0.0018819 * t**2 + t**3 / 545868)
+    m = radians(357.5291092 + 35999.0502909 * t - 0.0001536 * t**2)
+    m_moon = radians(134.9633964 + 477198.8675055 * t + 0.0087414 * t**2 + t**3 / 69699)
+    f = radians(93.2720950 + 483202.0175233 * t - 0.0036539 * t**2 - t**3 / 3526000)
+    a1 = radians(119.75 + 131.849 * t)
+    a2 = radians(53.09 + 479264.290 * t)
+    a3 = radians(313.45 + 481266.484 * t)
+    e = 1 - 0.002516 * t - 0.0000074 * t**2
+
+    sum_l = 3958 * sin(a1) + 1962 * sin(radians(l_moon) - f) + 318 * sin(a2)
+    sum_r = 0.0
+    for d_mult, m_mult, m_moon_mult, f_mult, l_coeff, r_coeff in MOON_LONGITUDE_DISTANCE_TERMS:
+        arg = d_mult * d + m_mult * m + m_moon_mult * m_moon + f_mult * f
+        e_factor = e ** abs(m_mult)
+        sum_l += l_coeff * e_factor * sin(arg)
+        sum_r += r_coeff * e_factor * cos(arg)
+
+    sum_b = (
+        -2235 * sin(radians(l_moon))
+        + 382 * sin(a3)
+        + 175 * sin(a1 - f)
+        + 175 * sin(a1 + f)
+        + 127 * sin(radians(l_moon) - m_moon)
+        - 115 * sin(radians(l_moon) + m_moon)
+    )
+    for d_mult, m_mult, m_moon_mult, f_mult, b_coeff in MOON_LATITUDE_TERMS:
+        sum_b += (
+            b_coeff
+            * e ** abs(m_mult)
+            * sin(d_mult * d + m_mult * m + m_moon_mult * m_moon + f_mult * f)
+        )
+
+    nutation_longitude, _ = _nutation(t)
+    longitude = (l_moon + sum_l / 1000000 + nutation_longitude) % 360
+
+    return longitude, sum_b / 1000000, 385000.56 + sum_r / 1000
+
+
+def _moon_position(jd: float) -> tuple[float, float, float]:
+    """Return the Moon apparent right ascension, declination (deg) and distance (km)."""
+    longitude, latitude, distance = _moon_ecliptic_position(jd)
+    _, obliquity = _nutation((jd + _delta_t(jd) - J2000) / 36525)
+
+    return (*_ecliptic_to_equatorial(longitude, latitude, obliquity), distance)
+
+
+def _ecliptic_to_equatorial(
+    longitude: float, latitude: float, obliquity: float
+) -> tuple[float, float]:
+    """Return right ascension and declination (deg) of the ecliptic coordinates."""
+    longitude, latitude, obliquity = radians(longitude), radians(latitude), radians(obliquity)
+    right_ascension = atan2(
+        sin(longitude) * cos(obliquity) - tan(latitude) * sin(obliquity), cos(longitude)
+    )
+    declination = asin(
+        sin(latitude) * cos(obliquity) + cos(latitude) * sin(obliquity) * sin(longitude)
+    )
+
+    return degrees(right_ascension) % 360, degrees(declination)
+
+
+def _sidereal_time(jd: float) -> float:
+    """Return Greenwich mean sidereal time (deg)."""
+    t = (jd - J2000) / 36525
+    return (
+        280.46061837 + 360.98564736629 * (jd - J2000) + 0.000387933 * t**2 - t**3 / 38710000
+    ) % 360
+
+
+def _altitude(
+    jd: float, latitude: float, longitude: float, right_ascension: float, declination: float
+) -> float:
+    """Return geocentric altitude (deg) of the body as seen from the location."""
+    hour_angle = radians(_sidereal_time(jd) + longitude - right_ascension)
+    latitude, declination = radians(latitude), radians(declination)
+    return degrees(
+        asin(sin(latitude) * sin(declination) + cos(latitude) * cos(declination) * cos(hour_angle))
+    )
+
+
+def _sunrise(ordinal: int, latitude: float, longitude: float) -> float:
+    """Return JD (UT) of the sunrise of the location local date."""
+    return _sun_horizon_crossing(ordinal, latitude, longitude, is_sunrise=True)
+
+
+def _sunset(ordinal: int, latitude: float, longitude: float) -> float:
+    """Return JD (UT) of the sunset of the location local date."""
+    return _sun_horizon_crossing(ordinal, latitude, longitude, is_sunrise=False)
+
+
+def _sun_horizon_crossing(
+    ordinal: int, latitude: float, longitude: float, is_sunrise: bool
+) -> float:
+    # Start from 6h (sunrise) or 18h (sunset) local mean solar time.
+    jd = _ordinal_to_jd(ordinal) + (0.25 if is_sunrise else 0.75) - longitude / 360
+    for _ in range(3):
+        _, right_ascension, declination = _sun_position(jd)
+        cos_hour_angle = (
+            sin(radians(SUN_HORIZON_ALTITUDE)) - sin(radians(latitude)) * sin(radians(declination))
+        ) / (cos(radians(latitude)) * cos(radians(declination)))
+        hour_angle = degrees(_acos(cos_hour_angle)) * (-1 if is_sunrise else 1)
+        local_hour_angle = (_sidereal_time(jd) + longitude - right_ascension + 180) % 360 - 180
+        jd += (hour_angle - local_hour_angle) / 360.98564736629
+
+    return jd
+
+
+def _acos(value: float) -> float:
+    return atan2((1 - min(max(value, -1.0), 1.0) ** 2) ** 0.5, value)
+
+
+def _is_moon_set_after_sun(jd: float, latitude: float, longitude: float) -> bool:
+    """Return True if the Moon is above the horizon at JD (UT)."""
+    right_ascension, declination, distance = _moon_position(jd)
+    parallax = degrees(asin(6378.14 / distance))
+    return (
+        _altitude(jd, latitude, longitude, right_ascension, declination)
+        > 0.7275 * parallax - 0.5667
+    )
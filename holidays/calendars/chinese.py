@@ -10,11 +10,12 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date
+from datetime import MAXYEAR, MINYEAR, date
 from typing import Optional
 
 from holidays.calendars.custom import _CustomCalendar
 from holidays.calendars.gregorian import JAN, FEB, MAR, APR, MAY, JUN, SEP, OCT, NOV
+from holidays.calendars.lunisolar import _lunar_to_gregorian
 
 BUDDHA_BIRTHDAY = "BUDDHA_BIRTHDAY"
 DOUBLE_NINTH = "DOUBLE_NINTH"
@@ -23,6 +24,19 @@ HUNG_KINGS = "HUNG_KINGS"
 LUNAR_NEW_YEAR = "LUNAR_NEW_YEAR"
 MID_AUTUMN = "MID_AUTUMN"
 
+# Chinese lunar (month, day) of the holidays.
+_LUNAR_HOLIDAYS = {
+    BUDDHA_BIRTHDAY: (4, 8),
+    DOUBLE_NINTH: (9, 9),
+    DRAGON_BOAT: (5, 5),
+    HUNG_KINGS: (3, 10),
+    LUNAR_NEW_YEAR: (1, 1),
+    MID_AUTUMN: (8, 15),
+}
+# The holiday dates tables range, later and earlier dates are calculated astronomically.
+_TABLE_START_YEAR = 1901
+_TABLE_END_YEAR = 2099
+
 
 class _ChineseLunisolar:
     BUDDHA_BIRTHDAY_DATES = {
@@ -1241,7 +1255,13 @@ class _ChineseLunisolar:
         estimated_dates = getattr(self, f"{holiday}_DATES", {})
         exact_dates = getattr(self, f"{holiday}_DATES_{_CustomCalendar.CUSTOM_ATTR_POSTFIX}", {})
         dt = exact_dates.get(year, estimated_dates.get(year, ()))
-        return date(year, *dt) if dt else None, year not in exact_dates
+        if dt:
+            return date(year, *dt), year not in exact_dates
+
+        if _TABLE_START_YEAR <= year <= _TABLE_END_YEAR or not MINYEAR < year <= MAXYEAR:
+            return None, True
+
+        return _lunar_to_gregorian(year, *_LUNAR_HOLIDAYS[holiday]), True
 
     def buddha_birthday_date(self, year: int) -> tuple[Optional[date], bool]:
         return self._get_holiday(BUDDHA_BIRTHDAY, year)
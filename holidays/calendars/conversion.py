@@ -0,0 +1,485 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Batch conversion between Gregorian and lunar or lunisolar calendars dates.
+
+Gregorian dates are proleptic Gregorian ordinals (see `date.toordinal()`).
+The functions accept sequences or NumPy arrays and return lists or NumPy
+arrays respectively. The calendar modules month starts of the input years
+range are concatenated into a single sorted table searched with `bisect` or
+`numpy.searchsorted`.
+
+Lunisolar calendars dates have a leap month flag: the Chinese leap month has
+the number of the month it follows and the Thai 8/8 month is the leap 8th
+month. Hebrew months are numbered from Nisan, Adar II is accepted as Adar in
+common years.
+"""
+
+from bisect import bisect_right
+from datetime import date
+from functools import lru_cache
+from itertools import repeat
+
+from holidays.calendars.hebrew import (
+    NISAN,
+    IYAR,
+    SIVAN,
+    TAMMUZ,
+    AV,
+    ELUL,
+    TISHREI,
+    HESHVAN,
+    KISLEV,
+    TEVET,
+    SHEVAT,
+    ADAR,
+    ADAR_II,
+    HEBREW_YEAR_OFFSET,
+    _get_hebrew_year_months,
+    _get_new_year,
+    _is_leap_year,
+)
+from holidays.calendars.hijri import TABULAR_EPOCH, _get_hijri_years_month_starts
+from holidays.calendars.islamic import _HIJRI_START_YEAR, _get_hijri_month_starts
+from holidays.calendars.jalali import _jalali_to_ordinals, _ordinals_to_jalali
+from holidays.calendars.lunisolar import _get_lunar_year_months
+from holidays.calendars.thai import _ThaiLunisolar, _get_thai_year_starts
+from holidays.helpers import _is_numpy_array
+
+# Supported calendars years ranges: the years ending before 9999-12-31.
+HIJRI_MIN_YEAR, HIJRI_MAX_YEAR = 1, 9666
+HEBREW_MIN_YEAR, HEBREW_MAX_YEAR = 3761, 13760
+CHINESE_MIN_YEAR, CHINESE_MAX_YEAR = 2, 9998
+
+_HEBREW_MONTHS = (TISHREI, HESHVAN, KISLEV, TEVET, SHEVAT, ADAR)
+_HEBREW_MONTHS_SECOND_HALF = (NISAN, IYAR, SIVAN, TAMMUZ, AV, ELUL)
+# Month slot of the leap months in the inverse conversion tables.
+_LEAP_MONTH_SLOT = 13
+
+
+def _get_hijri_year_month_starts(year: int) -> tuple[int, ...]:
+    if year < _HIJRI_START_YEAR:
+        return tuple(_get_hijri_years_month_starts(year, year))
+
+    return _get_hijri_month_starts(year - _HIJRI_START_YEAR)
+
+
+@lru_cache(maxsize=None)
+def _get_hijri_months(year: int) -> tuple[tuple[int, bool, int, int], ...]:
+    """Return (month, is leap month, start ordinal, length) of the Hijri year months."""
+    # The years before the Umm al-Qura table are calculated astronomically,
+    # the last month ends at the next year start to keep the table continuous.
+    month_starts = (
+        *_get_hijri_year_month_starts(year)[:-1],
+        _get_hijri_year_month_starts(year + 1)[0],
+    )
+    return tuple(
+        (month, False, month_starts[month - 1], month_starts[month] - month_starts[month - 1])
+        for month in range(1, 13)
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_hebrew_months(year: int) -> tuple[tuple[int, bool, int, int], ...]:
+    """Return (month, is leap month, start ordinal, length) of the Hebrew year months."""
+    month_starts = _get_hebrew_year_months(year)
+    months = (
+        *_HEBREW_MONTHS,
+        *((ADAR_II,) if _is_leap_year(year) else ()),
+        *_HEBREW_MONTHS_SECOND_HALF,
+    )
+    starts = [month_starts[month - 1] for month in months] + [_get_new_year(year + 1)]
+    return tuple(
+        (month, False, start, next_start - start)
+        for month, start, next_start in zip(months, starts, starts[1:])
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_chinese_months(year: int) -> tuple[tuple[int, bool, int, int], ...]:
+    """Return (month, is leap month, start ordinal, length) of the Chinese lunar year
+    starting in the Gregorian year months."""
+    months = _get_lunar_year_months(year)
+    next_months = _get_lunar_year_months(year + 1)
+    first_idx = next(idx for idx, (month, _, _) in enumerate(months) if month == 1)
+    next_first_idx = next(idx for idx, (month, _, _) in enumerate(next_months) if month == 1)
+    year_months = months[first_idx:] + next_months[: next_first_idx + 1]
+    return tuple(
+        (month, is_leap, start, next_start - start)
+        for (month, is_leap, start), (_, _, next_start) in zip(year_months, year_months[1:])
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_thai_months(year: int) -> tuple[tuple[int, bool, int, int], ...]:
+    """Return (month, is leap month, start ordinal, length) of the Thai lunar year
+    ending in the Gregorian year months."""
+    is_athikamat = year in _ThaiLunisolar.ATHIKAMAT_YEARS_GREGORIAN
+    is_athikawan = year in _ThaiLunisolar.ATHIKAWAN_YEARS_GREGORIAN
+    start = _get_thai_year_starts()[year - _ThaiLunisolar.START_YEAR]
+    months = []
+    for month in range(1, 13):
+        # Odd months have 29 days, the 7th month of Athikawan years has 30 days.
+        length = 29 if month % 2 and not (month == 7 and is_athikawan) else 30
+        months.append((month, False, start, length))
+        start += length
+        # Athikamat years repeat the 8th month.
+        if month == 8 and is_athikamat:
+            months.append((month, True, start, 30))
+            start += 30
+
+    return tuple(months)
+
+
+def _get_year_range(ordinals_min, ordinals_max, estimate_year, min_year, max_year):
+    """Return the calendar years range covering the Gregorian ordinals range.
+
+    The estimated calendar year may be off by one year.
+    """
+    return (
+        max(estimate_year(ordinals_min) - 1, min_year),
+        min(estimate_year(ordinals_max) + 1, max_year),
+    )
+
+
+def _get_months_table(get_months, start_year, end_year):
+    """Return month starts, years, months and leap flags of the calendar years range.
+
+    The last month start is the ordinal of the first day after the range end year.
+    """
+    starts, years, months, leaps = [], [], [], []
+    for year in range(start_year, end_year + 1):
+        for month, is_leap, start, length in get_months(year):
+            starts.append(start)
+            years.append(year)
+            months.append(month)
+            leaps.append(is_leap)
+    starts.append(start + length)
+
+    return starts, years, months, leaps
+
+
+def _ordinals_to_dates(ordinals, get_months, estimate_year, min_year, max_year):
+    """Return calendar (years, months, days, leap month flags) of Gregorian ordinals."""
+    is_numpy = _is_numpy_array(ordinals)
+    if not is_numpy:
+        ordinals = list(ordinals)
+    if not len(ordinals):
+        return (ordinals,) * 4 if is_numpy else ([], [], [], [])
+
+    ordinals_min = int(ordinals.min()) if is_numpy else min(ordinals)
+    ordinals_max = int(ordinals.max()) if is_numpy else max(ordinals)
+    start_year, end_year = _get_year_range(
+        ordinals_min, ordinals_max, estimate_year, min_year, max_year
+    )
+    if start_year > end_year:
+        raise ValueError("Dates are out of the calendar supported range.")
+    starts, years, months, leaps = _get_months_table(get_months, start_year, end_year)
+    if ordinals_min < starts[0] or ordinals_max >= starts[-1]:
+        raise ValueError("Dates are out of the calendar supported range.")
+
+    if not is_numpy:
+        idxs = [bisect_right(starts, ordinal) - 1 for ordinal in ordinals]
+        return (
+            [years[idx] for idx in idxs],
+            [months[idx] for idx in idxs],
+            [ordinal - starts[idx] + 1 for ordinal, idx in zip(ordinals, idxs)],
+            [leaps[idx] for idx in idxs],
+        )
+
+    import numpy as np
+
+    starts = np.asarray(starts)
+    idxs = np.searchsorted(starts, ordinals, side="right") - 1
+    return (
+        np.asarray(years)[idxs],
+        np.asarray(months)[idxs],
+        ordinals - starts[idxs] + 1,
+        np.asarray(leaps)[idxs],
+    )
+
+
+def _get_month_slots(get_months, year, aliases):
+    """Return (start ordinal, length) of the calendar year months by (month, is leap)."""
+    month_slots = {
+        (month, is_leap): (start, length) for month, is_leap, start, length in get_months(year)
+    }
+    for alias, month in aliases.items():
+        month_slots.setdefault((alias, False), month_slots[(month, False)])
+
+    return month_slots
+
+
+def _dates_to_ordinals(years, months, days, leaps, get_months, min_year, max_year, aliases):
+    """Return Gregorian ordinals of calendar dates."""
+    if not _is_numpy_array(years):
+        ordinals = []
+        for year, month, day, is_leap in zip(
+            years, months, days, repeat(False) if leaps is None else leaps
+        ):
+            if not min_year <= year <= max_year:
+                raise ValueError(f"Year {year} is out of the calendar supported range.")
+            start, length = _get_month_slots(get_months, year, aliases).get(
+                (month, bool(is_leap)), (None, 0)
+            )
+            if not 1 <= day <= length:
+                raise ValueError(f"Invalid date: {year}-{month}-{day} (leap month: {is_leap}).")
+            ordinals.append(start + day - 1)
+
+        return ordinals
+
+    if not years.size:
+        return years
+
+    import numpy as np
+
+    start_year = int(years.min())
+    end_year = int(years.max())
+    if start_year < min_year or end_year > max_year:
+        raise ValueError("Years are out of the calendar supported range.")
+
+    # Dense (year, month slot) tables, leap months use the last slot.
+    starts = np.zeros((end_year - start_year + 1, _LEAP_MONTH_SLOT + 1), dtype=np.int64)
+    lengths = np.zeros_like(starts)
+    for row, year in enumerate(range(start_year, end_year + 1)):
+        for (month, is_leap), (start, length) in _get_month_slots(
+            get_months, year, aliases
+        ).items():
+            slot = _LEAP_MONTH_SLOT if is_leap else month - 1
+            starts[row, slot] = start
+            lengths[row, slot] = length
+
+    is_valid_month = (months >= 1) & (months <= _LEAP_MONTH_SLOT)
+    slots = np.where(is_valid_month, months - 1, 0)
+    if leaps is not None:
+        slots = np.where(leaps, _LEAP_MONTH_SLOT, slots)
+    rows = years - start_year
+    if not (is_valid_month & (days >= 1) & (days <= lengths[rows, slots])).all():
+        raise ValueError("Invalid dates.")
+
+    return starts[rows, slots] + days - 1
+
+
+def _estimate_gregorian_year(ordinal: int) -> int:
+    return date.fromordinal(ordinal).year
+
+
+def _estimate_hebrew_year(ordinal: int) -> int:
+    return date.fromordinal(ordinal).year + HEBREW_YEAR_OFFSET
+
+
+def _estimate_hijri_year(ordinal: int) -> int:
+    # The mean Hijri year is 10631 / 30 days long.
+    return (ordinal - TABULAR_EPOCH) * 30 // 10631 + 1
+
+
+def to_hijri(ordinals):
+    """Convert Gregorian ordinals to Hijri (Umm al-Qura) dates.
+
+    :param ordinals:
+        A sequence or NumPy array of Gregorian ordinals.
+
+    :return:
+        A (years, months, days) tuple.
+    """
+    return _ordinals_to_dates(
+        ordinals, _get_hijri_months, _estimate_hijri_year, HIJRI_MIN_YEAR, HIJRI_MAX_YEAR
+    )[:3]
+
+
+def from_hijri(years, months, days):
+    """Convert Hijri (Umm al-Qura) dates to Gregorian ordinals.
+
+    :param years:
+        A sequence or NumPy array of Hijri years.
+
+    :param months:
+        A sequence or NumPy array of Hijri months.
+
+    :param days:
+        A sequence or NumPy array of Hijri days.
+
+    :return:
+        Gregorian ordinals.
+    """
+    return _dates_to_ordinals(
+        years, months, days, None, _get_hijri_months, HIJRI_MIN_YEAR, HIJRI_MAX_YEAR, {}
+    )
+
+
+def to_hebrew(ordinals):
+    """Convert Gregorian ordinals to Hebrew dates.
+
+    :param ordinals:
+        A sequence or NumPy array of Gregorian ordinals.
+
+    :return:
+        A (years, months, days) tuple, months are numbered from Nisan.
+    """
+    return _ordinals_to_dates(
+        ordinals, _get_hebrew_months, _estimate_hebrew_year, HEBREW_MIN_YEAR, HEBREW_MAX_YEAR
+    )[:3]
+
+
+def from_hebrew(years, months, days):
+    """Convert Hebrew dates to Gregorian ordinals.
+
+    :param years:
+        A sequence or NumPy array of Hebrew years.
+
+    :param months:
+        A sequence or NumPy array of Hebrew months numbered from Nisan.
+
+    :param days:
+        A sequence or NumPy array of Hebrew days.
+
+    :return:
+        Gregorian ordinals.
+    """
+    return _dates_to_ordinals(
+        years,
+        months,
+        days,
+        None,
+        _get_hebrew_months,
+        HEBREW_MIN_YEAR,
+        HEBREW_MAX_YEAR,
+        {ADAR_II: ADAR},
+    )
+
+
+def to_chinese_lunar(ordinals):
+    """Convert Gregorian ordinals to Chinese lunar dates.
+
+    :param ordinals:
+        A sequence or NumPy array of Gregorian ordinals.
+
+    :return:
+        A (years, months, days, leap month flags) tuple, the years are the
+        Gregorian years of the lunar years start.
+    """
+    return _ordinals_to_dates(
+        ordinals,
+        _get_chinese_months,
+        _estimate_gregorian_year,
+        CHINESE_MIN_YEAR,
+        CHINESE_MAX_YEAR,
+    )
+
+
+def from_chinese_lunar(years, months, days, leap_months=None):
+    """Convert Chinese lunar dates to Gregorian ordinals.
+
+    :param years:
+        A sequence or NumPy array of Chinese lunar years.
+
+    :param months:
+        A sequence or NumPy array of Chinese lunar months.
+
+    :param days:
+        A sequence or NumPy array of Chinese lunar days.
+
+    :param leap_months:
+        A sequence or NumPy array of leap month flags, no leap months by default.
+
+    :return:
+        Gregorian ordinals.
+    """
+    return _dates_to_ordinals(
+        years,
+        months,
+        days,
+        leap_months,
+        _get_chinese_months,
+        CHINESE_MIN_YEAR,
+        CHINESE_MAX_YEAR,
+        {},
+    )
+
+
+def to_thai_lunar(ordinals):
+    """Convert Gregorian ordinals to Thai lunar dates.
+
+    :param ordinals:
+        A sequence or NumPy array of Gregorian ordinals.
+
+    :return:
+        A (years, months, days, leap month flags) tuple, the years are the
+        Gregorian years of the lunar years end.
+    """
+    return _ordinals_to_dates(
+        ordinals,
+        _get_thai_months,
+        _estimate_gregorian_year,
+        _ThaiLunisolar.START_YEAR,
+        _ThaiLunisolar.END_YEAR,
+    )
+
+
+def from_thai_lunar(years, months, days, leap_months=None):
+    """Convert Thai lunar dates to Gregorian ordinals.
+
+    :param years:
+        A sequence or NumPy array of Thai lunar years.
+
+    :param months:
+        A sequence or NumPy array of Thai lunar months.
+
+    :param days:
+        A sequence or NumPy array of Thai lunar days.
+
+    :param leap_months:
+        A sequence or NumPy array of 8/8 month flags, no leap months by default.
+
+    :return:
+        Gregorian ordinals.
+    """
+    return _dates_to_ordinals(
+        years,
+        months,
+        days,
+        leap_months,
+        _get_thai_months,
+        _ThaiLunisolar.START_YEAR,
+        _ThaiLunisolar.END_YEAR,
+        {},
+    )
+
+
+def to_jalali(ordinals):
+    """Convert Gregorian ordinals to Solar Hijri (Jalali) dates.
+
+    :param ordinals:
+        A sequence or NumPy array of Gregorian ordinals.
+
+    :return:
+        A (years, months, days) tuple.
+    """
+    return _ordinals_to_jalali(ordinals)
+
+
+def from_jalali(years, months, days):
+    """Convert Solar Hijri (Jalali) dates to Gregorian ordinals.
+
+    :param years:
+        A sequence or NumPy array of Jalali years.
+
+    :param months:
+        A sequence or NumPy array of Jalali months.
+
+    :param days:
+        A sequence or NumPy array of Jalali days.
+
+    :return:
+        Gregorian ordinals.
+    """
+    return _jalali_to_ordinals(years, months, days)
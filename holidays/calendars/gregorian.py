@@ -11,6 +11,7 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from functools import lru_cache
 
 GREGORIAN_CALENDAR = "GREGORIAN_CALENDAR"
 
@@ -28,6 +29,10 @@ MONTHS = {
 }
 WEEKDAYS = {w: i for i, w in enumerate(("mon", "tue", "wed", "thu", "fri", "sat", "sun"))}
 
+# Easter calculation methods (compatible with `dateutil.easter` ones).
+EASTER_ORTHODOX = 2
+EASTER_WESTERN = 3
+
 
 # Holiday names.
 CHRISTMAS = "christmas"
@@ -42,6 +47,42 @@ def _timedelta(dt: date, days: int = 0) -> date:
     return date.fromordinal(dt.toordinal() + days)
 
 
+@lru_cache(maxsize=None)
+def _get_easter_date(year: int, method: int = EASTER_WESTERN) -> date:
+    """
+    Return Easter Sunday date for a specific year (valid for 1583-4099 years).
+    The dates are memoized per (year, method) process-wide.
+
+    The EASTER_ORTHODOX method calculates the Julian calendar Easter date
+    converted to the Gregorian calendar, the EASTER_WESTERN method uses the
+    revised Gregorian calendar calculation. It's a port of the
+    `dateutil.easter.easter` algorithm avoiding the dependency import.
+    https://www.tondering.dk/claus/cal/easter.php
+    """
+
+    # g - Golden year - 1.
+    # i - Number of days from March 21 to Paschal Full Moon.
+    # j - Weekday for PFM (0=Sunday, etc).
+    # e - Extra days to add for Julian to Gregorian date conversion.
+    g = year % 19
+    e = 0
+    if method == EASTER_ORTHODOX:
+        i = (19 * g + 15) % 30
+        j = (year + year // 4 + i) % 7
+        e = 10
+        if year > 1600:
+            e += year // 100 - 16 - (year // 100 - 16) // 4
+    else:
+        c = year // 100
+        h = (c - c // 4 - (8 * c + 13) // 25 + 19 * g + 15) % 30
+        i = h - (h // 28) * (1 - (h // 28) * (29 // (h + 1)) * ((21 - g) // 11))
+        j = (year + year // 4 + i + 2 - c + c // 4) % 7
+
+    # p - Number of days from March 21 to Sunday on or before PFM.
+    p = i - j + e
+    return date(year, 3 + (p + 26) // 30, 1 + (p + 27 + (p + 6) // 40) % 31)
+
+
 def _get_nth_weekday_from(n: int, weekday: int, from_dt: date) -> date:
     """
     Return date of a n-th weekday before a specific date
@@ -0,0 +1,80 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+from functools import lru_cache
+
+from holidays.calendars.astronomy import (
+    _is_moon_set_after_sun,
+    _jd_to_ordinal,
+    _new_moon,
+    _sunset,
+)
+
+HIJRI_TABULAR = "HIJRI_TABULAR"
+HIJRI_UMM_AL_QURA = "HIJRI_UMM_AL_QURA"
+
+# Gregorian proleptic calendar ordinal of 1 Muharram 1 AH (civil epoch).
+TABULAR_EPOCH = 227015
+
+MECCA_LATITUDE = 21.4225
+MECCA_LONGITUDE = 39.8262
+MECCA_UTC_OFFSET = 3
+
+# Hijri month index (months since 1 Muharram 1 AH) of the new moon of 2000 January 6.
+NEW_MOON_EPOCH_MONTH = 17037
+
+
+def _tabular_month_start(year, month):
+    """Return Gregorian ordinal of the tabular (arithmetic) Hijri month start.
+
+    Uses the 30-year cycle with leap years 2, 5, 7, 10, 13, 16, 18, 21, 24, 26
+    and 29. Only integer arithmetic is used, so NumPy integer arrays of years
+    and months are converted element-wise.
+    """
+    return TABULAR_EPOCH + (year - 1) * 354 + (3 + 11 * year) // 30 + (59 * (month - 1) + 1) // 2
+
+
+@lru_cache(maxsize=None)
+def _umm_al_qura_month_start(year: int, month: int) -> int:
+    """Return Gregorian ordinal of the Umm al-Qura compatible Hijri month start.
+
+    The month starts on the day after the geocentric conjunction occurs before
+    sunset and the Moon sets after the Sun in Mecca, the rule followed by the
+    Umm al-Qura calendar since 1423 AH.
+    """
+    new_moon = _new_moon((year - 1) * 12 + month - 1 - NEW_MOON_EPOCH_MONTH)
+    day = _jd_to_ordinal(new_moon, MECCA_UTC_OFFSET)
+    while True:
+        sunset = _sunset(day, MECCA_LATITUDE, MECCA_LONGITUDE)
+        if new_moon < sunset and _is_moon_set_after_sun(sunset, MECCA_LATITUDE, MECCA_LONGITUDE):
+            return day + 1
+        day += 1
+
+
+def _get_hijri_years_month_starts(
+    start_year: int, end_year: int, method: str = HIJRI_UMM_AL_QURA
+) -> list[int]:
+    """Return Gregorian ordinals of all Hijri years range month starts.
+
+    The last item is the ordinal of the first day after the range end year.
+    """
+    if method not in {HIJRI_TABULAR, HIJRI_UMM_AL_QURA}:
+        raise ValueError(
+            f"Unknown calendar name: {method}. Use `HIJRI_TABULAR` or `HIJRI_UMM_AL_QURA`."
+        )
+
+    month_start = _tabular_month_start if method == HIJRI_TABULAR else _umm_al_qura_month_start
+    return [
+        month_start(year, month)
+        for year in range(start_year, end_year + 1)
+        for month in range(1, 13)
+    ] + [month_start(end_year + 1, 1)]
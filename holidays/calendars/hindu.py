@@ -10,15 +10,24 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date
+from datetime import MAXYEAR, MINYEAR, date
 from typing import Optional
 
 from holidays.calendars.custom import _CustomCalendar
 from holidays.calendars.gregorian import JAN, FEB, MAR, OCT, NOV
+from holidays.calendars.panchanga import _diwali_date, _thaipusam_date
 
 DIWALI = "DIWALI"
 THAIPUSAM = "THAIPUSAM"
 
+_HINDU_HOLIDAYS = {
+    DIWALI: _diwali_date,
+    THAIPUSAM: _thaipusam_date,
+}
+# The holiday dates tables range, later and earlier dates are calculated astronomically.
+_TABLE_START_YEAR = 1901
+_TABLE_END_YEAR = 2099
+
 
 class _HinduLunisolar:
     DIWALI_DATES = {
@@ -429,7 +438,13 @@ class _HinduLunisolar:
         estimated_dates = getattr(self, f"{holiday}_DATES", {})
         exact_dates = getattr(self, f"{holiday}_DATES_{_CustomCalendar.CUSTOM_ATTR_POSTFIX}", {})
         dt = exact_dates.get(year, estimated_dates.get(year, ()))
-        return date(year, *dt) if dt else None, year not in exact_dates
+        if dt:
+            return date(year, *dt), year not in exact_dates
+
+        if _TABLE_START_YEAR <= year <= _TABLE_END_YEAR or not MINYEAR <= year <= MAXYEAR:
+            return None, True
+
+        return _HINDU_HOLIDAYS[holiday](year), True
 
     def diwali_date(self, year: int) -> tuple[Optional[date], bool]:
         return self._get_holiday(DIWALI, year)
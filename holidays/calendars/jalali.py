@@ -0,0 +1,115 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Solar Hijri (Jalali) calendar conversion.
+
+The year starts on the day of the March equinox if it occurs before noon
+Iran Standard Time, otherwise on the next day. The first six months have
+31 days, the next five months have 30 days and Esfand has 29 or 30 days.
+
+The batch functions accept sequences or NumPy arrays and return lists or
+NumPy arrays respectively.
+"""
+
+from datetime import date
+from functools import lru_cache
+
+from holidays.calendars.astronomy import _jd_to_ordinal, _ordinal_to_jd, _solar_term
+from holidays.helpers import _is_numpy_array
+
+IRAN_UTC_OFFSET = 3.5
+# Gregorian year of the Jalali year 1 Farvardin minus the Jalali year.
+JALALI_YEAR_OFFSET = 621
+# The first day of Mehr (the 7th month) day of year.
+MEHR_DAY_OF_YEAR = 186
+
+
+@lru_cache(maxsize=None)
+def _get_jalali_new_year(year: int) -> int:
+    """Return Gregorian ordinal of the Jalali year 1 Farvardin."""
+    jd = _solar_term(_ordinal_to_jd(date(year + JALALI_YEAR_OFFSET, 1, 1).toordinal()), 0)
+    # Shift by 12 hours: an equinox after noon starts the year on the next day.
+    return _jd_to_ordinal(jd, IRAN_UTC_OFFSET + 12)
+
+
+def _get_jalali_year_starts(start_year: int, end_year: int) -> list[int]:
+    """Return Gregorian ordinals of the Jalali years range 1 Farvardin.
+
+    The last item is the ordinal of the first day after the range end year.
+    """
+    return [_get_jalali_new_year(year) for year in range(start_year, end_year + 2)]
+
+
+def _month_start_day_of_year(month):
+    """Return the Jalali month 1st day of year (0-based), NumPy arrays compatible."""
+    return 31 * (month - 1) - (month > 7) * (month - 7)
+
+
+def _day_of_year_to_month_day(day_of_year):
+    """Return the Jalali (month, day) of day of year (0-based), NumPy arrays compatible."""
+    is_first_half = day_of_year < MEHR_DAY_OF_YEAR
+    month = is_first_half * (day_of_year // 31 + 1) + (1 - is_first_half) * (
+        (day_of_year - MEHR_DAY_OF_YEAR) // 30 + 7
+    )
+    return month, day_of_year - _month_start_day_of_year(month) + 1
+
+
+def _jalali_to_ordinal(year: int, month: int, day: int) -> int:
+    """Return Gregorian ordinal of the Jalali date."""
+    return _get_jalali_new_year(year) + _month_start_day_of_year(month) + day - 1
+
+
+def _ordinal_to_jalali(ordinal: int) -> tuple[int, int, int]:
+    """Return the Jalali (year, month, day) of Gregorian ordinal."""
+    year = date.fromordinal(ordinal).year - JALALI_YEAR_OFFSET
+    new_year = _get_jalali_new_year(year)
+    if ordinal < new_year:
+        year -= 1
+        new_year = _get_jalali_new_year(year)
+
+    return (year, *_day_of_year_to_month_day(ordinal - new_year))
+
+
+def _jalali_to_ordinals(years, months, days):
+    """Return Gregorian ordinals of the Jalali dates."""
+    if not _is_numpy_array(years):
+        return [_jalali_to_ordinal(*jalali_date) for jalali_date in zip(years, months, days)]
+
+    if not years.size:
+        return years
+
+    import numpy as np
+
+    start_year = int(years.min())
+    year_starts = np.asarray(_get_jalali_year_starts(start_year, int(years.max())))
+    return year_starts[years - start_year] + _month_start_day_of_year(months) + days - 1
+
+
+def _ordinals_to_jalali(ordinals):
+    """Return the Jalali (years, months, days) of Gregorian ordinals."""
+    if not _is_numpy_array(ordinals):
+        jalali_dates = [_ordinal_to_jalali(ordinal) for ordinal in ordinals]
+        return tuple(list(values) for values in zip(*jalali_dates)) or ([], [], [])
+
+    if not ordinals.size:
+        return ordinals, ordinals, ordinals
+
+    import numpy as np
+
+    start_year = date.fromordinal(int(ordinals.min())).year - JALALI_YEAR_OFFSET - 1
+    end_year = date.fromordinal(int(ordinals.max())).year - JALALI_YEAR_OFFSET
+    year_starts = np.asarray(_get_jalali_year_starts(start_year, end_year))
+    year_idx = np.searchsorted(year_starts, ordinals, side="right") - 1
+    return (
+        start_year + year_idx,
+        *_day_of_year_to_month_day(ordinals - year_starts[year_idx]),
+    )
@@ -0,0 +1,106 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Astronomical rules of the Chinese lunisolar calendar.
+
+Months start on the day (China Standard Time) of the new moon. The month
+containing the December solstice is the 11th month and, when 13 months
+separate two such months, the first month without a major solar term
+(a multiple of 30 degrees of the Sun longitude) is a leap month.
+"""
+
+from bisect import bisect_left
+from datetime import date
+from functools import lru_cache
+
+from holidays.calendars.astronomy import (
+    _jd_to_ordinal,
+    _new_moon,
+    _new_moon_number,
+    _ordinal_to_jd,
+    _solar_term,
+)
+
+CHINA_UTC_OFFSET = 8
+
+WINTER_SOLSTICE_LONGITUDE = 270
+QINGMING_LONGITUDE = 15
+
+
+@lru_cache(maxsize=None)
+def _solar_term_date(year: int, longitude: float) -> date:
+    """Return China Standard Time date of the solar term in the Gregorian year."""
+    jd = _solar_term(_ordinal_to_jd(date(year, 1, 1).toordinal()), longitude)
+    return date.fromordinal(_jd_to_ordinal(jd, CHINA_UTC_OFFSET))
+
+
+@lru_cache(maxsize=None)
+def _get_winter_solstice_month(year: int) -> tuple[int, int]:
+    """Return the year December solstice date ordinal and new moon number
+    of the 11th month."""
+    solstice = _solar_term_date(year, WINTER_SOLSTICE_LONGITUDE).toordinal()
+    # The new moon of the solstice day end belongs to the 11th month.
+    return solstice, _new_moon_number(_ordinal_to_jd(solstice + 1) - CHINA_UTC_OFFSET / 24)
+
+
+@lru_cache(maxsize=None)
+def _get_lunar_year_months(year: int) -> tuple[tuple[int, bool, int], ...]:
+    """Return the Chinese lunar months between the December solstices of the
+    previous and the Gregorian year.
+
+    Each item is a (month, is leap month, start date ordinal) tuple. The
+    months run from the 11th month of the previous lunar year to the 10th
+    month (or its leap month) of the lunar year starting in the Gregorian year.
+    """
+    solstice, first_moon = _get_winter_solstice_month(year - 1)
+    next_solstice, last_moon = _get_winter_solstice_month(year)
+    month_starts = [
+        _jd_to_ordinal(_new_moon(k), CHINA_UTC_OFFSET) for k in range(first_moon, last_moon + 1)
+    ]
+    leap_month_idx = None
+    if len(month_starts) == 14:
+        jd = _ordinal_to_jd(solstice)
+        major_terms = []
+        for longitude in range(300, 630, 30):
+            jd = _solar_term(jd, longitude % 360)
+            major_terms.append(_jd_to_ordinal(jd, CHINA_UTC_OFFSET))
+        major_terms.append(next_solstice)
+        # The first month without a major solar term is the leap month.
+        leap_month_idx = next(
+            idx
+            for idx in range(1, 13)
+            if bisect_left(major_terms, month_starts[idx])
+            == bisect_left(major_terms, month_starts[idx + 1])
+        )
+
+    months = []
+    month = 10
+    for idx, start in enumerate(month_starts[:-1]):
+        is_leap = idx == leap_month_idx
+        if not is_leap:
+            month = month % 12 + 1
+        months.append((month, is_leap, start))
+
+    return tuple(months)
+
+
+def _lunar_to_gregorian(year: int, month: int, day: int) -> date:
+    """Return Gregorian date of the Chinese lunar year 1st to 10th month day."""
+    return date.fromordinal(
+        next(
+            start
+            for lunar_month, is_leap, start in _get_lunar_year_months(year)[2:]
+            if lunar_month == month and not is_leap
+        )
+        + day
+        - 1
+    )
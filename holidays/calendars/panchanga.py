@@ -0,0 +1,169 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+"""Astronomical rules of the Hindu lunisolar calendar (panchanga).
+
+A tithi is the time the Moon needs to gain 12 degrees of longitude on the Sun,
+a nakshatra is a 1/27 part of the sidereal zodiac the Moon passes through.
+Amanta lunar months end with the new moon and are named after the sidereal
+sign the Sun enters (sankranti) during the month. Sidereal longitudes use the
+Lahiri ayanamsa, days follow Indian Standard Time and the Chennai sunrise.
+"""
+
+from datetime import MINYEAR, date
+from functools import lru_cache
+from typing import Optional
+
+from holidays.calendars.astronomy import (
+    J2000,
+    SYNODIC_MONTH,
+    _jd_to_ordinal,
+    _moon_ecliptic_position,
+    _new_moon,
+    _new_moon_number,
+    _ordinal_to_jd,
+    _solar_term,
+    _sun_longitude,
+    _sunrise,
+)
+
+INDIA_UTC_OFFSET = 5.5
+CHENNAI_LATITUDE = 13.0827
+CHENNAI_LONGITUDE = 80.2707
+
+TITHI_LENGTH = 12
+NAKSHATRA_LENGTH = 360 / 27
+# Krishna Chaturdashi, the 14th day of the waning Moon.
+KRISHNA_CHATURDASHI = 29
+PUSHYA = 8
+# Sidereal longitudes of the Tula (Libra) and Makara (Capricorn) sankrantis.
+TULA_LONGITUDE = 180
+MAKARA_LONGITUDE = 270
+# Arunodaya (dawn) starts 4 ghatikas (96 minutes) before the sunrise.
+ARUNODAYA_LENGTH = 1 / 15
+
+
+def _lahiri_ayanamsa(jd: float) -> float:
+    """Return the Lahiri ayanamsa (deg), the sidereal zodiac shift from the equinox."""
+    t = (jd - J2000) / 36525
+    return 23.85306 + (5029.0966 * t + 1.11113 * t**2) / 3600
+
+
+def _moon_sun_elongation(jd: float) -> float:
+    return (_moon_ecliptic_position(jd)[0] - _sun_longitude(jd)) % 360
+
+
+def _moon_sidereal_longitude(jd: float) -> float:
+    return (_moon_ecliptic_position(jd)[0] - _lahiri_ayanamsa(jd)) % 360
+
+
+def _tithi_start(jd: float, tithi: int) -> float:
+    """Return JD (UT) of the tithi start nearest to JD."""
+    elongation = (tithi - 1) * TITHI_LENGTH
+    for _ in range(5):
+        jd += ((elongation - _moon_sun_elongation(jd) + 180) % 360 - 180) * SYNODIC_MONTH / 360
+
+    return jd
+
+
+def _nakshatra(jd: float) -> int:
+    """Return the nakshatra (1-27) of the Moon at JD (UT)."""
+    return int(_moon_sidereal_longitude(jd) // NAKSHATRA_LENGTH) + 1
+
+
+@lru_cache(maxsize=None)
+def _sankranti(year: int, longitude: float) -> float:
+    """Return JD (UT) of the Sun entering the sidereal longitude in the Gregorian year."""
+    jd = _ordinal_to_jd(date(year, 1, 1).toordinal())
+    for _ in range(2):
+        jd = _solar_term(
+            _ordinal_to_jd(date(year, 1, 1).toordinal()),
+            (longitude + _lahiri_ayanamsa(jd)) % 360,
+        )
+
+    return jd
+
+
+def _get_month_end(sankranti: float) -> float:
+    """Return JD (UT) of the new moon ending the amanta month of the sankranti."""
+    return _new_moon(_new_moon_number(sankranti) + 1)
+
+
+def _get_full_moon(sankranti: float) -> float:
+    """Return JD (UT) of the first full moon after the sankranti."""
+    k = _new_moon_number(sankranti)
+    full_moon = _tithi_start(_new_moon(k) + SYNODIC_MONTH / 2, 16)
+    return (
+        full_moon
+        if full_moon > sankranti
+        else _tithi_start(_new_moon(k + 1) + SYNODIC_MONTH / 2, 16)
+    )
+
+
+def _get_festival_date(year: int, longitude: float, get_date) -> Optional[date]:
+    """Return the festival date in the Gregorian year.
+
+    The sidereal signs slowly drift over the Gregorian year, so the festival
+    of the previous year sankranti may also fall in the year.
+    """
+    for sankranti_year in (year, year - 1) if year > MINYEAR else (year,):
+        dt = get_date(_sankranti(sankranti_year, longitude))
+        if dt.year == year:
+            return dt
+
+    return None
+
+
+def _get_diwali(sankranti: float) -> date:
+    """Return the Ashvin Krishna Chaturdashi day with the tithi at arunodaya."""
+    start = _tithi_start(_get_month_end(sankranti) - 1.5, KRISHNA_CHATURDASHI)
+    end = _tithi_start(start + 1, KRISHNA_CHATURDASHI + 1)
+    first_day = _jd_to_ordinal(start, INDIA_UTC_OFFSET)
+    days = [
+        day
+        for day in range(first_day, _jd_to_ordinal(end, INDIA_UTC_OFFSET) + 2)
+        if start <= _sunrise(day, CHENNAI_LATITUDE, CHENNAI_LONGITUDE) - ARUNODAYA_LENGTH < end
+    ]
+    # The later day if the tithi prevails at two dawns, the tithi start day if at none.
+    return date.fromordinal(days[-1] if days else first_day)
+
+
+def _get_thaipusam(sankranti: float) -> date:
+    """Return the Thai month full moon day with the Pushya nakshatra at noon."""
+    full_moon_day = _jd_to_ordinal(_get_full_moon(sankranti), INDIA_UTC_OFFSET)
+    days = [
+        day
+        for day in range(full_moon_day - 3, full_moon_day + 4)
+        if _nakshatra(_ordinal_to_jd(day) + 0.5 - INDIA_UTC_OFFSET / 24) == PUSHYA
+    ]
+    if days:
+        # The later day if the nakshatra prevails at two noons.
+        return date.fromordinal(days[-1])
+
+    # Otherwise the day the Moon passes the nakshatra middle.
+    jd = _ordinal_to_jd(full_moon_day)
+    longitude = (PUSHYA - 0.5) * NAKSHATRA_LENGTH
+    for _ in range(5):
+        jd += ((longitude - _moon_sidereal_longitude(jd) + 180) % 360 - 180) / 13.176
+    return date.fromordinal(_jd_to_ordinal(jd, INDIA_UTC_OFFSET))
+
+
+@lru_cache(maxsize=None)
+def _diwali_date(year: int) -> Optional[date]:
+    """Return Gregorian date of Diwali (Deepavali, Naraka Chaturdashi) in the Gregorian year."""
+    return _get_festival_date(year, TULA_LONGITUDE, _get_diwali)
+
+
+@lru_cache(maxsize=None)
+def _thaipusam_date(year: int) -> Optional[date]:
+    """Return Gregorian date of Thaipusam in the Gregorian year."""
+    return _get_festival_date(year, MAKARA_LONGITUDE, _get_thaipusam)
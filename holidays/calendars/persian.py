@@ -10,49 +10,31 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date
+from datetime import MAXYEAR, MINYEAR, date
 from typing import Optional
 
-from holidays.calendars.gregorian import _timedelta
+from holidays.calendars.jalali import JALALI_YEAR_OFFSET, _jalali_to_ordinal
 
 
 class _Persian:
     """
-    Persian calendar (Solar Hijri) for 1901-2100 years.
+    Persian calendar (Solar Hijri).
 
     https://en.wikipedia.org/wiki/Solar_Hijri_calendar
     """
 
-    START_YEAR = 1901
-    END_YEAR = 2100
-
     def new_year_date(self, year: int) -> Optional[date]:
         """
         Return Gregorian date of Persian new year (1 Farvardin) in a given Gregorian year.
         """
-        if year < _Persian.START_YEAR or year > _Persian.END_YEAR:
-            return None
-
-        day = 21
-        if (
-            (year % 4 == 1 and year >= 2029)
-            or (year % 4 == 2 and year >= 2062)
-            or (year % 4 == 3 and year >= 2095)
-            or (year % 4 == 0 and 1996 <= year <= 2096)
-        ):
-            day = 20
-        elif (year % 4 == 2 and year <= 1926) or (year % 4 == 3 and year <= 1959):
-            day = 22
-        return date(year, 3, day)
+        return self.persian_to_gregorian(year, 1, 1)
 
     def persian_to_gregorian(self, year: int, j_month: int, j_day: int) -> Optional[date]:
         """
         Return Gregorian date of Persian day and month in a given Gregorian year.
         """
-        start_date = self.new_year_date(year)
-        if not start_date:
+        if not MINYEAR <= year <= MAXYEAR:
             return None
 
-        m = j_month - 1
-        delta = (31 * m if m < 6 else 186 + 30 * (m - 6)) + j_day - 1
-        return _timedelta(start_date, delta)
+        ordinal = _jalali_to_ordinal(year - JALALI_YEAR_OFFSET, j_month, j_day)
+        return date.fromordinal(ordinal) if ordinal <= date.max.toordinal() else None
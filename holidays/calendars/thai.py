@@ -20,6 +20,26 @@ KHMER_CALENDAR = "KHMER_CALENDAR"
 THAI_CALENDAR = "THAI_CALENDAR"
 
 
+@lru_cache(maxsize=None)
+def _get_thai_year_starts() -> tuple[int, ...]:
+    """Return Gregorian ordinals of the Thai Lunar Calendar year starts.
+
+    The cumulative offsets are calculated once from the year-type data,
+    the first item is the start of the `_ThaiLunisolar.START_YEAR` year.
+    """
+    year_starts = [_ThaiLunisolar.START_DATE.toordinal()]
+    for year in range(_ThaiLunisolar.START_YEAR, _ThaiLunisolar.END_YEAR):
+        if year in _ThaiLunisolar.ATHIKAMAT_YEARS_GREGORIAN:
+            year_length = 384
+        elif year in _ThaiLunisolar.ATHIKAWAN_YEARS_GREGORIAN:
+            year_length = 355
+        else:
+            year_length = 354
+        year_starts.append(year_starts[-1] + year_length)
+
+    return tuple(year_starts)
+
+
 class _ThaiLunisolar:
     """
     ** Thai Lunar Calendar Holidays only work from 1913 (B.E. 2456/2455) onwards
@@ -280,7 +300,6 @@ class _ThaiLunisolar:
                 f"Unknown calendar name: {calendar}. Use `KHMER_CALENDAR` or `THAI_CALENDAR`."
             )
 
-    @lru_cache
     def _get_start_date(self, year: int) -> Optional[date]:
         """
         Calculate the start date of that particular Thai Lunar Calendar Year.
@@ -297,14 +316,7 @@ class _ThaiLunisolar:
         if year < _ThaiLunisolar.START_YEAR or year > _ThaiLunisolar.END_YEAR:
             return None
 
-        delta_days = 354 * (year - _ThaiLunisolar.START_YEAR)
-        for iter_year in range(_ThaiLunisolar.START_YEAR, year):
-            if iter_year in _ThaiLunisolar.ATHIKAMAT_YEARS_GREGORIAN:
-                delta_days += 30
-            elif iter_year in _ThaiLunisolar.ATHIKAWAN_YEARS_GREGORIAN:
-                delta_days += 1
-
-        return _timedelta(_ThaiLunisolar.START_DATE, delta_days)
+        return date.fromordinal(_get_thai_year_starts()[year - _ThaiLunisolar.START_YEAR])
 
     def makha_bucha_date(self, year: int, calendar=None) -> Optional[date]:
         """
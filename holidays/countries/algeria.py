@@ -32,6 +32,11 @@ class Algeria(HolidayBase, InternationalHolidays, IslamicHolidays):
     # %s (estimated).
     estimated_label = tr("(تقدير) %s")
     supported_languages = ("ar", "en_US", "fr")
+    # The resting days are Friday and Saturday since 2009.
+    # Previously, these were on Thursday and Friday as implemented in 1976.
+    # https://www.thenationalnews.com/mena/2021/12/07/when-is-the-weekend-in-the-arab-world/
+    weekend = {FRI, SAT}
+    weekend_history = {1976: {SAT, SUN}, 2009: {THU, FRI}}
 
     def __init__(self, *args, **kwargs):
         InternationalHolidays.__init__(self)
@@ -39,16 +44,6 @@ class Algeria(HolidayBase, InternationalHolidays, IslamicHolidays):
         super().__init__(*args, **kwargs)
 
     def _populate_public_holidays(self):
-        # The resting days are Friday and Saturday since 2009.
-        # Previously, these were on Thursday and Friday as implemented in 1976.
-        # https://www.thenationalnews.com/mena/2021/12/07/when-is-the-weekend-in-the-arab-world/
-        if self._year >= 2009:
-            self.weekend = {FRI, SAT}
-        elif self._year >= 1976:
-            self.weekend = {THU, FRI}
-        else:
-            self.weekend = {SAT, SUN}
-
         # New Year's Day.
         self._add_new_years_day(tr("رأس السنة الميلادية"))
 
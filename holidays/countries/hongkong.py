@@ -413,20 +413,6 @@ class HongKong(
             else:
                 self._add_holiday_aug_30(name)
 
-    @property
-    def _winter_solstice_date(self) -> tuple[int, int]:
-        # This approximation is reliable for 1952-2099 years.
-        if (
-            (self._year % 4 == 0 and self._year >= 1988)
-            or (self._year % 4 == 1 and self._year >= 2021)
-            or (self._year % 4 == 2 and self._year >= 2058)
-            or (self._year % 4 == 3 and self._year >= 2091)
-        ):
-            day = 21
-        else:
-            day = 22
-        return DEC, day
-
 
 class HK(HongKong):
     pass
@@ -29,6 +29,10 @@ class Jordan(HolidayBase, ChristianHolidays, InternationalHolidays, IslamicHolid
     # %s (estimated).
     estimated_label = tr("(تقدير) %s")
     supported_languages = ("ar", "en_US")
+    # The resting days are Friday and Saturday since Jan 6, 2000.
+    # https://archive.wfn.org/2000/01/msg00078.html
+    weekend = {FRI, SAT}
+    weekend_history = {2000: {THU, FRI}}
 
     def __init__(self, *args, **kwargs):
         ChristianHolidays.__init__(self)
@@ -37,10 +41,6 @@ class Jordan(HolidayBase, ChristianHolidays, InternationalHolidays, IslamicHolid
         super().__init__(*args, **kwargs)
 
     def _populate_public_holidays(self):
-        # The resting days are Friday and Saturday since Jan 6, 2000.
-        # https://archive.wfn.org/2000/01/msg00078.html
-        self.weekend = {THU, FRI} if self._year <= 1999 else {FRI, SAT}
-
         # New Year's Day.
         self._add_new_years_day(tr("رأس السنة الميلادية"))
 
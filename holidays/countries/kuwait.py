@@ -30,6 +30,10 @@ class Kuwait(HolidayBase, InternationalHolidays, IslamicHolidays):
     # %s (estimated).
     estimated_label = tr("(تقدير) %s")
     supported_languages = ("ar", "en_US")
+    # The resting days are Friday and Saturday since Sep 1, 2007.
+    # https://www.arabnews.com/node/298933
+    weekend = {FRI, SAT}
+    weekend_history = {2007: {THU, FRI}}
 
     def __init__(self, *args, **kwargs):
         InternationalHolidays.__init__(self)
@@ -37,10 +41,6 @@ class Kuwait(HolidayBase, InternationalHolidays, IslamicHolidays):
         super().__init__(*args, **kwargs)
 
     def _populate_public_holidays(self):
-        # The resting days are Friday and Saturday since Sep 1, 2007.
-        # https://www.arabnews.com/node/298933
-        self.weekend = {THU, FRI} if self._year <= 2006 else {FRI, SAT}
-
         # New Year's Day.
         self._add_new_years_day(tr("رأس السنة الميلادية"))
 
@@ -33,7 +33,6 @@ from holidays.calendars.gregorian import (
     DEC,
     FRI,
     SAT,
-    SUN,
 )
 from holidays.groups import (
     BuddhistCalendarHolidays,
@@ -152,6 +151,15 @@ class Malaysia(
         super().__init__(*args, **kwargs)
         self.dts_observed = set()
 
+    def _get_weekend(self, year: int) -> set[int]:
+        # The weekend is Friday and Saturday in Johor, Kedah, Kelantan and Terengganu.
+        if self.subdiv in {"02", "03", "11"} or (
+            self.subdiv == "01" and (year <= 1994 or 2014 <= year <= 2024)
+        ):
+            return {FRI, SAT}
+
+        return super()._get_weekend(year)
+
     def _populate_public_holidays(self):
         # This must be done for every `_populate_public_holidays()` call.
         # Otherwise, 2006/2007 Eid al-Adha observance would be miscalculated.
@@ -216,17 +224,14 @@ class Malaysia(
 
         super()._populate_subdiv_holidays()
 
-        if (
-            self.subdiv == "01" and (self._year <= 1994 or 2014 <= self._year <= 2024)
-        ) or self.subdiv == "02":
-            self._observed_rule = FRI_TO_NEXT_WORKDAY
-            self.weekend = {FRI, SAT}
+        # The weekend rest day holidays are observed: on Friday in Johor and Kedah,
+        # on Saturday in Kelantan and Terengganu, on Sunday elsewhere.
+        if FRI not in self._get_weekend(self._year):
+            self._observed_rule = SUN_TO_NEXT_WORKDAY
         elif self.subdiv in {"03", "11"}:
             self._observed_rule = SAT_TO_NEXT_WORKDAY
-            self.weekend = {FRI, SAT}
         else:
-            self._observed_rule = SUN_TO_NEXT_WORKDAY
-            self.weekend = {SAT, SUN}
+            self._observed_rule = FRI_TO_NEXT_WORKDAY
 
         if self.observed:
             self._populate_observed(self.dts_observed)
@@ -50,6 +50,9 @@ class SaudiArabia(ObservedHolidayBase, IslamicHolidays, StaticHolidays):
     # %s (observed, estimated).
     observed_estimated_label = tr("(تقدير ملاحظة) %s")
     supported_languages = ("ar", "en_US")
+    # The resting days are Friday and Saturday since June 28th, 2013.
+    weekend = {FRI, SAT}
+    weekend_history = {2013: {THU, FRI}}
 
     def __init__(self, *args, **kwargs):
         IslamicHolidays.__init__(self)
@@ -75,7 +78,6 @@ class SaudiArabia(ObservedHolidayBase, IslamicHolidays, StaticHolidays):
             if self._year <= 2012
             else FRI_TO_PREV_THU + SAT_TO_NEXT_SUN
         )
-        self.weekend = {THU, FRI} if self._year <= 2012 else {FRI, SAT}
 
         # Eid al-Fitr Holiday
         eid_al_fitr_name = tr("عطلة عيد الفطر")
@@ -0,0 +1,102 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import warnings
+from typing import Optional
+
+from holidays.db.builder import build_database
+from holidays.db.reader import DEFAULT_PATH, DEFAULT_YEARS
+
+
+def main(args: Optional[list[str]] = None) -> None:
+    """Build holidays database: ``python -m holidays.db``."""
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m holidays.db",
+        description=(
+            "Precompute the holidays of every entity, subdivision and category "
+            "into a database file."
+        ),
+    )
+    arg_parser.add_argument(
+        "-c",
+        "--country",
+        action="extend",
+        nargs="+",
+        default=[],
+        help="Country codes to precompute (all entities by default)",
+        type=str,
+    )
+    arg_parser.add_argument(
+        "-m",
+        "--market",
+        action="extend",
+        nargs="+",
+        default=[],
+        help="Market codes to precompute (all entities by default)",
+        type=str,
+    )
+    arg_parser.add_argument(
+        "-l",
+        "--language",
+        action="extend",
+        nargs="+",
+        help="Holiday names languages (the entity default language by default)",
+        type=str,
+    )
+    arg_parser.add_argument(
+        "--start-year",
+        default=DEFAULT_YEARS[0],
+        help="The first year to precompute",
+        type=int,
+    )
+    arg_parser.add_argument(
+        "--end-year",
+        default=DEFAULT_YEARS[-1],
+        help="The last year to precompute",
+        type=int,
+    )
+    arg_parser.add_argument(
+        "-o",
+        "--output",
+        default=str(DEFAULT_PATH),
+        help="The database file path (the package data file by default)",
+        type=str,
+    )
+    arg_parser.add_argument(
+        "-j",
+        "--processes",
+        help="The number of worker processes (the number of CPUs by default)",
+        type=int,
+    )
+
+    parsed_args = arg_parser.parse_args(args)
+    if parsed_args.start_year > parsed_args.end_year:
+        arg_parser.error("the start year must not be greater than the end year")
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            build_database(
+                parsed_args.output,
+                parsed_args.country,
+                parsed_args.market,
+                parsed_args.language or (None,),
+                range(parsed_args.start_year, parsed_args.end_year + 1),
+                parsed_args.processes,
+            )
+    except ValueError as e:
+        arg_parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
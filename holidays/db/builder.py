@@ -0,0 +1,265 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import sys
+from array import array
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+from holidays.db.reader import (
+    CALENDAR_FIELDS,
+    DEFAULT_PATH,
+    DEFAULT_YEARS,
+    HEADER,
+    MAGIC,
+    get_calendar_key,
+)
+from holidays.holiday_base import HolidayBase
+from holidays.utils import list_supported_countries, list_supported_financial
+
+
+class CalendarTask(NamedTuple):
+    """A database calendar: an entity holidays for a subdivision, a set of
+    categories and a language."""
+
+    entity: str
+    """The entity ISO code (e.g., US or XNYS)."""
+    subdiv: Optional[str]
+    """The subdivision code, None for the entity common holidays."""
+    categories: tuple[str, ...]
+    """The holiday categories."""
+    language: Optional[str]
+    """The holiday names language, None for the entity default language."""
+
+
+class Calendar(NamedTuple):
+    """A precomputed database calendar."""
+
+    holidays: list[tuple[int, str]]
+    """The holiday date ordinals and names sorted by date."""
+    workdays: list[int]
+    """The weekend workday date ordinals sorted by date."""
+    weekends: bytes
+    """The weekend days bit masks (Monday is the lowest bit) for each year."""
+
+
+def _get_entity_class(code: str) -> type[HolidayBase]:
+    import holidays
+
+    return getattr(holidays, code)
+
+
+def get_calendar_tasks(
+    countries: Optional[Iterable[str]] = None,
+    markets: Optional[Iterable[str]] = None,
+    languages: Iterable[Optional[str]] = (None,),
+) -> list[CalendarTask]:
+    """Return the database calendars.
+
+    All supported countries and markets are precomputed if neither country
+    nor market codes are specified. Each entity is precomputed for its common
+    holidays and every subdivision, in every supported category on its own
+    and all of them combined.
+
+    :param countries:
+        The country codes to precompute.
+
+    :param markets:
+        The market codes to precompute.
+
+    :param languages:
+        The holiday names languages, None for the entity default language.
+
+    :return:
+        A list of :class:`CalendarTask` objects sorted by entity code.
+    """
+    codes = {*(countries or ()), *(markets or ())}
+    if not codes:
+        codes = {
+            *list_supported_countries(include_aliases=False),
+            *list_supported_financial(include_aliases=False),
+        }
+    elif unknown_codes := {
+        code
+        for code in codes
+        if code not in list_supported_countries() and code not in list_supported_financial()
+    }:
+        raise ValueError(f"Entity is not supported: {', '.join(sorted(unknown_codes))}.")
+
+    tasks = []
+    # The alias classes (e.g., US and USA) are deduplicated by the entity code.
+    entity_classes: dict[str, type[HolidayBase]] = {}
+    for entity_cls in map(_get_entity_class, codes):
+        entity_classes[getattr(entity_cls, "country", None) or entity_cls.market] = entity_cls
+
+    for entity_code, entity_cls in entity_classes.items():
+        categories = sorted(entity_cls.supported_categories)
+        categories_sets: list[tuple[str, ...]] = [(category,) for category in categories]
+        if len(categories) > 1:
+            categories_sets.append(tuple(categories))
+        for subdiv in (None, *entity_cls.subdivisions):
+            for category_set in categories_sets:
+                for language in languages:
+                    tasks.append(CalendarTask(entity_code, subdiv, category_set, language))
+
+    return sorted(tasks, key=lambda task: get_calendar_key(*task))
+
+
+def get_calendar(task: CalendarTask, years: Iterable[int] = DEFAULT_YEARS) -> Calendar:
+    """Precompute the calendar for the years.
+
+    Holidays the years populate outside of the years range are skipped. The
+    entity default language is used explicitly, so the names don't depend on
+    the ``gettext`` environment variables.
+    """
+    years = list(years)
+    entity_cls = _get_entity_class(task.entity)
+    holidays = entity_cls(
+        subdiv=task.subdiv,
+        categories=task.categories,
+        language=task.language or entity_cls.default_language,
+        years=years,
+    )
+    start, end = min(years), max(years)
+    return Calendar(
+        [
+            (dt.toordinal(), name)
+            for dt, name in sorted(holidays.items())
+            if start <= dt.year <= end
+        ],
+        sorted(dt.toordinal() for dt in holidays.weekend_workdays if start <= dt.year <= end),
+        bytes(
+            sum(1 << weekday for weekday in holidays._get_weekend(year))
+            for year in range(start, end + 1)
+        ),
+    )
+
+
+def _to_bytes(values: Union[array, list[int]]) -> bytes:
+    """Return the values as little-endian unsigned 32-bit integers."""
+    values = array("I", values)
+    if sys.byteorder != "little":
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def _write_database(
+    path: Union[str, Path],
+    years: range,
+    tasks: list[CalendarTask],
+    calendars: Iterable[Calendar],
+) -> None:
+    name_ids: dict[str, int] = {}
+
+    def get_name_id(name: str) -> int:
+        return name_ids.setdefault(name, len(name_ids))
+
+    index: list[int] = []
+    ordinals = array("I")
+    holiday_name_ids = array("I")
+    workdays = array("I")
+    weekends = bytearray()
+    default_calendars = []
+    for task, calendar in zip(tasks, calendars):
+        entry = (len(ordinals), len(calendar.holidays), len(workdays), len(calendar.workdays))
+        index.extend((get_name_id(get_calendar_key(*task)), *entry))
+        weekends.extend(calendar.weekends)
+        # The entity default category calendar is keyed as the default categories one too.
+        if task.categories == (_get_entity_class(task.entity).default_category,):
+            key = get_calendar_key(task.entity, task.subdiv, None, task.language)
+            default_calendars.append((key, entry, calendar.weekends))
+        for ordinal, name in calendar.holidays:
+            ordinals.append(ordinal)
+            holiday_name_ids.append(get_name_id(name))
+        workdays.extend(calendar.workdays)
+
+    for key, entry, calendar_weekends in default_calendars:
+        index.extend((get_name_id(key), *entry))
+        weekends.extend(calendar_weekends)
+
+    encoded_names = [name.encode("UTF-8") for name in name_ids]
+    name_offsets = [0]
+    for encoded_name in encoded_names:
+        name_offsets.append(name_offsets[-1] + len(encoded_name))
+
+    with open(path, "wb") as file:
+        file.write(
+            HEADER.pack(
+                MAGIC,
+                years.start,
+                years.stop - 1,
+                len(encoded_names),
+                len(index) // CALENDAR_FIELDS,
+                len(ordinals),
+                len(workdays),
+            )
+        )
+        for values in (name_offsets, index, ordinals, holiday_name_ids, workdays):
+            file.write(_to_bytes(values))
+        file.write(weekends)
+        file.write(b"".join(encoded_names))
+
+
+def build_database(
+    path: Union[str, Path] = DEFAULT_PATH,
+    countries: Optional[Iterable[str]] = None,
+    markets: Optional[Iterable[str]] = None,
+    languages: Iterable[Optional[str]] = (None,),
+    years: Iterable[int] = DEFAULT_YEARS,
+    processes: Optional[int] = None,
+) -> int:
+    """Precompute the holidays into a database file.
+
+    The file is a header followed by little-endian unsigned 32-bit integer
+    arrays: the name offsets, the calendar index, the holiday date ordinals
+    and name ids sorted by date within each calendar, the weekend workday
+    date ordinals; then the per year weekend bit masks of each calendar and
+    the UTF-8 encoded names (including the calendar keys).
+
+    :param path:
+        The database file path (the package data file by default).
+
+    :param countries:
+        The country codes to precompute (see :func:`get_calendar_tasks`).
+
+    :param markets:
+        The market codes to precompute (see :func:`get_calendar_tasks`).
+
+    :param languages:
+        The holiday names languages, None for the entity default language.
+
+    :param years:
+        The years to precompute, every year between the first and the last
+        one is included.
+
+    :param processes:
+        The number of worker processes (the number of CPUs by default), 1 to
+        precompute the calendars in the current process.
+
+    :return:
+        The number of precomputed calendars.
+    """
+    years = list(years)
+    years = range(min(years), max(years) + 1)
+    tasks = get_calendar_tasks(countries, markets, languages)
+    get = partial(get_calendar, years=years)
+    if processes == 1:
+        _write_database(path, years, tasks, map(get, tasks))
+    else:
+        with ProcessPoolExecutor(processes) as executor:
+            _write_database(path, years, tasks, executor.map(get, tasks, chunksize=16))
+
+    return len(tasks)
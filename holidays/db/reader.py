@@ -0,0 +1,280 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import date
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from holidays.holiday_base import DateLike, HolidayBase
+
+DEFAULT_PATH = Path(__file__).with_name("holidays.db")
+"""The package data database file path."""
+
+DEFAULT_YEARS = range(1950, 2051)
+"""The default precomputed years range."""
+
+HEADER = struct.Struct("<8s6I")
+"""The file header: magic, start and end years, names, calendars, holidays
+and weekend workdays counts."""
+
+MAGIC = b"HOLIDB01"
+
+CALENDAR_FIELDS = 5
+"""The calendar index entry fields: key name id, holidays start and count,
+weekend workdays start and count."""
+
+
+def get_calendar_key(
+    entity: str,
+    subdiv: Optional[str] = None,
+    categories: Optional[Union[str, Iterable[str]]] = None,
+    language: Optional[str] = None,
+) -> str:
+    """Return the database calendar key.
+
+    The default categories are keyed by an empty string, the other ones by
+    their sorted comma separated names.
+    """
+    if isinstance(categories, str):
+        categories = (categories,)
+
+    return "\t".join(
+        (entity, subdiv or "", ",".join(sorted(set(categories or ()))), language or "")
+    )
+
+
+class HolidayDatabase:
+    """A precomputed holidays database reader.
+
+    The database file (see :func:`holidays.db.builder.build_database`) is
+    memory-mapped and holidays are looked up with binary search, no holidays
+    are populated. Dates outside of the precomputed years range as well as
+    subdivisions, categories and languages missing from the database are
+    looked up in the entity holidays populated on the fly.
+
+    Example:
+
+    >>> from holidays.db.reader import HolidayDatabase
+    >>> with HolidayDatabase("holidays.db") as db:  # doctest: +SKIP
+    ...     db.get("US", "2024-07-04")
+    'Independence Day'
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_PATH) -> None:
+        """
+        :param path:
+            The database file path (the package data file by default).
+        """
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            self.start_year,
+            self.end_year,
+            names_count,
+            calendars_count,
+            holidays_count,
+            workdays_count,
+        ) = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not a holidays database file: {path}.")
+
+        self._views: list[memoryview] = []
+        offset = HEADER.size
+        self._name_offsets, offset = self._get_array(offset, names_count + 1)
+        calendars, offset = self._get_array(offset, calendars_count * CALENDAR_FIELDS)
+        self._ordinals, offset = self._get_array(offset, holidays_count)
+        self._name_ids, offset = self._get_array(offset, holidays_count)
+        self._workdays, offset = self._get_array(offset, workdays_count)
+        years_count = self.end_year - self.start_year + 1
+        self._weekends = self._get_view(offset, calendars_count * years_count)
+        self._names_offset = offset + calendars_count * years_count
+
+        self._calendars: dict[str, tuple[int, int, int, int, int]] = {}
+        for idx in range(calendars_count):
+            key_id, *slices = calendars[idx * CALENDAR_FIELDS : (idx + 1) * CALENDAR_FIELDS]
+            holidays_start, holidays_count, workdays_start, workdays_count = slices
+            self._calendars[self._get_name(key_id)] = (
+                idx * years_count,
+                holidays_start,
+                holidays_start + holidays_count,
+                workdays_start,
+                workdays_start + workdays_count,
+            )
+        self._live_holidays: dict[str, HolidayBase] = {}
+        self._parser = HolidayBase(expand=False)
+
+    def __enter__(self) -> "HolidayDatabase":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _get_view(self, offset: int, size: int) -> memoryview:
+        view = memoryview(self._mmap)[offset : offset + size]
+        self._views.append(view)
+        return view
+
+    def _get_array(self, offset: int, count: int) -> tuple[Any, int]:
+        """Return the little-endian unsigned 32-bit integers array at the
+        offset and the offset following it."""
+        view = self._get_view(offset, count * 4)
+        if sys.byteorder == "little":
+            values = view.cast("I")
+            self._views.append(values)
+            return values, offset + count * 4
+
+        swapped_values = array("I", view)
+        swapped_values.byteswap()
+        return swapped_values, offset + count * 4
+
+    def _get_name(self, name_id: int) -> str:
+        start = self._names_offset + self._name_offsets[name_id]
+        end = self._names_offset + self._name_offsets[name_id + 1]
+        return self._mmap[start:end].decode("UTF-8")
+
+    def _get_live_holidays(self, calendar_key: str) -> HolidayBase:
+        """Return the calendar holidays populated on the fly."""
+        if calendar_key not in self._live_holidays:
+            import holidays
+            from holidays.utils import list_supported_countries, list_supported_financial
+
+            entity, subdiv, categories, language = calendar_key.split("\t")
+            if (
+                entity not in list_supported_countries()
+                and entity not in list_supported_financial()
+            ):
+                raise ValueError(f"Entity is not supported: {entity}.")
+
+            entity_cls = getattr(holidays, entity)
+            self._live_holidays[calendar_key] = entity_cls(
+                subdiv=subdiv or None,
+                categories=categories.split(",") if categories else None,
+                language=language or entity_cls.default_language,
+            )
+
+        return self._live_holidays[calendar_key]
+
+    def _lookup(
+        self,
+        entity: str,
+        key: DateLike,
+        subdiv: Optional[str],
+        categories: Optional[Union[str, Iterable[str]]],
+        language: Optional[str],
+    ) -> tuple[date, str, Optional[tuple[int, int, int, int, int]]]:
+        """Return the date, the calendar key and the calendar index entry,
+        None if the date has to be looked up on the fly."""
+        dt = key if type(key) is date else self._parser.__keytransform__(key)
+        calendar_key = get_calendar_key(entity, subdiv, categories, language)
+        if self.start_year <= dt.year <= self.end_year:
+            return dt, calendar_key, self._calendars.get(calendar_key)
+
+        return dt, calendar_key, None
+
+    def _get_name_id(self, dt: date, start: int, end: int) -> Optional[int]:
+        ordinal = dt.toordinal()
+        idx = bisect_left(self._ordinals, ordinal, start, end)
+        return self._name_ids[idx] if idx < end and self._ordinals[idx] == ordinal else None
+
+    def close(self) -> None:
+        """Close the database file."""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mmap.close()
+
+    def get(
+        self,
+        entity: str,
+        key: DateLike,
+        subdiv: Optional[str] = None,
+        categories: Optional[Union[str, Iterable[str]]] = None,
+        language: Optional[str] = None,
+        default: Any = None,
+    ) -> Union[str, Any]:
+        """Return the holiday name for a date if it's a holiday, else default.
+
+        :param entity:
+            The entity ISO code (e.g., US or XNYS).
+
+        :param key:
+            The date expressed as :class:`~holidays.holiday_base.DateLike`.
+
+        :param subdiv:
+            The subdivision code.
+
+        :param categories:
+            The holiday categories (the entity default category by default).
+
+        :param language:
+            The holiday names language (the entity default language by
+            default, regardless of the ``gettext`` environment variables).
+
+        :param default:
+            The default value to return if no match is found.
+
+        :return:
+            The same name the entity holidays object would return.
+        """
+        dt, calendar_key, calendar = self._lookup(entity, key, subdiv, categories, language)
+        if calendar is None:
+            return self._get_live_holidays(calendar_key).get(dt, default)
+
+        name_id = self._get_name_id(dt, calendar[1], calendar[2])
+        return default if name_id is None else self._get_name(name_id)
+
+    def is_holiday(
+        self,
+        entity: str,
+        key: DateLike,
+        subdiv: Optional[str] = None,
+        categories: Optional[Union[str, Iterable[str]]] = None,
+        language: Optional[str] = None,
+    ) -> bool:
+        """Return True if the date is a holiday, see :meth:`get` for the
+        arguments."""
+        dt, calendar_key, calendar = self._lookup(entity, key, subdiv, categories, language)
+        if calendar is None:
+            return dt in self._get_live_holidays(calendar_key)
+
+        return self._get_name_id(dt, calendar[1], calendar[2]) is not None
+
+    def is_working_day(
+        self,
+        entity: str,
+        key: DateLike,
+        subdiv: Optional[str] = None,
+        categories: Optional[Union[str, Iterable[str]]] = None,
+        language: Optional[str] = None,
+    ) -> bool:
+        """Return True if the date is a working day (not a holiday or a
+        weekend), see :meth:`get` for the arguments."""
+        dt, calendar_key, calendar = self._lookup(entity, key, subdiv, categories, language)
+        if calendar is None:
+            return self._get_live_holidays(calendar_key).is_working_day(dt)
+
+        weekend = self._weekends[calendar[0] + dt.year - self.start_year]
+        if weekend >> dt.weekday() & 1:
+            ordinal = dt.toordinal()
+            idx = bisect_left(self._workdays, ordinal, calendar[3], calendar[4])
+            return idx < calendar[4] and self._workdays[idx] == ordinal
+
+        return self._get_name_id(dt, calendar[1], calendar[2]) is None
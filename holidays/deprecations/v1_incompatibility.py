@@ -37,7 +37,21 @@ class FutureIncompatibilityWarning(DeprecationWarning):
     pass
 
 
-warnings.warn(
-    FUTURE_INCOMPATIBILITY_WARNING_TEMPLATE.format(version=__version__),
-    FutureIncompatibilityWarning,
-)
+_is_future_incompatibility_warned = False
+
+
+def _warn_future_incompatibility() -> None:
+    """Emit the future incompatibility warning once per process.
+
+    It's called on the first holidays object instantiation rather than at
+    the package import time in order to keep the import cheap.
+    """
+    global _is_future_incompatibility_warned
+    if _is_future_incompatibility_warned:
+        return None
+
+    _is_future_incompatibility_warned = True
+    warnings.warn(
+        FUTURE_INCOMPATIBILITY_WARNING_TEMPLATE.format(version=__version__),
+        FutureIncompatibilityWarning,
+    )
@@ -0,0 +1,125 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import sys
+import warnings
+from importlib.util import find_spec
+from typing import Optional
+
+from holidays.export.rows import DEFAULT_YEARS, get_export_tasks, iter_rows
+from holidays.export.writers import write_arrow, write_csv, write_jsonl
+
+FORMATS = ("csv", "jsonl", "arrow", "parquet")
+
+
+def main(args: Optional[list[str]] = None) -> None:
+    """Export holidays dataset: ``python -m holidays.export``."""
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m holidays.export",
+        description=(
+            "Export the holidays of every entity, subdivision, category and language "
+            "as a dataset."
+        ),
+    )
+    arg_parser.add_argument(
+        "-c",
+        "--country",
+        action="extend",
+        nargs="+",
+        default=[],
+        help="Country codes to export (all entities by default)",
+        type=str,
+    )
+    arg_parser.add_argument(
+        "-m",
+        "--market",
+        action="extend",
+        nargs="+",
+        default=[],
+        help="Market codes to export (all entities by default)",
+        type=str,
+    )
+    arg_parser.add_argument(
+        "-l",
+        "--language",
+        action="extend",
+        nargs="+",
+        help="Languages to export (all supported languages by default)",
+        type=str,
+    )
+    arg_parser.add_argument(
+        "--start-year",
+        default=DEFAULT_YEARS[0],
+        help="The first year to export",
+        type=int,
+    )
+    arg_parser.add_argument(
+        "--end-year",
+        default=DEFAULT_YEARS[-1],
+        help="The last year to export",
+        type=int,
+    )
+    arg_parser.add_argument(
+        "-f",
+        "--format",
+        choices=FORMATS,
+        default="csv",
+        help="The output file format",
+        type=str,
+    )
+    arg_parser.add_argument(
+        "-o",
+        "--output",
+        help="The output file path (stdout by default, required for arrow and parquet)",
+        type=str,
+    )
+    arg_parser.add_argument(
+        "-j",
+        "--processes",
+        help="The number of worker processes (the number of CPUs by default)",
+        type=int,
+    )
+
+    parsed_args = arg_parser.parse_args(args)
+    if parsed_args.format in {"arrow", "parquet"}:
+        if not parsed_args.output:
+            arg_parser.error(f"the {parsed_args.format} format requires an output file path")
+        if find_spec("pyarrow") is None:
+            arg_parser.error(f"the {parsed_args.format} format requires pyarrow to be installed")
+
+    try:
+        tasks = get_export_tasks(parsed_args.country, parsed_args.market, parsed_args.language)
+    except ValueError as e:
+        arg_parser.error(str(e))
+
+    rows = iter_rows(
+        tasks,
+        range(parsed_args.start_year, parsed_args.end_year + 1),
+        processes=parsed_args.processes,
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        if parsed_args.format in {"arrow", "parquet"}:
+            write_arrow(rows, parsed_args.output, parsed_args.format)
+            return None
+
+        write = write_csv if parsed_args.format == "csv" else write_jsonl
+        if parsed_args.output:
+            with open(parsed_args.output, "w", encoding="UTF-8", newline="") as file:
+                write(rows, file)
+        else:
+            write(rows, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
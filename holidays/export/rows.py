@@ -0,0 +1,230 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date
+from typing import NamedTuple, Optional
+
+from holidays.constants import HOLIDAY_NAME_DELIMITER
+from holidays.holiday_base import HolidayBase
+from holidays.utils import list_supported_countries, list_supported_financial
+
+DEFAULT_YEARS = range(1900, 2101)
+"""The default export years range."""
+
+
+class ExportTask(NamedTuple):
+    """An export unit of work: an entity holidays for a subdivision, category
+    and language."""
+
+    entity: str
+    """The entity ISO code (e.g., US or XNYS)."""
+    subdiv: Optional[str]
+    """The subdivision code, None for the entity common holidays."""
+    category: str
+    """The holidays category."""
+    language: Optional[str]
+    """The holiday names language, None for entities without translations."""
+
+
+class HolidayRow(NamedTuple):
+    """An exported holiday."""
+
+    entity: str
+    """The entity ISO code (e.g., US or XNYS)."""
+    subdiv: Optional[str]
+    """The subdivision code, None for the entity common holidays."""
+    category: str
+    """The holiday category."""
+    language: Optional[str]
+    """The holiday name language, None for entities without translations."""
+    date: date
+    """The holiday date."""
+    name: str
+    """The holiday name."""
+    observed: bool
+    """Whether the holiday is an observed (substituted) one."""
+    estimated: bool
+    """Whether the holiday date is estimated."""
+
+
+def _get_entity_class(code: str) -> type[HolidayBase]:
+    import holidays
+
+    return getattr(holidays, code)
+
+
+def get_export_tasks(
+    countries: Optional[Iterable[str]] = None,
+    markets: Optional[Iterable[str]] = None,
+    languages: Optional[Iterable[str]] = None,
+) -> list[ExportTask]:
+    """Return the export tasks.
+
+    All supported countries and markets are exported if neither country nor
+    market codes are specified. Each entity is exported for its common
+    holidays and every subdivision, in every supported category and language.
+
+    :param countries:
+        The country codes to export.
+
+    :param markets:
+        The market codes to export.
+
+    :param languages:
+        The languages to export the holiday names in (all supported languages
+        by default). Entities supporting none of them are exported in their
+        default language.
+
+    :return:
+        A list of :class:`ExportTask` objects sorted by entity code.
+    """
+    codes = {*(countries or ()), *(markets or ())}
+    if not codes:
+        codes = {
+            *list_supported_countries(include_aliases=False),
+            *list_supported_financial(include_aliases=False),
+        }
+    elif unknown_codes := {
+        code
+        for code in codes
+        if code not in list_supported_countries() and code not in list_supported_financial()
+    }:
+        raise ValueError(f"Entity is not supported: {', '.join(sorted(unknown_codes))}.")
+
+    languages = set(languages) if languages is not None else None
+    tasks = []
+    # The alias classes (e.g., US and USA) are deduplicated by the entity code.
+    entity_classes: dict[str, type[HolidayBase]] = {}
+    for entity_cls in map(_get_entity_class, codes):
+        entity_classes[getattr(entity_cls, "country", None) or entity_cls.market] = entity_cls
+
+    for entity_code, entity_cls in entity_classes.items():
+        entity_languages: list[Optional[str]] = [*sorted(entity_cls.supported_languages)]
+        if languages is not None:
+            entity_languages = [
+                language for language in entity_languages if language in languages
+            ] or [entity_cls.default_language]
+        for subdiv in (None, *entity_cls.subdivisions):
+            for category in entity_cls.supported_categories:
+                for language in entity_languages or [None]:
+                    tasks.append(ExportTask(entity_code, subdiv, category, language))
+
+    return sorted(
+        tasks,
+        key=lambda task: (task.entity, task.subdiv or "", task.category, task.language or ""),
+    )
+
+
+def _get_estimated_labels(holidays: HolidayBase) -> list[list[str]]:
+    """Return the entity estimated holiday labels text parts."""
+    labels = [getattr(holidays, "estimated_label", "%s (estimated)")]
+    if observed_estimated_label := getattr(holidays, "observed_estimated_label", None):
+        labels.append(observed_estimated_label)
+
+    return [
+        [part.strip() for part in holidays.tr(label).split("%s") if part.strip()]
+        for label in labels
+    ]
+
+
+def iter_task_rows(task: ExportTask, years: Iterable[int] = DEFAULT_YEARS) -> Iterator[HolidayRow]:
+    """Generate the export task holidays.
+
+    An observed holiday is a holiday name missing from the same entity
+    holidays populated without the observed rules, an estimated one is a
+    holiday name containing the entity estimated label text.
+
+    :param task:
+        The export task.
+
+    :param years:
+        The years to export.
+
+    :return:
+        An iterator of :class:`HolidayRow` objects sorted by date.
+    """
+    entity_cls = _get_entity_class(task.entity)
+    observed_holidays = entity_cls(
+        subdiv=task.subdiv, categories=task.category, language=task.language, years=years
+    )
+    holidays = entity_cls(
+        observed=False,
+        subdiv=task.subdiv,
+        categories=task.category,
+        language=task.language,
+        years=years,
+    )
+    estimated_labels = _get_estimated_labels(observed_holidays)
+
+    for dt, names in sorted(observed_holidays.items()):
+        not_observed_names = set(dict.get(holidays, dt, "").split(HOLIDAY_NAME_DELIMITER))
+        for name in names.split(HOLIDAY_NAME_DELIMITER):
+            yield HolidayRow(
+                task.entity,
+                task.subdiv,
+                task.category,
+                task.language,
+                dt,
+                name,
+                name not in not_observed_names,
+                any(all(part in name for part in parts) for parts in estimated_labels),
+            )
+
+
+def get_task_rows(task: ExportTask, years: Iterable[int] = DEFAULT_YEARS) -> list[HolidayRow]:
+    """Return the export task holidays, see :func:`iter_task_rows`."""
+    return list(iter_task_rows(task, years))
+
+
+def iter_rows(
+    tasks: Iterable[ExportTask],
+    years: Iterable[int] = DEFAULT_YEARS,
+    processes: Optional[int] = None,
+) -> Iterator[HolidayRow]:
+    """Generate the export tasks holidays in the tasks order.
+
+    The tasks are run in a process pool. To keep the memory bounded, at most
+    two tasks per process are queued or waiting to be consumed at a time.
+
+    :param tasks:
+        The export tasks.
+
+    :param years:
+        The years to export.
+
+    :param processes:
+        The number of worker processes (the number of CPUs by default), 1 to
+        run the tasks in the current process.
+
+    :return:
+        An iterator of :class:`HolidayRow` objects.
+    """
+    years = list(years)
+    if processes == 1:
+        for task in tasks:
+            yield from iter_task_rows(task, years)
+        return None
+
+    with ProcessPoolExecutor(processes) as executor:
+        max_pending = 2 * (processes or os.cpu_count() or 1)
+        pending: deque[Future] = deque()
+        for task in tasks:
+            pending.append(executor.submit(get_task_rows, task, years))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,134 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import csv
+import json
+from collections.abc import Iterable
+from itertools import islice
+from typing import TextIO
+
+from holidays.export.rows import HolidayRow
+
+BATCH_SIZE = 65536
+"""The number of rows per Arrow record batch (Parquet row group)."""
+
+
+def write_csv(rows: Iterable[HolidayRow], file: TextIO) -> int:
+    """Write the rows as CSV with a header line.
+
+    Missing subdivisions and languages are written as empty strings, the
+    flags as ``true`` or ``false``.
+
+    :return:
+        The number of written rows.
+    """
+    writer = csv.writer(file, lineterminator="\n")
+    writer.writerow(HolidayRow._fields)
+    count = 0
+    for row in rows:
+        writer.writerow(
+            (
+                row.entity,
+                row.subdiv or "",
+                row.category,
+                row.language or "",
+                row.date.isoformat(),
+                row.name,
+                "true" if row.observed else "false",
+                "true" if row.estimated else "false",
+            )
+        )
+        count += 1
+
+    return count
+
+
+def write_jsonl(rows: Iterable[HolidayRow], file: TextIO) -> int:
+    """Write the rows as JSON Lines, one JSON object per row.
+
+    :return:
+        The number of written rows.
+    """
+    count = 0
+    for row in rows:
+        file.write(json.dumps({**row._asdict(), "date": row.date.isoformat()}, ensure_ascii=False))
+        file.write("\n")
+        count += 1
+
+    return count
+
+
+def write_arrow(
+    rows: Iterable[HolidayRow],
+    path: str,
+    file_format: str = "arrow",
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """Write the rows as an Arrow IPC or a Parquet file.
+
+    The rows are written in batches, so only one batch is held in memory at
+    a time. Requires ``pyarrow`` to be installed.
+
+    :param rows:
+        The rows to write.
+
+    :param path:
+        The output file path.
+
+    :param file_format:
+        The output file format: ``arrow`` or ``parquet``.
+
+    :param batch_size:
+        The number of rows per record batch (Parquet row group).
+
+    :return:
+        The number of written rows.
+    """
+    import pyarrow as pa
+
+    if file_format == "arrow":
+        get_writer = pa.ipc.new_file
+    elif file_format == "parquet":
+        import pyarrow.parquet as pq
+
+        get_writer = pq.ParquetWriter
+    else:
+        raise ValueError(f"Unknown file format: {file_format}.")
+
+    schema = pa.schema(
+        (
+            ("entity", pa.string()),
+            ("subdiv", pa.string()),
+            ("category", pa.string()),
+            ("language", pa.string()),
+            ("date", pa.date32()),
+            ("name", pa.string()),
+            ("observed", pa.bool_()),
+            ("estimated", pa.bool_()),
+        )
+    )
+    count = 0
+    rows = iter(rows)
+    with get_writer(path, schema) as writer:
+        while batch := list(islice(rows, batch_size)):
+            writer.write_batch(
+                pa.RecordBatch.from_arrays(
+                    [
+                        pa.array(column, type=field.type)
+                        for column, field in zip(zip(*batch), schema)
+                    ],
+                    schema=schema,
+                )
+            )
+            count += len(batch)
+
+    return count
@@ -10,7 +10,9 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
-from holidays.calendars.gregorian import DEC
+from datetime import date, time
+
+from holidays.calendars.gregorian import JAN, DEC
 from holidays.groups import ChristianHolidays, InternationalHolidays, StaticHolidays
 from holidays.holiday_base import HolidayBase
 
@@ -27,6 +29,10 @@ class EuropeanCentralBank(HolidayBase, ChristianHolidays, InternationalHolidays)
     market = "XECB"
     start_year = 2000
 
+    timezone = "Europe/Berlin"
+    # TARGET2 operating day (open, close) times.
+    session_hours = ((date(2000, JAN, 1), time(7), time(18)),)
+
     def __init__(self, *args, **kwargs):
         ChristianHolidays.__init__(self)
         InternationalHolidays.__init__(self)
@@ -10,7 +10,7 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date
+from datetime import date, time
 
 from holidays.calendars.gregorian import (
     JAN,
@@ -27,6 +27,7 @@ from holidays.calendars.gregorian import (
     DEC,
     _timedelta,
 )
+from holidays.constants import HALF_DAY, PUBLIC
 from holidays.groups import ChristianHolidays, InternationalHolidays, StaticHolidays
 from holidays.observed_holiday_base import ObservedHolidayBase, SAT_TO_PREV_FRI, SUN_TO_NEXT_MON
 
@@ -46,6 +47,18 @@ class NewYorkStockExchange(
     market = "XNYS"
     observed_label = "%s (observed)"
     start_year = 1863
+    supported_categories = (HALF_DAY, PUBLIC)
+
+    timezone = "America/New_York"
+    # Regular trading session (open, close) times changes.
+    session_hours = (
+        (date(1863, JAN, 1), time(10), time(15)),
+        (date(1952, SEP, 29), time(10), time(15, 30)),
+        (date(1974, OCT, 1), time(10), time(16)),
+        (date(1985, SEP, 30), time(9, 30), time(16)),
+    )
+    # Half day (early close) sessions close time.
+    early_close_time = time(13)
 
     def __init__(self, *args, **kwargs):
         ChristianHolidays.__init__(self)
@@ -137,6 +150,31 @@ class NewYorkStockExchange(
             for dt in (_timedelta(begin, n) for n in range(0, (end - begin).days + 1, 7)):
                 self._add_holiday("Paper Crisis", dt)
 
+    def _populate_half_day_holidays(self):
+        # Early closes at 1:00 pm.
+        if self._year <= 1992:
+            return None
+
+        # Day before Independence Day, on Wednesdays since 2013 only.
+        if self._year >= 1995 and (
+            self._is_monday(JUL, 3)
+            or self._is_tuesday(JUL, 3)
+            or (self._is_wednesday(JUL, 3) and self._year >= 2013)
+            or self._is_thursday(JUL, 3)
+        ):
+            self._add_holiday_jul_3("Day before Independence Day")
+
+        # Day after Independence Day, on Fridays until 2012.
+        if 1995 <= self._year <= 2012 and self._is_friday(JUL, 5):
+            self._add_holiday_jul_5("Day after Independence Day")
+
+        # Day after Thanksgiving.
+        self._add_holiday_1_day_past_4th_thu_of_nov("Day after Thanksgiving")
+
+        # Christmas Eve.
+        if not (self._is_friday(DEC, 24) or self._is_weekend(DEC, 24)):
+            self._add_christmas_eve("Christmas Eve")
+
 
 class XNYS(NewYorkStockExchange):
     pass
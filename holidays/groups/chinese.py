@@ -14,7 +14,11 @@ from datetime import date
 from typing import Optional
 
 from holidays.calendars import _ChineseLunisolar
-from holidays.calendars.gregorian import APR
+from holidays.calendars.lunisolar import (
+    QINGMING_LONGITUDE,
+    WINTER_SOLSTICE_LONGITUDE,
+    _solar_term_date,
+)
 from holidays.groups.eastern import EasternCalendarHolidays
 
 
@@ -36,10 +40,10 @@ class ChineseCalendarHolidays(EasternCalendarHolidays):
 
     @property
     def _qingming_date(self):
-        day = 5
-        if (self._year % 4 < 1) or (self._year % 4 < 2 and self._year >= 2009):
-            day = 4
-        return date(self._year, APR, day)
+        """
+        Return Qingming (Sun longitude 15 degrees solar term) date.
+        """
+        return _solar_term_date(self._year, QINGMING_LONGITUDE)
 
     @property
     def _mid_autumn_festival(self):
@@ -48,6 +52,13 @@ class ChineseCalendarHolidays(EasternCalendarHolidays):
         """
         return self._chinese_calendar.mid_autumn_date(self._year)[0]
 
+    @property
+    def _winter_solstice_date(self):
+        """
+        Return Dongzhi (Sun longitude 270 degrees solar term) date.
+        """
+        return _solar_term_date(self._year, WINTER_SOLSTICE_LONGITUDE)
+
     def _add_chinese_calendar_holiday(
         self, name: str, dt_estimated: tuple[Optional[date], bool], days_delta: int = 0
     ) -> Optional[date]:
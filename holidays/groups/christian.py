@@ -12,9 +12,15 @@
 
 from datetime import date
 
-from dateutil.easter import EASTER_ORTHODOX, EASTER_WESTERN, easter
-
-from holidays.calendars.gregorian import GREGORIAN_CALENDAR, JAN, DEC, _timedelta
+from holidays.calendars.gregorian import (
+    GREGORIAN_CALENDAR,
+    JAN,
+    DEC,
+    EASTER_ORTHODOX,
+    EASTER_WESTERN,
+    _get_easter_date,
+    _timedelta,
+)
 from holidays.calendars.julian import JULIAN_CALENDAR
 from holidays.calendars.julian_revised import JULIAN_REVISED_CALENDAR
 
@@ -27,6 +33,7 @@ class ChristianHolidays:
     def __init__(self, calendar=GREGORIAN_CALENDAR) -> None:
         self.__verify_calendar(calendar)
         self.__calendar = calendar
+        self.__easter_method = self.__get_easter_method(calendar)
 
     def __get_christmas_day(self, calendar=None):
         """
@@ -41,17 +48,22 @@ class ChristianHolidays:
             else date(self._year, DEC, 25)
         )
 
+    def __get_easter_method(self, calendar):
+        """
+        Get Easter Sunday calculation method.
+        """
+        return EASTER_WESTERN if self.__is_gregorian_calendar(calendar) else EASTER_ORTHODOX
+
     def __get_easter_sunday(self, calendar=None):
         """
         Get Easter Sunday date.
         """
-        calendar = calendar or self.__calendar
+        if not calendar:
+            return _get_easter_date(self._year, self.__easter_method)
+
         self.__verify_calendar(calendar)
 
-        return easter(
-            self._year,
-            method=EASTER_WESTERN if self.__is_gregorian_calendar(calendar) else EASTER_ORTHODOX,
-        )
+        return _get_easter_date(self._year, self.__get_easter_method(calendar))
 
     @staticmethod
     def __is_gregorian_calendar(calendar):
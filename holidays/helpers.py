@@ -47,3 +47,15 @@ def _normalize_tuple(value):
         An object put into a tuple otherwise, e.g., ((JAN, 10),).
     """
     return value if not value or isinstance(value[0], tuple) else (value,)
+
+
+def _is_numpy_array(value):
+    """Check whether the value is a NumPy array without importing NumPy.
+
+    :param value:
+        Any object.
+
+    :return:
+        True if `value` type is defined in NumPy package, False otherwise.
+    """
+    return type(value).__module__ == "numpy"
@@ -13,6 +13,7 @@
 __all__ = ("DateLike", "HolidayBase", "HolidaySum")
 
 import copy
+import os
 import warnings
 from calendar import isleap
 from collections.abc import Iterable
@@ -20,9 +21,8 @@ from datetime import date, datetime, timedelta, timezone
 from functools import cached_property
 from gettext import gettext, translation
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, cast
-
-from dateutil.parser import parse
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, Union, cast, overload
 
 from holidays.calendars.gregorian import (
     MON,
@@ -40,7 +40,19 @@ from holidays.calendars.gregorian import (
     WEEKDAYS,
 )
 from holidays.constants import HOLIDAY_NAME_DELIMITER, PUBLIC, DEFAULT_START_YEAR, DEFAULT_END_YEAR
-from holidays.helpers import _normalize_arguments, _normalize_tuple
+from holidays.deprecations.v1_incompatibility import _warn_future_incompatibility
+from holidays.helpers import _is_numpy_array, _normalize_arguments, _normalize_tuple
+from holidays.instrumentation import (
+    CATALOG_CACHE_HIT,
+    CATALOG_CACHE_MISS,
+    CATALOG_LOAD,
+    EXPAND,
+    POPULATE_END,
+    POPULATE_START,
+    Event,
+    _emit,
+    _listeners,
+)
 
 CategoryArg = Union[str, Iterable[str]]
 DateArg = Union[date, tuple[int, int]]
@@ -52,6 +64,10 @@ SubstitutedHoliday = Union[
 ]
 YearArg = Union[int, Iterable[int]]
 
+# The environment variables `gettext` uses for the default languages lookup.
+GETTEXT_ENV_VARS = ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG")
+LOCALE_DIR = str(Path(__file__).with_name("locale"))
+
 
 class HolidayBase(dict[date, str]):
     """
@@ -233,6 +249,9 @@ class HolidayBase(dict[date, str]):
     ones."""
     weekend: set[int] = {SAT, SUN}
     """Country weekend days."""
+    weekend_history: dict[int, set[int]] = {}
+    """Country former weekend days: the weekend days in effect before the year,
+    in ascending years order."""
     weekend_workdays: set[date]
     """Working days moved to weekends."""
     default_category: str = PUBLIC
@@ -298,6 +317,8 @@ class HolidayBase(dict[date, str]):
         """
         super().__init__()
 
+        _warn_future_incompatibility()
+
         # Categories validation.
         if self.default_category and self.default_category not in self.supported_categories:
             raise ValueError("The default category must be listed in supported categories.")
@@ -363,23 +384,15 @@ class HolidayBase(dict[date, str]):
         self.observed = observed
         self.subdiv = subdiv
         self.weekend_workdays = getattr(self, "weekend_workdays", set())
+        # Working days rank tables by year, see `_get_working_days_table`.
+        self._working_days_tables: dict[int, tuple[int, list[int], list[int]]] = {}
 
-        supported_languages = set(self.supported_languages)
-        self.tr = (
-            translation(
-                self._entity_code,
-                fallback=language not in supported_languages,
-                languages=[language] if language in supported_languages else None,
-                localedir=str(Path(__file__).with_name("locale")),
-            ).gettext
-            if self._entity_code is not None
-            else gettext
-        )
+        self.tr = self.__get_translation(language) if self._entity_code is not None else gettext
         self.years = _normalize_arguments(int, years)
 
         # Populate holidays.
         for year in self.years:
-            self._populate(year)
+            self.__populate(year)
 
     def __add__(self, other: Union[int, "HolidayBase", "HolidaySum"]) -> "HolidayBase":
         """Add another dictionary of public holidays creating a
@@ -421,6 +434,10 @@ class HolidayBase(dict[date, str]):
 
         return dict.__contains__(cast("Dict[Any, Any]", self), self.__keytransform__(key))
 
+    def __delitem__(self, key: Any) -> None:
+        dict.__delitem__(self, key)
+        self._clear_working_days_tables()
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, HolidayBase):
             return False
@@ -593,10 +610,7 @@ class HolidayBase(dict[date, str]):
 
         # Key is `str` instance.
         elif isinstance(key, str):
-            try:
-                dt = parse(key).date()
-            except (OverflowError, ValueError):
-                raise ValueError(f"Cannot parse date from string '{key}'")
+            dt = self.__parse_date(key)
 
         # Key is `datetime` instance.
         elif isinstance(key, datetime):
@@ -617,7 +631,9 @@ class HolidayBase(dict[date, str]):
         # Automatically expand for `expand=True` cases.
         if self.expand and dt.year not in self.years:
             self.years.add(dt.year)
-            self._populate(dt.year)
+            if _listeners:
+                _emit(Event(EXPAND, self._entity_code, self.subdiv, dt.year))
+            self.__populate(dt.year)
 
         return dt
 
@@ -634,6 +650,10 @@ class HolidayBase(dict[date, str]):
     def __radd__(self, other: Any) -> "HolidayBase":
         return self.__add__(other)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Copies don't share the working days tables.
+        return {**self.__dict__, "_working_days_tables": {}}
+
     def __reduce__(self) -> Union[str, tuple[Any, ...]]:
         return super().__reduce__()
 
@@ -661,7 +681,9 @@ class HolidayBase(dict[date, str]):
         if self and key in {"categories", "observed"}:
             self.clear()
             for year in self.years:  # Re-populate holidays for each year.
-                self._populate(year)
+                self.__populate(year)
+        elif key in {"weekend", "weekend_history", "weekend_workdays"}:
+            self.__dict__.get("_working_days_tables", {}).clear()
 
     def __setitem__(self, key: DateLike, value: str) -> None:
         if key in self:
@@ -672,6 +694,7 @@ class HolidayBase(dict[date, str]):
             value = HOLIDAY_NAME_DELIMITER.join(sorted(holiday_names))
 
         dict.__setitem__(self, self.__keytransform__(key), value)
+        self._clear_working_days_tables()
 
     def __str__(self) -> str:
         if self:
@@ -684,6 +707,89 @@ class HolidayBase(dict[date, str]):
 
         return f"{{{', '.join(parts)}}}"
 
+    # Translation catalogs cache: (entity code, language, gettext environment) to `gettext`.
+    __translations: dict[tuple[str, Optional[str], Optional[tuple]], Callable[[str], str]] = {}
+
+    def __get_translation(self, language: Optional[str]) -> Callable[[str], str]:
+        """Return the entity translation catalog `gettext` method.
+
+        The catalogs are cached per process. Unsupported languages fall back
+        to the `gettext` environment variables defined languages, so they are
+        a part of the cache key.
+        """
+        supported_language = language if language in self.supported_languages else None
+        cache_key = (
+            str(self._entity_code),
+            supported_language,
+            None if supported_language else tuple(map(os.getenv, GETTEXT_ENV_VARS)),
+        )
+
+        if tr := HolidayBase.__translations.get(cache_key):
+            if _listeners:
+                _emit(Event(CATALOG_CACHE_HIT, self._entity_code, language=supported_language))
+            return tr
+
+        if _listeners:
+            _emit(Event(CATALOG_CACHE_MISS, self._entity_code, language=supported_language))
+        start = perf_counter()
+        tr = translation(
+            self._entity_code,
+            fallback=supported_language is None,
+            languages=[supported_language] if supported_language else None,
+            localedir=LOCALE_DIR,
+        ).gettext
+        if _listeners:
+            _emit(
+                Event(
+                    CATALOG_LOAD,
+                    self._entity_code,
+                    language=supported_language,
+                    duration=perf_counter() - start,
+                )
+            )
+        HolidayBase.__translations[cache_key] = tr
+
+        return tr
+
+    def __populate(self, year: int) -> None:
+        """Populate holidays for a year notifying instrumentation listeners."""
+        # The year populate may add holidays and weekend workdays to the adjacent years.
+        self._clear_working_days_tables()
+        if not _listeners:
+            self._populate(year)
+            return None
+
+        _emit(Event(POPULATE_START, self._entity_code, self.subdiv, year))
+        start = perf_counter()
+        self._populate(year)
+        _emit(
+            Event(
+                POPULATE_END, self._entity_code, self.subdiv, year, duration=perf_counter() - start
+            )
+        )
+
+    @staticmethod
+    def __parse_date(key: str) -> date:
+        """Parse a date string.
+
+        The ISO 8601 `YYYY-MM-DD` strings are parsed directly, while any other
+        format is passed to :func:`dateutil.parser.parse`. The parser module
+        is imported on first use as it's a noticeable part of the package
+        import time.
+        """
+        if len(key) == 10 and key[4] == key[7] == "-":
+            try:
+                return date.fromisoformat(key)
+            except ValueError:
+                pass
+
+        from dateutil.parser import parse
+
+        try:
+            return parse(key).date()
+        except (OverflowError, ValueError):
+            raise ValueError(f"Cannot parse date from string '{key}'")
+
     @property
     def __attribute_names(self):
         return ("country", "expand", "language", "market", "observed", "subdiv", "years")
@@ -805,7 +911,53 @@ class HolidayBase(dict[date, str]):
         """
         dt = args if len(args) > 1 else args[0]
         dt = dt if isinstance(dt, date) else date(self._year, *dt)
-        return dt.weekday() in self.weekend
+        return dt.weekday() in self._get_weekend(dt.year)
+
+    def _get_weekend(self, year: int) -> set[int]:
+        """Return the weekend days of the year."""
+        for end_year, weekend in self.weekend_history.items():
+            if year < end_year:
+                return weekend
+
+        return self.weekend
+
+    def _clear_working_days_tables(self) -> None:
+        """Drop the cached working days rank tables, called on any holidays
+        change."""
+        if self._working_days_tables:
+            self._working_days_tables.clear()
+
+    def _get_working_days_table(self, year: int) -> tuple[int, list[int], list[int]]:
+        """Return the year working days rank table.
+
+        The table is a (year start ordinal, working days counts, working days
+        ordinals) tuple. The n-th count is the number of the year working days
+        before the n-th day of the year (0-based), so a day is a working day
+        if the next count is greater.
+
+        The tables are cached per year until the holidays change.
+        """
+        self.__keytransform__(date(year, 1, 1))  # Populate the year if needed.
+        if table := self._working_days_tables.get(year):
+            return table
+
+        start = date(year, 1, 1).toordinal()
+        weekend = self._get_weekend(year)
+        weekend_workdays = self.weekend_workdays
+        working_days = []
+        counts = [0]
+        for ordinal in range(start, date(year, 12, 31).toordinal() + 1):
+            dt = date.fromordinal(ordinal)
+            if (
+                dt in weekend_workdays
+                if dt.weekday() in weekend
+                else not dict.__contains__(self, dt)
+            ):
+                working_days.append(ordinal)
+            counts.append(len(working_days))
+
+        table = self._working_days_tables[year] = (start, counts, working_days)
+        return table
 
     def _populate(self, year: int) -> None:
         """This is a private class that populates (generates and adds) holidays
@@ -865,6 +1017,106 @@ class HolidayBase(dict[date, str]):
         """Alias for :meth:`update` to mimic list type."""
         return self.update(*args)
 
+    @overload
+    def business_day_offset(  # type: ignore[overload-overlap]
+        self, dates: DateLike, n: int = 0, roll: str = "following"
+    ) -> date: ...
+
+    @overload
+    def business_day_offset(
+        self, dates: Iterable[DateLike], n: int = 0, roll: str = "following"
+    ) -> list[date]: ...
+
+    def business_day_offset(
+        self, dates: Union[DateLike, Iterable[DateLike]], n: int = 0, roll: str = "following"
+    ) -> Union[date, list[date]]:
+        """Return the working days offset by n working days from the dates.
+
+        Non-working dates are first rolled to a working day according to the
+        **roll** rule. The offsets are looked up in per-year working days rank
+        tables cached until the holidays change, which honors both the entity
+        weekend days and the working days moved to weekends.
+
+        :param dates:
+            A date (of any type supported as the object key), a sequence of
+            dates, a NumPy ``datetime64`` scalar or array.
+
+        :param n:
+            The number of working days to offset by, negative for the working
+            days before the dates.
+
+        :param roll:
+            How to roll non-working dates:
+
+            * ``following`` -- to the next working day;
+            * ``preceding`` -- to the previous working day;
+            * ``modified_following`` -- to the next working day unless it
+              falls in the next month, to the previous working day otherwise;
+            * ``modified_preceding`` -- to the previous working day unless it
+              falls in the previous month, to the next working day otherwise.
+
+        :return:
+            A :class:`datetime.date` for a single date, a list of dates for a
+            sequence, a ``datetime64[D]`` scalar or array for a NumPy scalar or
+            array respectively.
+        """
+        if roll not in {"following", "preceding", "modified_following", "modified_preceding"}:
+            raise ValueError(f"Unknown roll: {roll}.")
+
+        def get_working_days(year: int) -> list[int]:
+            return self._get_working_days_table(year)[2]
+
+        def get_working_day(year: int, idx: int) -> tuple[int, int]:
+            """Return (year, index) of the idx-th working day of the year,
+            counting from the adjacent years ones if out of the year range."""
+            while idx >= len(working_days := get_working_days(year)):
+                idx -= len(working_days)
+                year += 1
+            while idx < 0:
+                year -= 1
+                idx += len(get_working_days(year))
+            return year, idx
+
+        def offset(dt: date) -> date:
+            year = dt.year
+            start, counts, _ = self._get_working_days_table(year)
+            day = dt.toordinal() - start
+            idx = counts[day]
+            # A non-working day: `idx` is the next working day, `idx - 1` the previous one.
+            if counts[day + 1] == idx:
+                is_following = roll in {"following", "modified_following"}
+                if not is_following:
+                    idx -= 1
+                if roll.startswith("modified"):
+                    rolled_year, rolled_idx = get_working_day(year, idx)
+                    rolled_dt = date.fromordinal(get_working_days(rolled_year)[rolled_idx])
+                    if rolled_dt.month != dt.month:
+                        idx += -1 if is_following else +1
+
+            year, idx = get_working_day(year, idx + n)
+            return date.fromordinal(get_working_days(year)[idx])
+
+        if isinstance(dates, (date, str, float, int)):
+            return offset(self.__keytransform__(dates))
+
+        if _is_numpy_array(dates):
+            import numpy as np
+
+            array = cast(Any, dates)
+            offsets: Any = np.array(
+                [offset(dt) for dt in array.astype("datetime64[D]").ravel().tolist()],
+                dtype="datetime64[D]",
+            ).reshape(array.shape)
+            # A 0-d array is converted back to a scalar for a `datetime64` scalar.
+            return offsets if isinstance(array, np.ndarray) else offsets[()]
+
+        return [offset(self.__keytransform__(dt)) for dt in dates]
+
+    def clear(self) -> None:
+        """Remove all holidays."""
+        dict.clear(self)
+        self._clear_working_days_tables()
+
     def copy(self):
         """Return a copy of the object."""
         return copy.copy(self)
@@ -1019,10 +1271,12 @@ class HolidayBase(dict[date, str]):
         :raise:
             KeyError if date is not a holiday and default is not given.
         """
+        dt = self.__keytransform__(key)
+        self._clear_working_days_tables()
         if default is None:
-            return dict.pop(self, self.__keytransform__(key))
+            return dict.pop(self, dt)
 
-        return dict.pop(self, self.__keytransform__(key), default)
+        return dict.pop(self, dt, default)
 
     def pop_named(self, name: str) -> list[date]:
         """Remove (no longer treat at as holiday) all dates matching the
@@ -1062,6 +1316,81 @@ class HolidayBase(dict[date, str]):
 
         return popped
 
+    def popitem(self) -> tuple[date, str]:
+        """Remove and return the last added (date, holiday name) pair."""
+        self._clear_working_days_tables()
+        return dict.popitem(self)
+
+    def to_busdaycalendar(self, start: DateLike, end: DateLike):
+        """Return a :class:`numpy.busdaycalendar` of the working days.
+
+        The weekmask is built from the weekend days and the holidays list from
+        the holidays of the date range. Weekend changes and working days moved
+        to weekends can't be expressed with a single weekmask: if the range has
+        any, the weekmask marks every day as valid and the range non-working
+        weekend days are listed as holidays instead, so the calendar is only
+        exact within the range.
+
+        Requires NumPy to be installed.
+
+        :param start:
+            The range start date.
+
+        :param end:
+            The range end date.
+        """
+        import numpy as np
+
+        dt1 = self.__keytransform__(start)
+        dt2 = self.__keytransform__(end)
+        if dt1 > dt2:
+            dt1, dt2 = dt2, dt1
+        for year in range(dt1.year + 1, dt2.year):
+            self.__keytransform__(date(year, 1, 1))
+
+        dts = np.array(list(self), dtype="datetime64[D]")
+        holidays = dts[(dts >= np.datetime64(dt1, "D")) & (dts <= np.datetime64(dt2, "D"))]
+        weekmasks = {
+            year: [weekday not in self._get_weekend(year) for weekday in range(7)]
+            for year in range(dt1.year, dt2.year + 1)
+        }
+        weekmask = weekmasks[dt1.year]
+
+        weekend_workdays = [dt for dt in self.weekend_workdays if dt1 <= dt <= dt2]
+        if weekend_workdays or any(wm != weekmask for wm in weekmasks.values()):
+            days_off = [holidays]
+            for year, year_weekmask in weekmasks.items():
+                days = np.arange(
+                    np.datetime64(max(dt1, date(year, 1, 1)), "D"),
+                    np.datetime64(min(dt2, date(year, 12, 31)), "D") + 1,
+                )
+                days_off.append(days[~np.is_busday(days, weekmask=year_weekmask)])
+            holidays = np.setdiff1d(
+                np.concatenate(days_off), np.array(weekend_workdays, dtype="datetime64[D]")
+            )
+            weekmask = [True] * 7
+
+        return np.busdaycalendar(weekmask=weekmask, holidays=holidays)
+
+    def to_pandas_offset(self, start: DateLike, end: DateLike, **kwargs):
+        """Return a :class:`pandas.tseries.offsets.CustomBusinessDay` offset
+        of the working days.
+
+        Requires pandas to be installed.
+
+        :param start:
+            The range start date, see :meth:`to_busdaycalendar`.
+
+        :param end:
+            The range end date, see :meth:`to_busdaycalendar`.
+
+        :param kwargs:
+            The offset arguments, e.g. ``n`` or ``normalize``.
+        """
+        from pandas.tseries.offsets import CustomBusinessDay
+
+        return CustomBusinessDay(calendar=self.to_busdaycalendar(start, end), **kwargs)
+
     def update(  # type: ignore[override]
         self, *args: Union[dict[DateLike, str], list[DateLike], DateLike]
     ) -> None:
@@ -0,0 +1,168 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+__all__ = (
+    "CATALOG_CACHE_HIT",
+    "CATALOG_CACHE_MISS",
+    "CATALOG_LOAD",
+    "EXPAND",
+    "POPULATE_END",
+    "POPULATE_START",
+    "CounterListener",
+    "Event",
+    "LoggingListener",
+    "add_listener",
+    "instrument",
+    "remove_listener",
+)
+
+import logging
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Callable, NamedTuple, Optional, Union
+
+# Event names.
+POPULATE_START = "populate_start"
+POPULATE_END = "populate_end"
+EXPAND = "expand"
+CATALOG_LOAD = "catalog_load"
+CATALOG_CACHE_HIT = "catalog_cache_hit"
+CATALOG_CACHE_MISS = "catalog_cache_miss"
+
+
+class Event(NamedTuple):
+    """An instrumentation event."""
+
+    name: str
+    """The event name (e.g., `populate_end`)."""
+    entity: Optional[Union[str, list[str]]]
+    """The entity code (e.g., US or NYSE)."""
+    subdiv: Optional[Union[str, list[str]]] = None
+    """The entity subdivision code."""
+    year: Optional[int] = None
+    """The populated year."""
+    language: Optional[str] = None
+    """The translation catalog language."""
+    duration: Optional[float] = None
+    """The operation duration in seconds."""
+
+
+Listener = Callable[[Event], None]
+
+_listeners: list[Listener] = []
+
+
+def add_listener(listener: Listener) -> None:
+    """Register an instrumentation events listener.
+
+    Listeners are called synchronously for each event emitted by all holidays
+    objects. No events are created while there are no listeners registered.
+
+    :param listener:
+        A callable accepting an :class:`Event` object.
+    """
+    _listeners.append(listener)
+
+
+def remove_listener(listener: Listener) -> None:
+    """Unregister an instrumentation events listener.
+
+    :param listener:
+        A previously registered listener.
+    """
+    _listeners.remove(listener)
+
+
+@contextmanager
+def instrument(listener: Listener) -> Iterator[Listener]:
+    """Register an instrumentation events listener for a block of code.
+
+    >>> from holidays.instrumentation import CounterListener, instrument
+    >>> with instrument(CounterListener()) as counter:
+    ...     holidays.US(years=2024)
+    """
+    add_listener(listener)
+    try:
+        yield listener
+    finally:
+        remove_listener(listener)
+
+
+def _emit(event: Event) -> None:
+    for listener in tuple(_listeners):
+        listener(event)
+
+
+class LoggingListener:
+    """Log instrumentation events."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        """
+        :param logger:
+            The logger to use, the `holidays` one by default.
+
+        :param level:
+            The events logging level.
+        """
+        self.logger = logger or logging.getLogger("holidays")
+        self.level = level
+
+    def __call__(self, event: Event) -> None:
+        self.logger.log(
+            self.level,
+            "%s",
+            " ".join(
+                f"{field}={value}" for field, value in event._asdict().items() if value is not None
+            ),
+        )
+
+
+class CounterListener:
+    """Count instrumentation events as Prometheus-style counters.
+
+    The :attr:`counters` keys are metric names with labels, e.g.
+    ``holidays_populate_total{entity="US",subdiv="CA"}``.
+    """
+
+    metric_names = {
+        POPULATE_END: "holidays_populate_total",
+        EXPAND: "holidays_expand_total",
+        CATALOG_LOAD: "holidays_catalog_loads_total",
+        CATALOG_CACHE_HIT: "holidays_catalog_cache_hits_total",
+        CATALOG_CACHE_MISS: "holidays_catalog_cache_misses_total",
+    }
+    """Event counter metric names."""
+    duration_metric_names = {
+        POPULATE_END: "holidays_populate_seconds_total",
+        CATALOG_LOAD: "holidays_catalog_load_seconds_total",
+    }
+    """Event duration counter metric names."""
+
+    def __init__(self) -> None:
+        self.counters: dict[str, float] = defaultdict(float)
+        """The counter values."""
+
+    def __call__(self, event: Event) -> None:
+        if (metric_name := self.metric_names.get(event.name)) is None:
+            return None
+
+        labels = ",".join(
+            f'{field}="{value}"'
+            for field in ("entity", "subdiv", "language")
+            if (value := getattr(event, field)) is not None
+        )
+        self.counters[f"{metric_name}{{{labels}}}"] += 1
+        if event.duration is not None:
+            self.counters[f"{self.duration_metric_names[event.name]}{{{labels}}}"] += (
+                event.duration
+            )
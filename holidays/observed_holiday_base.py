@@ -10,6 +10,7 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+from collections.abc import Iterable
 from datetime import date
 from typing import Optional
 
@@ -18,11 +19,60 @@ from holidays.holiday_base import DateArg, HolidayBase
 
 
 class ObservedRule(dict[int, Optional[int]]):
-    __slots__ = ()
+    __slots__ = ("_shifts",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._shifts: Optional[tuple[Optional[int], ...]] = None
 
     def __add__(self, other):
         return ObservedRule({**self, **other})
 
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    # The compiled shifts are reset whenever the rule changes.
+    def __setitem__(self, key, value):
+        self._shifts = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._shifts = None
+        super().__delitem__(key)
+
+    def __ior__(self, other):  # type: ignore[misc]
+        self._shifts = None
+        return super().__ior__(other)
+
+    def clear(self):
+        self._shifts = None
+        super().clear()
+
+    def pop(self, *args):
+        self._shifts = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._shifts = None
+        return super().popitem()
+
+    def setdefault(self, *args):
+        self._shifts = None
+        return super().setdefault(*args)
+
+    def update(self, *args, **kwargs):
+        self._shifts = None
+        super().update(*args, **kwargs)
+
+    @property
+    def shifts(self) -> tuple[Optional[int], ...]:
+        """The rule compiled to weekday indexed shifts: 0 - not moved, None - not
+        observed."""
+        if self._shifts is None:
+            self._shifts = tuple(self.get(wd, 0) for wd in range(7))
+
+        return self._shifts
+
 
 # Observance calculation rules: +7 - next workday, -7 - previous workday.
 # Single days.
@@ -107,23 +157,43 @@ class ObservedHolidayBase(HolidayBase):
         self, observed_rule: ObservedRule = None, observed_since: int = None, *args, **kwargs
     ):
         self._observed_rule = observed_rule or ObservedRule()
+        self._observed_labels: Optional[tuple[str, str, str, str]] = None
         self._observed_since = observed_since
         super().__init__(*args, **kwargs)
 
+    def _get_observed_labels(self) -> tuple[str, str, str, str]:
+        """Return the translated observed, observed before, estimated text and
+        observed estimated labels.
+
+        The labels are translated once per instance, on the first observed date.
+        """
+        if self._observed_labels is None:
+            estimated_label = getattr(self, "estimated_label", "")
+            self._observed_labels = (
+                self.tr(self.observed_label),
+                self.tr(getattr(self, "observed_label_before", self.observed_label)),
+                self.tr(estimated_label).strip("%s ()"),
+                self.tr(getattr(self, "observed_estimated_label", self.observed_label)),
+            )
+
+        return self._observed_labels
+
     def _is_observed(self, *args, **kwargs) -> bool:
         return self._observed_since is None or self._year >= self._observed_since
 
     def _get_next_workday(self, dt: date, delta: int = +1) -> date:
+        # The holidays change while populating, check the dates directly instead of
+        # using the `in` operator keys conversion.
         dt_work = _timedelta(dt, delta)
         while dt_work.year == self._year:
-            if dt_work in self or self._is_weekend(dt_work):  # type: ignore[operator]
+            if dict.__contains__(self, dt_work) or self._is_weekend(dt_work):
                 dt_work = _timedelta(dt_work, delta)
             else:
                 return dt_work
         return dt
 
     def _get_observed_date(self, dt: date, rule: ObservedRule) -> Optional[date]:
-        delta = rule.get(dt.weekday(), 0)
+        delta = rule.shifts[dt.weekday()]
         if delta:
             return (
                 self._get_next_workday(dt, delta // 7)
@@ -157,30 +227,23 @@ class ObservedHolidayBase(HolidayBase):
             self.pop(dt)
             return False, None
 
+        names = (name,) if name else self.get_list(dt)
         if show_observed_label:
-            estimated_label = self.tr(getattr(self, "estimated_label", ""))
-            observed_label = self.tr(
-                getattr(
-                    self,
-                    "observed_label_before" if dt_observed < dt else "observed_label",
-                    self.observed_label,
-                )
+            observed_label, observed_label_before, estimated_text, observed_estimated_label = (
+                self._get_observed_labels()
             )
-
-            estimated_label_text = estimated_label.strip("%s ()")
-            # Use observed_estimated_label instead of observed_label for estimated dates.
-            for name in (name,) if name else self.get_list(dt):
+            if dt_observed < dt:
+                observed_label = observed_label_before
+            for name in names:
                 holiday_name = self.tr(name)
-                observed_estimated_label = None
-                if estimated_label_text and estimated_label_text in holiday_name:
-                    holiday_name = holiday_name.replace(f"({estimated_label_text})", "").strip()
-                    observed_estimated_label = self.tr(getattr(self, "observed_estimated_label"))
-
-                super()._add_holiday(
-                    (observed_estimated_label or observed_label) % holiday_name, dt_observed
-                )
+                # Use observed_estimated_label instead of observed_label for estimated dates.
+                if estimated_text and estimated_text in holiday_name:
+                    holiday_name = holiday_name.replace(f"({estimated_text})", "").strip()
+                    super()._add_holiday(observed_estimated_label % holiday_name, dt_observed)
+                else:
+                    super()._add_holiday(observed_label % holiday_name, dt_observed)
         else:
-            for name in (name,) if name else self.get_list(dt):
+            for name in names:
                 super()._add_holiday(name, dt_observed)
 
         return True, dt_observed
@@ -195,11 +258,12 @@ class ObservedHolidayBase(HolidayBase):
             self.pop(dt)
         return is_observed, dt_observed if is_observed else dt
 
-    def _populate_observed(self, dts: set[date], multiple: bool = False) -> None:
+    def _populate_observed(self, dts: Iterable[Optional[date]], multiple: bool = False) -> None:
         """
         When multiple is True, each holiday from a given date has its own observed date.
+        Holidays out of their calendar range (None dates) are skipped.
         """
-        for dt in sorted(dts):
+        for dt in sorted(dt for dt in dts if dt is not None):
             if not self._is_observed(dt):
                 continue
             if multiple:
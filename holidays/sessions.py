@@ -0,0 +1,481 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+__all__ = (
+    "DIFFERENCE",
+    "INTERSECTION",
+    "MAX_EMPTY_YEARS",
+    "UNION",
+    "CombinedSessions",
+    "SessionSchedule",
+    "TradingSchedule",
+    "TradingSessions",
+)
+
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import date, datetime, time
+from typing import NamedTuple, Optional, Union
+
+from holidays.calendars.gregorian import JAN, DEC
+from holidays.constants import HALF_DAY
+from holidays.holiday_base import DateLike, HolidayBase
+
+# Sessions combination operations.
+DIFFERENCE = "difference"
+INTERSECTION = "intersection"
+UNION = "union"
+
+# The maximum number of consecutive years without sessions an offset search goes through.
+MAX_EMPTY_YEARS = 10
+
+
+class SessionSchedule(NamedTuple):
+    """Trading sessions schedule arrays.
+
+    The arrays are aligned: the n-th items describe the n-th session. All of
+    them are 64-bit signed integer (``"q"`` typecode) arrays supporting the
+    buffer protocol, e.g., they may be wrapped by
+    ``numpy.frombuffer(schedule.opens, dtype=numpy.int64)`` without copying.
+    """
+
+    sessions: array
+    """The session date ordinals."""
+    opens: array
+    """The session open times (POSIX timestamps in seconds)."""
+    closes: array
+    """The session close times (POSIX timestamps in seconds)."""
+
+
+class _Sessions(ABC):
+    """Trading sessions queries base.
+
+    The sessions of each year are stored as a bitmap (the n-th bit is set if
+    the n-th day of the year is a session) and as a sorted array of session
+    date ordinals derived from it. Both are calculated once, on the first
+    year query.
+    """
+
+    def __init__(self) -> None:
+        self._bitmaps: dict[int, int] = {}
+        self._sessions: dict[int, array] = {}
+
+    def __and__(self, other: "_Sessions") -> "CombinedSessions":
+        return CombinedSessions(INTERSECTION, self, other)
+
+    def __or__(self, other: "_Sessions") -> "CombinedSessions":
+        return CombinedSessions(UNION, self, other)
+
+    def __sub__(self, other: "_Sessions") -> "CombinedSessions":
+        return CombinedSessions(DIFFERENCE, self, other)
+
+    @abstractmethod
+    def _calculate_year_bitmap(self, year: int) -> int:
+        """Return the year sessions bitmap (the n-th bit is the n-th day of the year)."""
+
+    @abstractmethod
+    def _to_date(self, key: DateLike) -> date:
+        """Convert the key to a date."""
+
+    def _get_year_bitmap(self, year: int) -> int:
+        """Return the year sessions bitmap."""
+        if (bitmap := self._bitmaps.get(year)) is None:
+            bitmap = self._bitmaps[year] = self._calculate_year_bitmap(year)
+
+        return bitmap
+
+    def _get_year_sessions(self, year: int) -> array:
+        """Return the year session date ordinals."""
+        if (sessions := self._sessions.get(year)) is None:
+            start = date(year, JAN, 1).toordinal()
+            # The bitmap binary digits from the lowest one (the 1st day of the year).
+            bits = bin(self._get_year_bitmap(year))[:1:-1]
+            sessions = self._sessions[year] = array(
+                "q", (start + day for day, bit in enumerate(bits) if bit == "1")
+            )
+
+        return sessions
+
+    def is_session(self, key: DateLike) -> bool:
+        """Return True if the date is a trading session, False otherwise."""
+        dt = self._to_date(key)
+        day = dt.toordinal() - date(dt.year, JAN, 1).toordinal()
+        return bool(self._get_year_bitmap(dt.year) >> day & 1)
+
+    def next_session(self, key: DateLike) -> date:
+        """Return the first trading session after the date."""
+        return self.session_offset(key, +1)
+
+    def previous_session(self, key: DateLike) -> date:
+        """Return the last trading session before the date."""
+        return self.session_offset(key, -1)
+
+    def session_offset(self, key: DateLike, n: int) -> date:
+        """Return n-th trading session after the date (if n is positive) or
+        n-th trading session before the date (if n is negative).
+
+        Mirrors :meth:`HolidayBase.get_nth_working_day`, the date itself is
+        returned if n is 0.
+
+        :raise:
+            ValueError if no session is found in :data:`MAX_EMPTY_YEARS`
+            consecutive years (e.g., for a calendar combination that never has
+            sessions).
+        """
+        dt = self._to_date(key)
+        if n == 0:
+            return dt
+
+        year = dt.year
+        sessions = self._get_year_sessions(year)
+        empty_years = 0
+        if n > 0:
+            idx = bisect_right(sessions, dt.toordinal()) + n - 1
+            while idx >= len(sessions):
+                idx -= len(sessions)
+                year += 1
+                sessions = self._get_year_sessions(year)
+                empty_years = 0 if sessions else empty_years + 1
+                if empty_years == MAX_EMPTY_YEARS:
+                    raise ValueError(f"No trading sessions found in {MAX_EMPTY_YEARS} years.")
+        else:
+            idx = bisect_left(sessions, dt.toordinal()) + n
+            while idx < 0:
+                year -= 1
+                sessions = self._get_year_sessions(year)
+                idx += len(sessions)
+                empty_years = 0 if sessions else empty_years + 1
+                if empty_years == MAX_EMPTY_YEARS:
+                    raise ValueError(f"No trading sessions found in {MAX_EMPTY_YEARS} years.")
+
+        return date.fromordinal(sessions[idx])
+
+    def sessions_in_range(self, start: DateLike, end: DateLike) -> list[date]:
+        """Return the trading sessions between two dates.
+
+        The date range works in a closed interval fashion [start, end] so both
+        endpoints are included.
+
+        :param start:
+            The range start date.
+
+        :param end:
+            The range end date.
+        """
+        dt1 = self._to_date(start)
+        dt2 = self._to_date(end)
+        if dt1 > dt2:
+            dt1, dt2 = dt2, dt1
+
+        start_ordinal = dt1.toordinal()
+        end_ordinal = dt2.toordinal()
+        sessions: list[date] = []
+        for year in range(dt1.year, dt2.year + 1):
+            year_sessions = self._get_year_sessions(year)
+            sessions.extend(
+                date.fromordinal(ordinal)
+                for ordinal in year_sessions[
+                    bisect_left(year_sessions, start_ordinal) : bisect_right(
+                        year_sessions, end_ordinal
+                    )
+                ]
+            )
+
+        return sessions
+
+
+class TradingSessions(_Sessions):
+    """Trading sessions calendar of a financial market.
+
+    A session is a working day of the market holidays object: a day that is
+    neither a weekend day nor a holiday, or a weekend day that is a working
+    day. The session dates are precomputed per year into sorted arrays of date
+    ordinals, so that session queries take O(log n) time.
+
+    The year sessions are calculated once, on the first year query: the
+    holidays object changes made after that (e.g., with
+    :meth:`HolidayBase.update`) are not reflected.
+
+    The calendars of several markets may be combined with ``&`` (sessions of
+    all the markets), ``|`` (sessions of any of the markets) and ``-``
+    (sessions of the first market only) operators, see
+    :class:`CombinedSessions`.
+
+    Example usage:
+
+    >>> from holidays.sessions import TradingSessions
+    >>> nyse = TradingSessions("XNYS")
+    >>> nyse.is_session("2024-07-04")
+    False
+    >>> nyse.next_session("2024-07-03")
+    datetime.date(2024, 7, 5)
+    >>> nyse.session_offset("2024-12-20", 5)
+    datetime.date(2024, 12, 30)
+    """
+
+    def __init__(
+        self,
+        holidays: Union[str, HolidayBase],
+        years: Optional[Union[int, Iterable[int]]] = None,
+    ) -> None:
+        """
+        :param holidays:
+            The financial market code (e.g., XNYS) or a holidays object (e.g.,
+            a country one) the sessions are based on.
+
+        :param years:
+            The year(s) to precompute the sessions for at instantiation.
+        """
+        super().__init__()
+
+        if isinstance(holidays, str):
+            from holidays.utils import financial_holidays
+
+            holidays = financial_holidays(holidays)
+
+        self.holidays = holidays
+
+        for year in (years,) if isinstance(years, int) else years or ():
+            self._get_year_sessions(year)
+
+    def _calculate_year_bitmap(self, year: int) -> int:
+        is_working_day = self.holidays.is_working_day
+        start = date(year, JAN, 1).toordinal()
+        end = date(year, DEC, 31).toordinal()
+        # The binary digits from the highest one (the last day of the year).
+        return int(
+            "".join(
+                "1" if is_working_day(date.fromordinal(ordinal)) else "0"
+                for ordinal in range(end, start - 1, -1)
+            ),
+            2,
+        )
+
+    def _to_date(self, key: DateLike) -> date:
+        return self.holidays.__keytransform__(key)
+
+
+class CombinedSessions(_Sessions):
+    """Trading sessions calendar of a combination of markets.
+
+    Combines the sessions of several calendars (e.g., for a multi-market
+    settlement) by a set operation on the per year sessions bitmaps:
+
+    * ``intersection`` -- the sessions of all the calendars (i.e., the union of
+      the markets holidays),
+    * ``union`` -- the sessions of any of the calendars,
+    * ``difference`` -- the sessions of the first calendar that are not the
+      sessions of any other calendar.
+
+    The calendars are usually combined with ``&``, ``|`` and ``-`` operators.
+    Chains of the same operation are flattened into a single combination, so
+    that large markets baskets take a single pass per year.
+
+    Example usage:
+
+    >>> from holidays.sessions import TradingSessions
+    >>> nyse_target = TradingSessions("XNYS") & TradingSessions("ECB")
+    >>> nyse_target.session_offset("2024-12-23", 2)  # T+2.
+    datetime.date(2024, 12, 27)
+    """
+
+    def __init__(self, operation: str, *operands: _Sessions) -> None:
+        """
+        :param operation:
+            The set operation: ``intersection``, ``union`` or ``difference``.
+
+        :param operands:
+            The calendars to combine.
+        """
+        if operation not in {DIFFERENCE, INTERSECTION, UNION}:
+            raise ValueError(f"Unknown sessions operation: {operation}.")
+        if not operands:
+            raise ValueError("At least one calendar is required.")
+
+        super().__init__()
+
+        self.operation = operation
+        self.operands: list[_Sessions] = []
+        for idx, operand in enumerate(operands):
+            # The difference may only be flattened from the left.
+            if (
+                isinstance(operand, CombinedSessions)
+                and operand.operation == operation
+                and (operation != DIFFERENCE or idx == 0)
+            ):
+                self.operands.extend(operand.operands)
+            else:
+                self.operands.append(operand)
+
+    def _calculate_year_bitmap(self, year: int) -> int:
+        first, *others = (operand._get_year_bitmap(year) for operand in self.operands)
+        if self.operation == INTERSECTION:
+            for bitmap in others:
+                first &= bitmap
+        elif self.operation == UNION:
+            for bitmap in others:
+                first |= bitmap
+        else:
+            for bitmap in others:
+                first &= ~bitmap
+
+        return first
+
+    def _to_date(self, key: DateLike) -> date:
+        return self.operands[0]._to_date(key)
+
+
+class TradingSchedule(TradingSessions):
+    """Trading sessions schedule of a financial market.
+
+    Extends :class:`TradingSessions` with the session open and close times.
+    The market holidays class defines them with the following attributes:
+
+    * ``timezone`` -- the market IANA time zone name (e.g., America/New_York),
+    * ``session_hours`` -- the regular session hours changes, a sorted tuple of
+      (effective date, open time, close time) tuples,
+    * ``early_close_time`` -- the close time of the half day sessions (the
+      market :data:`~holidays.constants.HALF_DAY` category holidays).
+
+    The open and close times are precomputed per year into arrays of POSIX
+    timestamps, see :meth:`get_schedule`.
+
+    Example usage:
+
+    >>> from holidays.sessions import TradingSchedule
+    >>> nyse = TradingSchedule("XNYS")
+    >>> open_dt, close_dt = nyse.get_session_times("2024-11-29")  # Day after Thanksgiving.
+    >>> open_dt.time(), close_dt.time()
+    (datetime.time(9, 30), datetime.time(13, 0))
+    """
+
+    def __init__(
+        self,
+        holidays: Union[str, HolidayBase],
+        years: Optional[Union[int, Iterable[int]]] = None,
+    ) -> None:
+        """
+        :param holidays:
+            The financial market code (e.g., XNYS) or a holidays object the
+            sessions are based on. It must define the session times.
+
+        :param years:
+            The year(s) to precompute the sessions schedule for at instantiation.
+
+        :raises ValueError:
+            If the holidays object does not define the session times.
+        """
+        self._schedules: dict[int, tuple[array, array]] = {}
+        super().__init__(holidays, years)
+
+        if not hasattr(self.holidays, "session_hours"):
+            raise ValueError(
+                f"Session hours are not available for {self.holidays.__class__.__name__}."
+            )
+
+        from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+        try:
+            self.timezone = ZoneInfo(self.holidays.timezone)
+        except ZoneInfoNotFoundError as e:
+            raise ZoneInfoNotFoundError(
+                f"Time zone {self.holidays.timezone} is not available, "
+                "the tzdata package is required on systems without a time zone database."
+            ) from e
+        self._hours_since = [since.toordinal() for since, *_ in self.holidays.session_hours]
+        self._half_days: Optional[HolidayBase] = (
+            self.holidays.__class__(
+                categories=HALF_DAY,
+                observed=self.holidays.observed,
+                subdiv=self.holidays.subdiv,
+            )
+            if HALF_DAY in self.holidays.supported_categories
+            else None
+        )
+
+        for year in (years,) if isinstance(years, int) else years or ():
+            self._get_year_schedule(year)
+
+    def _get_session_hours(self, dt: date) -> tuple[time, time]:
+        """Return the session (open, close) local times."""
+        idx = max(bisect_right(self._hours_since, dt.toordinal()) - 1, 0)
+        _, open_time, close_time = self.holidays.session_hours[idx]
+        if self._half_days is not None and dt in self._half_days:
+            close_time = self.holidays.early_close_time
+
+        return open_time, close_time
+
+    def _get_year_schedule(self, year: int) -> tuple[array, array]:
+        """Return the year sessions open and close POSIX timestamps."""
+        if (schedule := self._schedules.get(year)) is None:
+            opens = array("q")
+            closes = array("q")
+            for ordinal in self._get_year_sessions(year):
+                open_dt, close_dt = self.get_session_times(date.fromordinal(ordinal))
+                opens.append(int(open_dt.timestamp()))
+                closes.append(int(close_dt.timestamp()))
+            schedule = self._schedules[year] = (opens, closes)
+
+        return schedule
+
+    def get_session_times(self, key: DateLike) -> tuple[datetime, datetime]:
+        """Return the session open and close time zone aware datetimes.
+
+        :param key:
+            The session date.
+
+        :raises ValueError:
+            If the date is not a trading session.
+        """
+        dt = self._to_date(key)
+        if not self.is_session(dt):
+            raise ValueError(f"{dt} is not a trading session.")
+
+        open_time, close_time = self._get_session_hours(dt)
+        return (
+            datetime.combine(dt, open_time, self.timezone),
+            datetime.combine(dt, close_time, self.timezone),
+        )
+
+    def get_schedule(self, start: DateLike, end: DateLike) -> SessionSchedule:
+        """Return the trading sessions schedule between two dates.
+
+        The date range works in a closed interval fashion [start, end] so both
+        endpoints are included.
+
+        :param start:
+            The range start date.
+
+        :param end:
+            The range end date.
+        """
+        dt1 = self._to_date(start)
+        dt2 = self._to_date(end)
+        if dt1 > dt2:
+            dt1, dt2 = dt2, dt1
+
+        start_ordinal = dt1.toordinal()
+        end_ordinal = dt2.toordinal()
+        schedule = SessionSchedule(array("q"), array("q"), array("q"))
+        for year in range(dt1.year, dt2.year + 1):
+            sessions = self._get_year_sessions(year)
+            opens, closes = self._get_year_schedule(year)
+            year_slice = slice(
+                bisect_left(sessions, start_ordinal), bisect_right(sessions, end_ordinal)
+            )
+            schedule.sessions.extend(sessions[year_slice])
+            schedule.opens.extend(opens[year_slice])
+            schedule.closes.extend(closes[year_slice])
+
+        return schedule
@@ -0,0 +1,62 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+from typing import NamedTuple, Optional
+
+from holidays.holiday_base import HolidayBase
+
+SNAPSHOT_LANGUAGE = "en_US"
+"""The snapshots holiday names language."""
+
+SNAPSHOT_YEARS = range(1950, 2051)
+"""The snapshots years range."""
+
+
+class SnapshotCase(NamedTuple):
+    """A snapshot file: an entity holidays for a subdivision in all supported
+    categories."""
+
+    name: str
+    """The snapshot file path relative to the snapshots directory without the
+    extension (e.g., ``countries/US_CA`` or ``financial/XNYS``)."""
+    entity_cls: type[HolidayBase]
+    """The entity class."""
+    subdiv: Optional[str]
+    """The subdivision code, None for the entity common holidays."""
+
+    def get_holidays(self, years: Optional[range] = SNAPSHOT_YEARS) -> HolidayBase:
+        """Return the snapshot holidays populated for the years."""
+        return self.entity_cls(
+            subdiv=self.subdiv,
+            categories=self.entity_cls.supported_categories,
+            language=SNAPSHOT_LANGUAGE,
+            years=years,
+        )
+
+
+def get_snapshot_cases(entity_cls: type[HolidayBase]) -> list[SnapshotCase]:
+    """Return the entity snapshot files.
+
+    A market has a single snapshot file, a country has one for its common
+    holidays and one for each of its subdivisions.
+    """
+    if market := getattr(entity_cls, "market", None):
+        return [SnapshotCase(f"financial/{market}", entity_cls, None)]
+
+    return [
+        SnapshotCase(
+            f"countries/{entity_cls.country}_{(subdiv or 'COMMON').replace(' ', '_').upper()}",
+            entity_cls,
+            subdiv,
+        )
+        for subdiv in (None, *entity_cls.subdivisions)
+    ]
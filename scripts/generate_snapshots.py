@@ -23,13 +23,12 @@ sys.path.append(f"{Path.cwd()}")  # Make holidays visible.
 
 import holidays  # noqa: E402
 from holidays import list_supported_countries, list_supported_financial  # noqa: E402
+from holidays.snapshots import get_snapshot_cases  # noqa: E402
 
 
 class SnapshotGenerator:
     """Creates a snapshot of available holidays for supported entities."""
 
-    years = range(1950, 2051)
-
     def __init__(self) -> None:
         arg_parser = argparse.ArgumentParser()
         arg_parser.add_argument(
@@ -83,20 +82,8 @@ class SnapshotGenerator:
         if not self.args.country:
             self.prepare_snapshot_directory(snapshot_path)
         for country_code in country_list:
-            country = getattr(holidays, country_code)
-
-            for subdiv in (None,) + country.subdivisions:
-                self.save(
-                    holidays.country_holidays(
-                        country_code,
-                        subdiv=subdiv,
-                        years=self.years,
-                        categories=country.supported_categories,
-                        language="en_US",
-                    ),
-                    f"{snapshot_path}/"
-                    f"{country_code}_{(subdiv or 'COMMON').replace(' ', '_').upper()}.json",
-                )
+            for case in get_snapshot_cases(getattr(holidays, country_code)):
+                self.save(case.get_holidays(), f"snapshots/{case.name}.json")
 
     def generate_financial_snapshots(self):
         """Generates financial snapshots."""
@@ -112,14 +99,8 @@ class SnapshotGenerator:
         if not self.args.market:
             self.prepare_snapshot_directory(snapshot_path)
         for market_code in market_list:
-            self.save(
-                holidays.country_holidays(
-                    market_code,
-                    years=self.years,
-                    language="en_US",
-                ),
-                f"{snapshot_path}/{market_code}.json",
-            )
+            for case in get_snapshot_cases(getattr(holidays, market_code)):
+                self.save(case.get_holidays(), f"snapshots/{case.name}.json")
 
     def run(self):
         """Runs snapshot files generation process."""
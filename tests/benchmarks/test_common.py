@@ -0,0 +1,67 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import json
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase
+
+from holidays.benchmarks.common import PRESETS, Entity, get_entities, write_report
+
+
+class TestGetEntities(TestCase):
+    def test_all_entities(self):
+        entities = get_entities()
+        self.assertEqual(len(entities), len({entity.code for entity in entities}))
+        self.assertIn(
+            Entity("US", "country", "holidays.countries.united_states", "UnitedStates"),
+            entities,
+        )
+        self.assertIn(
+            Entity(
+                "XNYS", "financial", "holidays.financial.ny_stock_exchange", "NewYorkStockExchange"
+            ),
+            entities,
+        )
+        self.assertEqual(entities, sorted(entities, key=lambda e: (e.kind, e.code)))
+
+    def test_aliases(self):
+        self.assertEqual(
+            [entity.code for entity in get_entities(("USA", "UK"), ("NYSE",))],
+            ["GB", "US", "XNYS"],
+        )
+
+    def test_countries_only(self):
+        self.assertEqual([entity.code for entity in get_entities(("US", "DE"))], ["DE", "US"])
+
+    def test_presets(self):
+        for codes in PRESETS.values():
+            self.assertEqual(len(get_entities(codes)), len(codes))
+
+    def test_unknown_entity(self):
+        self.assertRaises(ValueError, lambda: get_entities(("XX",)))
+        self.assertRaises(ValueError, lambda: get_entities(markets=("XXXX",)))
+
+
+class TestWriteReport(TestCase):
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "report.json"
+            write_report({"benchmark": "test"}, str(path))
+            self.assertEqual(json.loads(path.read_text()), {"benchmark": "test"})
+
+    def test_stdout(self):
+        with redirect_stdout(StringIO()) as stdout:
+            write_report({"benchmark": "test"})
+        self.assertEqual(json.loads(stdout.getvalue()), {"benchmark": "test"})
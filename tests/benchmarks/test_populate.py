@@ -0,0 +1,136 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import json
+import runpy
+import sys
+import tempfile
+import warnings
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase, mock
+
+from holidays.benchmarks.common import get_entities
+from holidays.benchmarks.populate import (
+    PopulateCase,
+    compare_populate_results,
+    get_populate_cases,
+    measure_populate_throughput,
+    run_populate_benchmark,
+)
+from holidays.countries.aruba import Aruba
+from holidays.countries.netherlands import Netherlands
+from holidays.financial.ny_stock_exchange import NewYorkStockExchange
+from holidays.constants import HALF_DAY, OPTIONAL, PUBLIC
+
+
+class TestPopulateBenchmark(TestCase):
+    def test_get_populate_cases(self):
+        cases = list(get_populate_cases(get_entities(("NL", "AW"), ("NYSE",))))
+        self.assertEqual(
+            cases,
+            [
+                PopulateCase("countries/AW_COMMON/public", Aruba, None, PUBLIC),
+                PopulateCase("countries/NL_COMMON/optional", Netherlands, None, OPTIONAL),
+                PopulateCase("countries/NL_COMMON/public", Netherlands, None, PUBLIC),
+                PopulateCase("financial/XNYS/half_day", NewYorkStockExchange, None, HALF_DAY),
+                PopulateCase("financial/XNYS/public", NewYorkStockExchange, None, PUBLIC),
+            ],
+        )
+
+    def test_get_populate_subdivision_cases(self):
+        names = [case.name for case in get_populate_cases(get_entities(("US",)))]
+        self.assertIn("countries/US_COMMON/public", names)
+        self.assertIn("countries/US_CA/public", names)
+        self.assertIn("countries/US_PR/unofficial", names)
+
+    def test_populate_case_holidays(self):
+        case = PopulateCase("countries/NL_COMMON/optional", Netherlands, None, OPTIONAL)
+        holidays = case.get_holidays()
+        self.assertEqual(holidays.categories, {OPTIONAL})
+        self.assertEqual(holidays.years, set())
+
+    def test_measure_populate_throughput(self):
+        case = PopulateCase("countries/NL_COMMON/public", Netherlands, None, PUBLIC)
+        with mock.patch.object(Netherlands, "_populate", autospec=True) as populate:
+            self.assertGreater(measure_populate_throughput(case, range(2000, 2010), 2), 0)
+        self.assertEqual(populate.call_count, 20)
+        self.assertEqual(populate.call_args.args[1:], (2009,))
+
+    def test_compare_populate_results(self):
+        self.assertEqual(
+            compare_populate_results(
+                {"A": 70.0, "B": 80.0, "C": 200.0, "D": 1.0},
+                {"A": 100.0, "B": 100.0, "C": 100.0, "E": 1.0},
+                0.25,
+            ),
+            {"A": {"baseline": 100.0, "current": 70.0, "change": -0.30000000000000004}},
+        )
+
+    def test_run(self):
+        report = run_populate_benchmark(get_entities(("NL",)), range(2020, 2025), top=1)
+        self.assertEqual(report["benchmark"], "populate")
+        self.assertEqual(report["years"], [2020, 2024])
+        self.assertEqual(
+            list(report["results"]), ["countries/NL_COMMON/optional", "countries/NL_COMMON/public"]
+        )
+        self.assertEqual(len(report["slowest"]), 1)
+        self.assertNotIn("regressions", report)
+
+    def test_run_baseline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "baseline.json"
+            path.write_text(json.dumps({"results": {"countries/NL_COMMON/optional": 1e12}}))
+            report = run_populate_benchmark(
+                get_entities(("NL",)), range(2020, 2025), baseline=str(path), threshold=0.5
+            )
+
+        self.assertEqual(report["threshold"], 0.5)
+        self.assertEqual(list(report["regressions"]), ["countries/NL_COMMON/optional"])
+
+    def _run_cli(self, *args):
+        argv = ["holidays.benchmarks", "populate", "--start-year", "2020", "--end-year", "2021"]
+        with warnings.catch_warnings(), mock.patch.object(sys, "argv", argv + list(args)):
+            with redirect_stdout(StringIO()) as stdout, redirect_stderr(StringIO()) as stderr:
+                runpy.run_module("holidays.benchmarks", run_name="__main__")
+
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_cli(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "baseline.json"
+            self._run_cli("-c", "NL", "-o", str(path))
+            baseline = json.loads(path.read_text())
+            self.assertEqual(
+                list(baseline["results"]),
+                ["countries/NL_COMMON/optional", "countries/NL_COMMON/public"],
+            )
+            self.assertEqual(baseline["years"], [2020, 2021])
+            self.assertEqual(baseline["repeat"], 3)
+
+            stdout, _ = self._run_cli("-c", "NL", "--baseline", str(path), "--threshold", "0.9")
+            self.assertEqual(json.loads(stdout)["regressions"], {})
+
+            baseline["results"]["countries/NL_COMMON/public"] = 1e12
+            path.write_text(json.dumps(baseline))
+            with self.assertRaises(SystemExit) as ctx:
+                self._run_cli("-c", "NL", "--baseline", str(path))
+        self.assertEqual(ctx.exception.code, 1)
+
+    def test_cli_preset(self):
+        with mock.patch.dict("holidays.benchmarks.common.PRESETS", {"christian": ("NL",)}):
+            stdout, _ = self._run_cli("--preset", "christian", "-r", "1")
+        self.assertEqual(
+            list(json.loads(stdout)["results"]),
+            ["countries/NL_COMMON/optional", "countries/NL_COMMON/public"],
+        )
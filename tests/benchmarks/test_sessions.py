@@ -0,0 +1,57 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+
+import json
+import runpy
+import sys
+import warnings
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import TestCase, mock
+
+from holidays.benchmarks.common import get_entities
+from holidays.benchmarks.sessions import measure_sessions, run_sessions_benchmark
+
+QUERIES = {"is_session", "next_session", "previous_session", "session_offset", "sessions_in_range"}
+
+
+class TestSessionsBenchmark(TestCase):
+    def test_measure_sessions(self):
+        metrics = measure_sessions(get_entities(markets=("XNYS",))[0], range(2024, 2026), 2)
+        self.assertGreater(metrics["build"], 0)
+        self.assertEqual(set(metrics["queries"]), QUERIES)
+        for query in metrics["queries"].values():
+            self.assertEqual(set(query), {"sessions", "naive", "speedup"})
+            self.assertEqual(query["speedup"], query["naive"] / query["sessions"])
+
+    def test_run(self):
+        report = run_sessions_benchmark(get_entities(("US",), ("ECB",)), range(2024, 2025))
+        self.assertEqual(report["benchmark"], "sessions")
+        self.assertEqual(report["years"], [2024, 2024])
+        self.assertEqual(list(report["entities"]), ["US", "XECB"])
+        self.assertEqual(report["entities"]["XECB"]["kind"], "financial")
+
+    def _run_cli(self, *args):
+        argv = ["holidays.benchmarks", "sessions", "--start-year", "2024", "--end-year", "2024"]
+        with warnings.catch_warnings(), mock.patch.object(sys, "argv", argv + list(args)):
+            with redirect_stdout(StringIO()) as stdout:
+                runpy.run_module("holidays.benchmarks", run_name="__main__")
+
+        return json.loads(stdout.getvalue())
+
+    def test_cli(self):
+        report = self._run_cli("-r", "1")
+        self.assertEqual(report["repeat"], 1)
+        self.assertEqual(list(report["entities"]), ["BVMF", "IFEU", "XECB", "XNYS"])
+
+        self.assertEqual(list(self._run_cli("-c", "US")["entities"]), ["US"])
@@ -0,0 +1,86 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import json
+import runpy
+import sys
+import warnings
+from contextlib import redirect_stdout
+from io import StringIO
+from subprocess import CompletedProcess
+from unittest import TestCase, mock
+
+from holidays.benchmarks.common import get_entities
+from holidays.benchmarks.startup import (
+    measure_entity_startup,
+    measure_package_import,
+    run_startup_benchmark,
+)
+
+METRICS = {"module_import", "construction", "populate", "lookup", "first_query"}
+
+
+class TestStartupBenchmark(TestCase):
+    def test_measure_entity_startup(self):
+        metrics = measure_entity_startup(get_entities(("US",))[0], 2024)
+        self.assertEqual(set(metrics), METRICS)
+        for value in metrics.values():
+            self.assertGreater(value, 0)
+        self.assertEqual(
+            metrics["first_query"],
+            metrics["module_import"] + metrics["construction"] + metrics["populate"],
+        )
+
+    def test_measure_package_import(self):
+        self.assertGreater(measure_package_import(), 0)
+
+        with mock.patch(
+            "subprocess.run", return_value=CompletedProcess((), 0, stdout="", stderr="")
+        ):
+            self.assertRaises(RuntimeError, measure_package_import)
+
+    def test_run_in_process(self):
+        report = run_startup_benchmark(
+            get_entities(("US", "MY"), ("NYSE",)), 2024, repeat=2, top=2, in_process=True
+        )
+        self.assertEqual(report["benchmark"], "startup")
+        self.assertEqual(report["year"], 2024)
+        self.assertIsNone(report["package_import"])
+        self.assertEqual(set(report["entities"]), {"MY", "US", "XNYS"})
+        self.assertEqual(report["entities"]["XNYS"]["kind"], "financial")
+        self.assertEqual(set(report["entities"]["US"]), METRICS | {"kind"})
+        self.assertEqual(len(report["slowest"]), 2)
+        first_query = [report["entities"][code]["first_query"] for code in report["slowest"]]
+        self.assertEqual(first_query, sorted(first_query, reverse=True))
+
+    def test_run_isolated(self):
+        report = run_startup_benchmark(get_entities(markets=("XNYS",)), 2024)
+        self.assertGreater(report["package_import"], 0)
+        self.assertEqual(set(report["entities"]["XNYS"]), METRICS | {"kind"})
+        self.assertEqual(report["slowest"], ["XNYS"])
+
+    def test_cli(self):
+        argv = ["holidays.benchmarks", "startup", "--in-process", "-c", "US"]
+        with warnings.catch_warnings(), mock.patch.object(sys, "argv", argv):
+            with redirect_stdout(StringIO()) as stdout:
+                runpy.run_module("holidays.benchmarks", run_name="__main__")
+
+        report = json.loads(stdout.getvalue())
+        self.assertEqual(report["repeat"], 3)
+        self.assertEqual(list(report["entities"]), ["US"])
+
+    def test_cli_import(self):
+        filters = warnings.filters[:]
+        with mock.patch.object(sys, "argv", ["holidays.benchmarks"]):
+            runpy.run_module("holidays.benchmarks")
+
+        self.assertEqual(warnings.filters, filters)
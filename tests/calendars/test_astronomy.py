@@ -0,0 +1,155 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+from datetime import date
+
+from holidays.calendars.astronomy import (
+    J2000,
+    _acos,
+    _delta_t,
+    _is_moon_set_after_sun,
+    _jd_to_ordinal,
+    _moon_ecliptic_position,
+    _moon_position,
+    _new_moon,
+    _new_moon_number,
+    _ordinal_to_jd,
+    _solar_term,
+    _sun_longitude,
+    _sun_position,
+    _sunrise,
+    _sunset,
+)
+from holidays.calendars.gregorian import JAN, MAR, APR, JUN, OCT, DEC
+from holidays.calendars.hijri import MECCA_LATITUDE, MECCA_LONGITUDE
+
+
+class TestAstronomy(unittest.TestCase):
+    def test_julian_day(self):
+        ordinal = date(2000, JAN, 1).toordinal()
+        self.assertEqual(_ordinal_to_jd(ordinal), J2000 - 0.5)
+        self.assertEqual(_jd_to_ordinal(J2000), ordinal)
+        self.assertEqual(_jd_to_ordinal(J2000 + 0.49), ordinal)
+        self.assertEqual(_jd_to_ordinal(J2000 + 0.49, utc_offset=3), ordinal + 1)
+
+    def test_delta_t(self):
+        for year, seconds in (
+            (1000, 2131.68),
+            (1600, 120.0),
+            (1700, 8.83),
+            (1800, 13.72),
+            (1860, 7.62),
+            (1900, -2.79),
+            (1920, 21.20),
+            (1950, 29.07),
+            (1975, 45.45),
+            (2000, 63.86),
+            (2010, 66.70),
+            (2100, 202.74),
+            (2200, 442.08),
+        ):
+            self.assertAlmostEqual(
+                _delta_t(J2000 + (year - 2000) * 365.25) * 86400, seconds, delta=0.01
+            )
+
+    def test_new_moon(self):
+        # Meeus example 49.a: 1977 February 18 3h37m42s TD.
+        self.assertAlmostEqual(
+            _new_moon(-283) + _delta_t(2443192.65118), 2443192.65118, delta=0.00001
+        )
+        # 2000 January 6 18h14m UT.
+        self.assertAlmostEqual(_new_moon(0), 2451550.26, delta=0.001)
+
+    def test_new_moon_number(self):
+        self.assertEqual(_new_moon_number(_new_moon(0)), 0)
+        self.assertEqual(_new_moon_number(_new_moon(0) - 0.001), -1)
+        self.assertEqual(_new_moon_number(_new_moon(-283) + 29.5), -283)
+        self.assertEqual(_new_moon_number(_new_moon(1000) - 29.5), 999)
+
+    def test_sun_longitude(self):
+        # Meeus example 25.b: 1992 October 13 0h TD, 199°54'21.818".
+        jde = _ordinal_to_jd(date(1992, OCT, 13).toordinal())
+        self.assertAlmostEqual(_sun_longitude(jde - _delta_t(jde)), 199.906061, delta=0.0001)
+
+    def test_solar_term(self):
+        for dt, longitude, hours in (
+            # Meeus example 27.a: 1962 June 21 21h25m08s TD.
+            (date(1962, JUN, 21), 90, 21 + 25 / 60 - 34 / 3600),
+            # 2024 March 20 3h06m UT.
+            (date(2024, MAR, 20), 0, 3 + 6 / 60),
+            # 2024 December 21 9h20m UT.
+            (date(2024, DEC, 21), 270, 9 + 20 / 60),
+        ):
+            self.assertAlmostEqual(
+                _solar_term(_ordinal_to_jd(date(dt.year, JAN, 1).toordinal()), longitude),
+                _ordinal_to_jd(dt.toordinal()) + hours / 24,
+                delta=0.001,
+            )
+
+    def test_sun_position(self):
+        # Meeus example 25.a: 1992 October 13 0h TD.
+        jde = _ordinal_to_jd(date(1992, OCT, 13).toordinal())
+        longitude, right_ascension, declination = _sun_position(jde - _delta_t(jde))
+        self.assertAlmostEqual(longitude, 199.90895, delta=0.001)
+        self.assertAlmostEqual(right_ascension, 198.38083, delta=0.001)
+        self.assertAlmostEqual(declination, -7.78507, delta=0.001)
+
+    def test_moon_position(self):
+        # Meeus example 47.a: 1992 April 12 0h TD.
+        jde = _ordinal_to_jd(date(1992, APR, 12).toordinal())
+        right_ascension, declination, distance = _moon_position(jde - _delta_t(jde))
+        self.assertAlmostEqual(right_ascension, 134.688470, delta=0.001)
+        self.assertAlmostEqual(declination, 13.768368, delta=0.001)
+        self.assertAlmostEqual(distance, 368409.7, delta=1)
+
+    def test_moon_ecliptic_position(self):
+        # Meeus example 47.a: 1992 April 12 0h TD.
+        jde = _ordinal_to_jd(date(1992, APR, 12).toordinal())
+        longitude, latitude, distance = _moon_ecliptic_position(jde - _delta_t(jde))
+        self.assertAlmostEqual(longitude, 133.167265, delta=0.001)
+        self.assertAlmostEqual(latitude, -3.229126, delta=0.001)
+        self.assertAlmostEqual(distance, 368409.7, delta=1)
+
+    def test_sunrise(self):
+        # 2024 March 10 6:33 in Mecca (UTC+3).
+        sunrise = _sunrise(date(2024, MAR, 10).toordinal(), MECCA_LATITUDE, MECCA_LONGITUDE)
+        self.assertAlmostEqual(
+            sunrise,
+            _ordinal_to_jd(date(2024, MAR, 10).toordinal()) + (3 + 33 / 60) / 24,
+            delta=0.001,
+        )
+
+    def test_sunset(self):
+        # 2024 March 10 18:28 in Mecca (UTC+3).
+        sunset = _sunset(date(2024, MAR, 10).toordinal(), MECCA_LATITUDE, MECCA_LONGITUDE)
+        self.assertAlmostEqual(
+            sunset,
+            _ordinal_to_jd(date(2024, MAR, 10).toordinal()) + (15 + 28 / 60) / 24,
+            delta=0.001,
+        )
+
+    def test_is_moon_set_after_sun(self):
+        # The Moon sets before the Sun on the day before 2024 March 10 9h UT new moon.
+        for dt, expected in (
+            (date(2024, MAR, 9), False),
+            (date(2024, MAR, 10), True),
+        ):
+            sunset = _sunset(dt.toordinal(), MECCA_LATITUDE, MECCA_LONGITUDE)
+            self.assertEqual(
+                _is_moon_set_after_sun(sunset, MECCA_LATITUDE, MECCA_LONGITUDE), expected
+            )
+
+    def test_acos(self):
+        self.assertAlmostEqual(_acos(0.5), 1.0471975, delta=0.000001)
+        self.assertEqual(_acos(1.1), 0.0)
+        self.assertAlmostEqual(_acos(-1.1), 3.1415926, delta=0.000001)
@@ -0,0 +1,53 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+
+import unittest
+from datetime import date
+
+from holidays.calendars.chinese import _ChineseLunisolar, _CustomChineseHolidays
+from holidays.calendars.gregorian import JAN, FEB, APR, MAY, JUN, SEP, OCT
+
+
+class CustomChineseHolidays(_CustomChineseHolidays):
+    LUNAR_NEW_YEAR_DATES = {
+        2100: (FEB, 10),
+    }
+
+
+class TestChineseLunisolarCalendar(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.calendar = _ChineseLunisolar()
+
+    def test_holiday_dates(self):
+        for dt, expected in (
+            (self.calendar.buddha_birthday_date(2024), date(2024, MAY, 15)),
+            (self.calendar.double_ninth_date(2024), date(2024, OCT, 11)),
+            (self.calendar.dragon_boat_date(2024), date(2024, JUN, 10)),
+            (self.calendar.hung_kings_date(2024), date(2024, APR, 18)),
+            (self.calendar.lunar_new_year_date(2024), date(2024, FEB, 10)),
+            (self.calendar.mid_autumn_date(2024), date(2024, SEP, 17)),
+        ):
+            self.assertEqual(dt, (expected, True))
+
+    def test_table_horizon(self):
+        # The tables cover 1901-2099, other years are calculated astronomically.
+        self.assertEqual(self.calendar.lunar_new_year_date(1900), (date(1900, JAN, 31), True))
+        self.assertEqual(self.calendar.lunar_new_year_date(2100), (date(2100, FEB, 9), True))
+        self.assertEqual(self.calendar.mid_autumn_date(2100), (date(2100, SEP, 18), True))
+        self.assertEqual(self.calendar.lunar_new_year_date(1), (None, True))
+
+    def test_custom_calendar(self):
+        calendar = CustomChineseHolidays()
+        self.assertEqual(calendar.lunar_new_year_date(2100), (date(2100, FEB, 10), False))
+        self.assertEqual(calendar.lunar_new_year_date(2101), (date(2101, JAN, 29), True))
@@ -0,0 +1,175 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+
+import unittest
+from datetime import date
+
+from holidays.calendars.chinese import _ChineseLunisolar
+from holidays.calendars.conversion import (
+    from_chinese_lunar,
+    from_hebrew,
+    from_hijri,
+    from_jalali,
+    from_thai_lunar,
+    to_chinese_lunar,
+    to_hebrew,
+    to_hijri,
+    to_jalali,
+    to_thai_lunar,
+)
+from holidays.calendars.gregorian import JAN, MAR, APR, JUL, AUG, SEP
+from holidays.calendars.hebrew import ADAR, ADAR_II, NISAN, TISHREI, _HebrewLunisolar
+from holidays.calendars.islamic import _IslamicLunar
+from holidays.calendars.thai import _ThaiLunisolar
+
+
+class TestConversion(unittest.TestCase):
+    def assertConversion(self, to_calendar, from_calendar, dates, expected):  # noqa: N802
+        ordinals = [dt.toordinal() for dt in dates]
+        calendar_dates = to_calendar(ordinals)
+        self.assertEqual(list(zip(*calendar_dates)), expected)
+        self.assertEqual(from_calendar(*calendar_dates), ordinals)
+
+    def test_hijri(self):
+        self.assertConversion(
+            to_hijri,
+            from_hijri,
+            (date(1900, JAN, 1), date(2024, MAR, 11), date(2025, MAR, 30), date(2100, JAN, 1)),
+            [(1317, 8, 29), (1445, 9, 1), (1446, 10, 1), (1523, 10, 20)],
+        )
+        calendar = _IslamicLunar()
+        for year in range(1925, 2101):
+            for dt, _ in calendar.eid_al_fitr_dates(year):
+                hijri_year = to_hijri([dt.toordinal()])[0][0]
+                self.assertEqual(from_hijri([hijri_year], [10], [1]), [dt.toordinal()])
+
+    def test_hebrew(self):
+        self.assertConversion(
+            to_hebrew,
+            from_hebrew,
+            (date(2023, SEP, 16), date(2024, MAR, 11), date(2024, MAR, 24), date(2025, MAR, 14)),
+            [(5784, TISHREI, 1), (5784, ADAR_II, 1), (5784, ADAR_II, 14), (5785, ADAR, 14)],
+        )
+        # Adar II is Adar in common years.
+        self.assertEqual(from_hebrew([5785], [ADAR_II], [14]), [date(2025, MAR, 14).toordinal()])
+        calendar = _HebrewLunisolar()
+        for year in range(1947, 2101):
+            self.assertEqual(
+                from_hebrew([year + 3760], [NISAN], [15]),
+                [calendar.passover_date(year).toordinal()],
+            )
+
+    def test_chinese_lunar(self):
+        self.assertConversion(
+            to_chinese_lunar,
+            from_chinese_lunar,
+            (date(2023, JAN, 21), date(2023, JAN, 22), date(2023, MAR, 22), date(2023, APR, 20)),
+            [(2022, 12, 30, False), (2023, 1, 1, False), (2023, 2, 1, True), (2023, 3, 1, False)],
+        )
+        calendar = _ChineseLunisolar()
+        for year in range(1901, 2100):
+            # The 1916 table date uses Beijing local time.
+            if year != 1916:
+                dt, _ = calendar.lunar_new_year_date(year)
+                self.assertEqual(from_chinese_lunar([year], [1], [1]), [dt.toordinal()])
+
+    def test_thai_lunar(self):
+        self.assertConversion(
+            to_thai_lunar,
+            from_thai_lunar,
+            (date(1913, 11, 28), date(2023, AUG, 1), date(2024, JUL, 20), date(2024, JUL, 21)),
+            [(1914, 1, 1, False), (2023, 8, 15, True), (2024, 8, 15, False), (2024, 8, 16, False)],
+        )
+        calendar = _ThaiLunisolar()
+        for year in range(_ThaiLunisolar.START_YEAR, _ThaiLunisolar.END_YEAR + 1):
+            is_athikamat = year in _ThaiLunisolar.ATHIKAMAT_YEARS_GREGORIAN
+            self.assertEqual(
+                from_thai_lunar([year], [8], [15], [is_athikamat]),
+                [calendar.asarnha_bucha_date(year).toordinal()],
+            )
+            self.assertEqual(
+                from_thai_lunar([year], [12], [15]), [calendar.loy_krathong_date(year).toordinal()]
+            )
+
+    def test_jalali(self):
+        self.assertConversion(
+            to_jalali,
+            from_jalali,
+            (date(2024, MAR, 20), date(2025, MAR, 20)),
+            [(1403, 1, 1), (1403, 12, 30)],
+        )
+
+    def test_empty(self):
+        for to_calendar in (to_chinese_lunar, to_hebrew, to_hijri, to_thai_lunar):
+            self.assertEqual(to_calendar([])[0], [])
+        for from_calendar in (from_chinese_lunar, from_hebrew, from_hijri, from_thai_lunar):
+            self.assertEqual(from_calendar([], [], []), [])
+
+    def test_out_of_range(self):
+        for to_calendar, dt in (
+            (to_hijri, date(1, JAN, 1)),
+            (to_hijri, date(600, JAN, 1)),
+            (to_thai_lunar, date(1913, 11, 27)),
+            (to_thai_lunar, date(2200, JAN, 1)),
+        ):
+            self.assertRaises(ValueError, lambda: to_calendar([dt.toordinal()]))
+
+        for from_calendar, calendar_date in (
+            (from_chinese_lunar, (1, 1, 1)),
+            (from_hebrew, (13761, 1, 1)),
+            (from_hijri, (0, 1, 1)),
+            (from_thai_lunar, (2158, 1, 1)),
+        ):
+            self.assertRaises(
+                ValueError, lambda: from_calendar(*([value] for value in calendar_date))
+            )
+
+    def test_invalid_dates(self):
+        for from_calendar, args in (
+            (from_chinese_lunar, ([2024], [4], [1], [True])),
+            (from_chinese_lunar, ([2024], [13], [1])),
+            (from_hebrew, ([5785], [ADAR], [30])),
+            (from_hijri, ([1446], [1], [0])),
+            (from_thai_lunar, ([2024], [1], [30])),
+        ):
+            self.assertRaises(ValueError, lambda: from_calendar(*args))
+
+    def test_vectorized(self):
+        import numpy as np
+
+        ordinals = np.arange(date(1914, JAN, 1).toordinal(), date(2101, JAN, 1).toordinal())
+        for to_calendar, from_calendar in (
+            (to_chinese_lunar, from_chinese_lunar),
+            (to_hebrew, from_hebrew),
+            (to_hijri, from_hijri),
+            (to_thai_lunar, from_thai_lunar),
+        ):
+            calendar_dates = to_calendar(ordinals)
+            self.assertTrue((from_calendar(*calendar_dates) == ordinals).all())
+            sample = ordinals[::97].tolist()
+            self.assertEqual(
+                [values.tolist()[::97] for values in calendar_dates],
+                list(to_calendar(sample)),
+            )
+
+            empty = np.array([], dtype=int)
+            self.assertEqual(to_calendar(empty)[0].size, 0)
+            self.assertEqual(from_calendar(empty, empty, empty).size, 0)
+
+        self.assertRaises(ValueError, lambda: from_hijri(*np.array([[1446], [13], [1]])))
+        self.assertRaises(ValueError, lambda: from_hijri(*np.array([[1446], [12], [31]])))
+        self.assertRaises(ValueError, lambda: from_hijri(*np.array([[0], [1], [1]])))
+        self.assertRaises(
+            ValueError,
+            lambda: from_thai_lunar(*np.array([[2024], [8], [1]]), np.array([True])),
+        )
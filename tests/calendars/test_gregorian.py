@@ -13,7 +13,17 @@
 from datetime import date
 from unittest import TestCase
 
-from holidays.calendars.gregorian import TUE, SAT, _timedelta, _get_nth_weekday_of_month
+from dateutil.easter import easter
+
+from holidays.calendars.gregorian import (
+    TUE,
+    SAT,
+    EASTER_ORTHODOX,
+    EASTER_WESTERN,
+    _get_easter_date,
+    _get_nth_weekday_of_month,
+    _timedelta,
+)
 
 
 class TestGregorianCalendar(TestCase):
@@ -44,3 +54,26 @@ class TestGregorianCalendar(TestCase):
             dt2 = date(*ymd2)
             self.assertEqual(_timedelta(dt1, +5), dt2)
             self.assertEqual(_timedelta(dt2, -5), dt1)
+
+    def test_get_easter_date(self):
+        for year, western_dt, orthodox_dt in (
+            (1961, date(1961, 4, 2), date(1961, 4, 9)),
+            (2023, date(2023, 4, 9), date(2023, 4, 16)),
+            (2024, date(2024, 3, 31), date(2024, 5, 5)),
+            (2025, date(2025, 4, 20), date(2025, 4, 20)),
+        ):
+            self.assertEqual(_get_easter_date(year), western_dt)
+            self.assertEqual(_get_easter_date(year, EASTER_WESTERN), western_dt)
+            self.assertEqual(_get_easter_date(year, EASTER_ORTHODOX), orthodox_dt)
+
+        for year in range(1583, 4100):
+            for method in (EASTER_ORTHODOX, EASTER_WESTERN):
+                self.assertEqual(_get_easter_date(year, method), easter(year, method), year)
+
+    def test_get_easter_date_memoized(self):
+        _get_easter_date.cache_clear()
+        for _ in range(3):
+            _get_easter_date(2024, EASTER_WESTERN)
+        cache_info = _get_easter_date.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 2)
@@ -0,0 +1,105 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+
+import hashlib
+import unittest
+from datetime import date
+
+from holidays.calendars.gregorian import JAN, FEB, MAR, APR, MAY, JUN, AUG, SEP, OCT, NOV, DEC
+from holidays.calendars.hebrew import (
+    ADAR,
+    HANUKKAH,
+    ADAR_II,
+    NISAN,
+    TISHREI,
+    _HebrewLunisolar,
+    _HEBREW_HOLIDAYS,
+    _get_hebrew_year_months,
+    _is_leap_year,
+)
+
+
+class TestHebrewLunisolarCalendar(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.calendar = _HebrewLunisolar()
+
+    def test_leap_year(self):
+        self.assertTrue(_is_leap_year(5784))
+        self.assertFalse(_is_leap_year(5785))
+        self.assertEqual(sum(_is_leap_year(year) for year in range(5701, 5720)), 7)
+
+    def test_year_months(self):
+        for year, year_length in (
+            # Deficient, regular and complete common years.
+            (5781, 353),
+            (5778, 354),
+            (5780, 355),
+            # Deficient, regular and complete leap years.
+            (5784, 383),
+            (5782, 384),
+            (5779, 385),
+        ):
+            months = _get_hebrew_year_months(year)
+            self.assertEqual(
+                _get_hebrew_year_months(year + 1)[TISHREI - 1] - months[TISHREI - 1], year_length
+            )
+            self.assertEqual(months[ADAR_II - 1] == months[ADAR - 1], not _is_leap_year(year))
+
+        months = _get_hebrew_year_months(5784)
+        self.assertEqual(date.fromordinal(months[TISHREI - 1]), date(2023, SEP, 16))
+        self.assertEqual(date.fromordinal(months[ADAR - 1]), date(2024, FEB, 10))
+        self.assertEqual(date.fromordinal(months[ADAR_II - 1]), date(2024, MAR, 11))
+        self.assertEqual(date.fromordinal(months[NISAN - 1]), date(2024, APR, 9))
+
+    def test_holiday_dates(self):
+        for dt, expected in (
+            (self.calendar.israel_independence_date(1948), date(1948, MAY, 14)),
+            (self.calendar.lag_baomer_date(2024), date(2024, MAY, 26)),
+            (self.calendar.passover_date(2024), date(2024, APR, 23)),
+            (self.calendar.purim_date(2024), date(2024, MAR, 24)),
+            (self.calendar.purim_date(2025), date(2025, MAR, 14)),
+            (self.calendar.rosh_hashanah_date(2024), date(2024, OCT, 3)),
+            (self.calendar.shavuot_date(2024), date(2024, JUN, 12)),
+            (self.calendar.sukkot_date(2024), date(2024, OCT, 17)),
+            (self.calendar.tisha_bav_date(2024), date(2024, AUG, 13)),
+            (self.calendar.yom_kippur_date(2024), date(2024, OCT, 12)),
+        ):
+            self.assertEqual(dt, expected)
+
+        self.assertEqual(
+            self.calendar.hanukkah_date(2024), {date(2023, DEC, 8), date(2024, DEC, 26)}
+        )
+
+    def test_table_equality(self):
+        # SHA-256 digest of the 1947-2100 holiday dates tables the calendar was generated from.
+        dates = " ".join(
+            self.calendar._get_holiday(holiday, year).isoformat()
+            for holiday in sorted(_HEBREW_HOLIDAYS)
+            for year in range(1947, 2101)
+        )
+        self.assertEqual(
+            hashlib.sha256(dates.encode()).hexdigest(),
+            "49a5dc7600f6adbd74257e03d86690d2c5f521c87441f6e56acada262cbe43ed",
+        )
+
+    def test_unlimited_range(self):
+        self.assertEqual(self.calendar.rosh_hashanah_date(1), date(1, SEP, 6))
+        self.assertEqual(self.calendar.hanukkah_date(1), {None, date(1, NOV, 28)})
+        self.assertEqual(self.calendar.passover_date(9999), date(9999, MAY, 25))
+        self.assertEqual(self.calendar.rosh_hashanah_date(9999), date(9999, NOV, 4))
+        # Hanukkah moves to January.
+        self.assertEqual(
+            self.calendar.hanukkah_date(9999), {date(9998, JAN, 18), date(9999, JAN, 7)}
+        )
+        self.assertIsNone(self.calendar._get_holiday(HANUKKAH, 3031))
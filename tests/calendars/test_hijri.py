@@ -0,0 +1,77 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+from datetime import date
+
+from holidays.calendars.gregorian import MAR, JUL, AUG, NOV
+from holidays.calendars.hijri import (
+    HIJRI_TABULAR,
+    HIJRI_UMM_AL_QURA,
+    _get_hijri_years_month_starts,
+    _tabular_month_start,
+    _umm_al_qura_month_start,
+)
+from holidays.calendars.islamic import _get_hijri_month_starts, _HIJRI_START_YEAR
+
+
+class TestHijriCalendar(unittest.TestCase):
+    def test_tabular_month_start(self):
+        for year, month, dt in (
+            (1, 1, date(622, JUL, 19)),
+            (1445, 1, date(2023, JUL, 19)),
+            (1445, 9, date(2024, MAR, 11)),
+            (1446, 10, date(2025, MAR, 31)),
+        ):
+            self.assertEqual(date.fromordinal(_tabular_month_start(year, month)), dt)
+
+        # Leap year Dhu al-Hijjah has 30 days.
+        self.assertEqual(_tabular_month_start(3, 1) - _tabular_month_start(2, 12), 30)
+        self.assertEqual(_tabular_month_start(4, 1) - _tabular_month_start(3, 12), 29)
+
+    def test_tabular_month_start_vectorized(self):
+        import numpy as np
+
+        years = np.arange(1440, 1450)
+        self.assertEqual(
+            _tabular_month_start(years, 9).tolist(),
+            [_tabular_month_start(year, 9) for year in range(1440, 1450)],
+        )
+
+    def test_umm_al_qura_month_start(self):
+        for year, month, dt in (
+            (1445, 9, date(2024, MAR, 11)),
+            (1446, 10, date(2025, MAR, 30)),
+            (1501, 1, date(2077, NOV, 17)),
+            (1600, 10, date(2174, AUG, 28)),
+        ):
+            self.assertEqual(date.fromordinal(_umm_al_qura_month_start(year, month)), dt)
+
+    def test_umm_al_qura_table_validation(self):
+        # The current Umm al-Qura rules are in effect since 1423 AH.
+        month_starts = _get_hijri_years_month_starts(1423, 1500)
+        table_month_starts = [
+            ordinal
+            for year in range(1423, 1501)
+            for ordinal in _get_hijri_month_starts(year - _HIJRI_START_YEAR)[:12]
+        ] + [_get_hijri_month_starts(1500 - _HIJRI_START_YEAR)[12]]
+        self.assertEqual(len(month_starts), len(table_month_starts))
+        mismatches = sum(a != b for a, b in zip(month_starts, table_month_starts))
+        self.assertLessEqual(mismatches / len(month_starts), 0.005)
+
+    def test_get_hijri_years_month_starts(self):
+        for method in (HIJRI_TABULAR, HIJRI_UMM_AL_QURA):
+            month_starts = _get_hijri_years_month_starts(1445, 1446, method)
+            self.assertEqual(len(month_starts), 25)
+            self.assertTrue(all(29 <= b - a <= 30 for a, b in zip(month_starts, month_starts[1:])))
+
+        self.assertRaises(ValueError, lambda: _get_hijri_years_month_starts(1445, 1446, "X"))
@@ -0,0 +1,46 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+
+import unittest
+from datetime import date
+
+from holidays.calendars.gregorian import JAN, FEB, OCT, NOV
+from holidays.calendars.hindu import _CustomHinduHolidays, _HinduLunisolar
+
+
+class CustomHinduHolidays(_CustomHinduHolidays):
+    DIWALI_DATES = {
+        2100: (NOV, 2),
+    }
+
+
+class TestHinduLunisolarCalendar(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.calendar = _HinduLunisolar()
+
+    def test_holiday_dates(self):
+        self.assertEqual(self.calendar.diwali_date(2024), (date(2024, OCT, 30), True))
+        self.assertEqual(self.calendar.thaipusam_date(2024), (date(2024, FEB, 24), True))
+
+    def test_table_horizon(self):
+        # The tables cover 1901-2099, other years are calculated astronomically.
+        self.assertEqual(self.calendar.diwali_date(1900), (date(1900, OCT, 22), True))
+        self.assertEqual(self.calendar.diwali_date(2100), (date(2100, NOV, 1), True))
+        self.assertEqual(self.calendar.thaipusam_date(2100), (date(2100, JAN, 26), True))
+        self.assertEqual(self.calendar.diwali_date(0), (None, True))
+
+    def test_custom_calendar(self):
+        calendar = CustomHinduHolidays()
+        self.assertEqual(calendar.diwali_date(2100), (date(2100, NOV, 2), False))
+        self.assertEqual(calendar.diwali_date(2101), (date(2101, OCT, 21), True))
@@ -0,0 +1,134 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+from datetime import date
+from unittest import mock
+
+from holidays.calendars.gregorian import JAN, MAR, APR, MAY, JUN, AUG, SEP, OCT, NOV, DEC
+from holidays.calendars.islamic import (
+    _CustomIslamicHolidays,
+    _IslamicLunar,
+    _get_estimated_dates,
+    _get_hijri_year_starts,
+    _HIJRI_MONTH_LENGTHS,
+    _HIJRI_START_DATE,
+)
+
+
+class CustomIslamicHolidays(_CustomIslamicHolidays):
+    EID_AL_FITR_DATES = {
+        2023: (APR, 22),
+        2024: ((APR, 10), (APR, 11)),
+    }
+
+
+class TestIslamicLunarCalendar(unittest.TestCase):
+    def setUp(self):
+        super().setUpClass()
+        self.calendar = _IslamicLunar()
+
+    def test_month_lengths(self):
+        year_starts = _get_hijri_year_starts()
+        self.assertEqual(len(year_starts), len(_HIJRI_MONTH_LENGTHS) + 1)
+        self.assertEqual(date.fromordinal(year_starts[0]), _HIJRI_START_DATE)
+        # 1 Muharram 1501 AH.
+        self.assertEqual(date.fromordinal(year_starts[-1]), date(2077, NOV, 17))
+
+    def test_year_bounds(self):
+        self.assertEqual(tuple(self.calendar.hijri_new_year_dates(1923)), ())
+        self.assertEqual(
+            tuple(self.calendar.hijri_new_year_dates(1924)), ((date(1924, AUG, 1), True),)
+        )
+        self.assertEqual(tuple(self.calendar.eid_al_fitr_dates(1924)), ())
+        self.assertEqual(tuple(self.calendar.eid_al_adha_dates(1)), ())
+
+    def test_table_horizon(self):
+        # The Umm al-Qura table ends in 1500 AH, later dates are calculated astronomically.
+        self.assertEqual(
+            tuple(self.calendar.hijri_new_year_dates(2077)),
+            ((date(2076, NOV, 27), True), (date(2077, NOV, 17), True)),
+        )
+        self.assertEqual(
+            tuple(self.calendar.eid_al_fitr_dates(2100)),
+            ((date(2099, DEC, 13), True), (date(2100, DEC, 3), True)),
+        )
+        self.assertEqual(
+            tuple(self.calendar.eid_al_adha_dates(9999)),
+            ((date(9998, SEP, 23), True), (date(9999, SEP, 12), True)),
+        )
+
+    def test_holiday_dates(self):
+        for dates, expected in (
+            # Last day of Safar.
+            (
+                self.calendar.ali_al_rida_death_dates(1948),
+                ((1947, JAN, 22), (1948, JAN, 11), (1948, DEC, 30)),
+            ),
+            (self.calendar.eid_al_adha_dates(2024), ((2023, JUN, 28), (2024, JUN, 16))),
+            (
+                self.calendar.eid_al_fitr_dates(2033),
+                ((2032, JAN, 14), (2033, JAN, 2), (2033, DEC, 23)),
+            ),
+            (
+                self.calendar.hijri_new_year_dates(2008),
+                ((2007, JAN, 20), (2008, JAN, 10), (2008, DEC, 29)),
+            ),
+            (self.calendar.mawlid_dates(1925), ((1924, OCT, 10), (1925, SEP, 30))),
+            (self.calendar.ramadan_beginning_dates(2025), ((2024, MAR, 11), (2025, MAR, 1))),
+        ):
+            self.assertEqual(tuple(dates), tuple((date(*dt), True) for dt in expected))
+
+    def test_custom_calendar(self):
+        calendar = CustomIslamicHolidays()
+        self.assertEqual(
+            tuple(calendar.eid_al_fitr_dates(2023)),
+            ((date(2022, MAY, 2), True), (date(2023, APR, 22), False)),
+        )
+        self.assertEqual(
+            tuple(calendar.eid_al_fitr_dates(2024)),
+            (
+                (date(2023, APR, 22), False),
+                (date(2024, APR, 10), False),
+                (date(2024, APR, 11), False),
+            ),
+        )
+        self.assertEqual(
+            tuple(calendar.eid_al_fitr_dates(2025)),
+            (
+                (date(2024, APR, 10), False),
+                (date(2024, APR, 11), False),
+                (date(2025, MAR, 30), True),
+            ),
+        )
+        self.assertEqual(
+            tuple(calendar.eid_al_adha_dates(2024)),
+            tuple(self.calendar.eid_al_adha_dates(2024)),
+        )
+
+    def test_holidays_index(self):
+        with mock.patch(
+            "holidays.calendars.islamic._get_estimated_dates", wraps=_get_estimated_dates
+        ) as get_estimated_dates:
+            tuple(self.calendar.eid_al_fitr_dates(2024))
+            tuple(self.calendar.eid_al_fitr_dates(2024))
+            tuple(self.calendar.eid_al_adha_dates(2024))
+            self.assertEqual(get_estimated_dates.call_count, 4)
+
+            # The previous year dates are reused.
+            tuple(self.calendar.eid_al_fitr_dates(2025))
+            self.assertEqual(get_estimated_dates.call_count, 5)
+            self.assertEqual(set(self.calendar._holidays_index), {2024, 2025})
+
+            tuple(self.calendar.eid_al_fitr_dates(2030))
+            self.assertEqual(get_estimated_dates.call_count, 7)
+            self.assertEqual(set(self.calendar._holidays_index), {2029, 2030})
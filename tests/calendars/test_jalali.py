@@ -0,0 +1,74 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+
+import unittest
+from datetime import date
+
+from holidays.calendars.gregorian import JAN, FEB, MAR, SEP, OCT, DEC
+from holidays.calendars.jalali import (
+    _get_jalali_year_starts,
+    _jalali_to_ordinal,
+    _jalali_to_ordinals,
+    _ordinal_to_jalali,
+    _ordinals_to_jalali,
+)
+
+
+class TestJalaliCalendar(unittest.TestCase):
+    def test_year_starts(self):
+        year_starts = _get_jalali_year_starts(1402, 1403)
+        self.assertEqual(
+            [date.fromordinal(ordinal) for ordinal in year_starts],
+            [date(2023, MAR, 21), date(2024, MAR, 20), date(2025, MAR, 21)],
+        )
+
+    def test_conversion(self):
+        for jalali_date, dt in (
+            ((1, 1, 1), date(622, MAR, 22)),
+            ((1357, 11, 22), date(1979, FEB, 11)),
+            ((1402, 12, 29), date(2024, MAR, 19)),
+            ((1403, 1, 1), date(2024, MAR, 20)),
+            ((1403, 6, 31), date(2024, SEP, 21)),
+            ((1403, 7, 1), date(2024, SEP, 22)),
+            ((1403, 10, 11), date(2024, DEC, 31)),
+            ((1403, 10, 12), date(2025, JAN, 1)),
+            # Leap year Esfand 30th.
+            ((1403, 12, 30), date(2025, MAR, 20)),
+            ((1404, 7, 9), date(2025, OCT, 1)),
+        ):
+            self.assertEqual(date.fromordinal(_jalali_to_ordinal(*jalali_date)), dt)
+            self.assertEqual(_ordinal_to_jalali(dt.toordinal()), jalali_date)
+
+    def test_batch_conversion(self):
+        ordinals = list(range(date(2023, JAN, 1).toordinal(), date(2026, JAN, 1).toordinal()))
+        jalali_dates = _ordinals_to_jalali(ordinals)
+        self.assertEqual(
+            list(zip(*jalali_dates)), [_ordinal_to_jalali(ordinal) for ordinal in ordinals]
+        )
+        self.assertEqual(_jalali_to_ordinals(*jalali_dates), ordinals)
+        self.assertEqual(_ordinals_to_jalali([]), ([], [], []))
+
+    def test_batch_conversion_vectorized(self):
+        import numpy as np
+
+        ordinals = np.arange(date(1900, JAN, 1).toordinal(), date(2101, JAN, 1).toordinal())
+        years, months, days = _ordinals_to_jalali(ordinals)
+        self.assertEqual(
+            list(zip(years.tolist(), months.tolist(), days.tolist())),
+            list(zip(*_ordinals_to_jalali(ordinals.tolist()))),
+        )
+        self.assertTrue((_jalali_to_ordinals(years, months, days) == ordinals).all())
+
+        empty = np.array([], dtype=int)
+        self.assertEqual(_jalali_to_ordinals(empty, empty, empty).size, 0)
+        self.assertEqual(_ordinals_to_jalali(empty)[0].size, 0)
@@ -0,0 +1,102 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+
+import unittest
+from datetime import date
+
+from holidays.calendars.chinese import _ChineseLunisolar, _LUNAR_HOLIDAYS
+from holidays.calendars.gregorian import JAN, FEB, MAR, APR, MAY, JUN, SEP, OCT, NOV, DEC
+from holidays.calendars.lunisolar import (
+    QINGMING_LONGITUDE,
+    WINTER_SOLSTICE_LONGITUDE,
+    _get_lunar_year_months,
+    _lunar_to_gregorian,
+    _solar_term_date,
+)
+
+
+class TestChineseLunisolarRules(unittest.TestCase):
+    def test_solar_term_date(self):
+        for year, longitude, dt in (
+            (1968, QINGMING_LONGITUDE, date(1968, APR, 5)),
+            (2008, QINGMING_LONGITUDE, date(2008, APR, 4)),
+            (2042, QINGMING_LONGITUDE, date(2042, APR, 4)),
+            (1952, WINTER_SOLSTICE_LONGITUDE, date(1952, DEC, 22)),
+            (2024, WINTER_SOLSTICE_LONGITUDE, date(2024, DEC, 21)),
+        ):
+            self.assertEqual(_solar_term_date(year, longitude), dt)
+
+    def test_lunar_year_months(self):
+        def months(year):
+            return tuple(
+                (month, is_leap, date.fromordinal(start))
+                for month, is_leap, start in _get_lunar_year_months(year)
+            )
+
+        self.assertEqual(
+            months(2024)[:3],
+            (
+                (11, False, date(2023, DEC, 13)),
+                (12, False, date(2024, JAN, 11)),
+                (1, False, date(2024, FEB, 10)),
+            ),
+        )
+        self.assertEqual(len(months(2024)), 12)
+
+        # Leap 2nd month.
+        self.assertEqual(
+            months(2023)[3:6],
+            (
+                (2, False, date(2023, FEB, 20)),
+                (2, True, date(2023, MAR, 22)),
+                (3, False, date(2023, APR, 20)),
+            ),
+        )
+
+        # Leap 11th month of the 2033 lunar year.
+        self.assertEqual(
+            months(2034)[:3],
+            (
+                (11, False, date(2033, NOV, 22)),
+                (11, True, date(2033, DEC, 22)),
+                (12, False, date(2034, JAN, 20)),
+            ),
+        )
+
+    def test_lunar_to_gregorian(self):
+        for year, month, day, dt in (
+            (1900, 1, 1, date(1900, JAN, 31)),
+            (2023, 3, 10, date(2023, APR, 29)),
+            (2100, 1, 1, date(2100, FEB, 9)),
+            (2100, 8, 15, date(2100, SEP, 18)),
+            (2200, 5, 5, date(2200, JUN, 16)),
+        ):
+            self.assertEqual(_lunar_to_gregorian(year, month, day), dt)
+
+    def test_table_validation(self):
+        # Known differences: the tables place 1916 Lunar New Year by the former
+        # Beijing local time, have an error in 2025 3rd month length and the 2057
+        # and 2089 new moons are within minutes of midnight.
+        known_differences = {
+            (1916, 1): date(1916, FEB, 4),
+            (2025, 4): date(2025, MAY, 5),
+            (2057, 9): date(2057, OCT, 6),
+            (2089, 8): date(2089, SEP, 18),
+        }
+        for holiday, (month, day) in _LUNAR_HOLIDAYS.items():
+            for year, dt in getattr(_ChineseLunisolar, f"{holiday}_DATES").items():
+                self.assertEqual(
+                    _lunar_to_gregorian(year, month, day),
+                    known_differences.get((year, month), date(year, *dt)),
+                    f"{holiday} {year}",
+                )
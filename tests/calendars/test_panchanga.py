@@ -0,0 +1,83 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+
+import unittest
+from datetime import date
+
+from holidays.calendars.astronomy import J2000, _new_moon
+from holidays.calendars.gregorian import JAN, FEB, MAY, OCT, NOV
+from holidays.calendars.panchanga import (
+    KRISHNA_CHATURDASHI,
+    PUSHYA,
+    _diwali_date,
+    _lahiri_ayanamsa,
+    _nakshatra,
+    _thaipusam_date,
+    _tithi_start,
+)
+from holidays.countries.malaysia import MalaysiaHinduHolidays
+from holidays.countries.singapore import SingaporeHinduHolidays
+
+
+class TestPanchanga(unittest.TestCase):
+    def test_lahiri_ayanamsa(self):
+        self.assertAlmostEqual(_lahiri_ayanamsa(J2000), 23.85306, delta=0.00001)
+        self.assertAlmostEqual(_lahiri_ayanamsa(J2000 + 36525), 25.2503, delta=0.0001)
+
+    def test_tithi_start(self):
+        new_moon = _new_moon(300)
+        self.assertAlmostEqual(_tithi_start(new_moon + 1, 1), new_moon, delta=0.0001)
+        self.assertLess(
+            _tithi_start(new_moon - 1, KRISHNA_CHATURDASHI + 1),
+            _tithi_start(new_moon - 1, KRISHNA_CHATURDASHI + 2),
+        )
+
+    def test_nakshatra(self):
+        # 2024 January 25 noon (IST), the Moon in Pushya.
+        self.assertEqual(_nakshatra(2460335.2708), PUSHYA)
+
+    def test_official_dates(self):
+        for calendar, exceptions in (
+            # 2002-2003 dates were 1 day earlier than the Chaturdashi at dawn.
+            (MalaysiaHinduHolidays, {2002, 2003}),
+            # 2009 date is the next month new moon Chaturdashi.
+            (SingaporeHinduHolidays, {2002, 2003, 2009}),
+        ):
+            for year, dt in calendar.DIWALI_DATES_CUSTOM_CALENDAR.items():
+                if year not in exceptions:
+                    self.assertEqual(_diwali_date(year), date(year, *dt), year)
+
+        for year, dt in MalaysiaHinduHolidays.THAIPUSAM_DATES_CUSTOM_CALENDAR.items():
+            self.assertEqual(_thaipusam_date(year), date(year, *dt), year)
+
+    def test_holiday_dates(self):
+        for dt, expected in (
+            (_diwali_date(1900), date(1900, OCT, 22)),
+            (_diwali_date(2100), date(2100, NOV, 1)),
+            # No Chaturdashi at dawn.
+            (_diwali_date(2101), date(2101, OCT, 21)),
+            (_thaipusam_date(1900), date(1900, JAN, 16)),
+            (_thaipusam_date(2100), date(2100, JAN, 26)),
+            # No Pushya at noon.
+            (_thaipusam_date(2124), date(2124, JAN, 31)),
+        ):
+            self.assertEqual(dt, expected)
+
+    def test_calendar_drift(self):
+        # The sidereal months slowly move across the Gregorian year.
+        self.assertEqual(_diwali_date(7400), date(7400, JAN, 12))
+        self.assertEqual(_diwali_date(9999), date(9999, FEB, 7))
+        self.assertEqual(_thaipusam_date(9999), date(9999, MAY, 21))
+        self.assertEqual(_thaipusam_date(1), date(1, 12, 18))
+        # The full moons after the year 1 and 2 sankrantis fall in the years 1 and 3.
+        self.assertIsNone(_thaipusam_date(2))
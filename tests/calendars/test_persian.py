@@ -22,10 +22,28 @@ class TestPersianCalendar(unittest.TestCase):
         self.calendar = _Persian()
 
     def test_year_bounds(self):
-        self.assertIsNone(self.calendar.new_year_date(1900))
-        self.assertIsNone(self.calendar.new_year_date(2101))
-        self.assertIsNone(self.calendar.persian_to_gregorian(1900, 2, 2))
-        self.assertIsNone(self.calendar.persian_to_gregorian(2101, 3, 3))
+        self.assertIsNone(self.calendar.new_year_date(0))
+        self.assertIsNone(self.calendar.new_year_date(10000))
+        self.assertIsNone(self.calendar.persian_to_gregorian(9999, 12, 29))
+        self.assertEqual(self.calendar.new_year_date(1), date(1, 3, 21))
+        self.assertEqual(self.calendar.new_year_date(1900), date(1900, 3, 21))
+        self.assertEqual(self.calendar.persian_to_gregorian(2101, 3, 3), date(2101, 5, 24))
+        self.assertEqual(self.calendar.new_year_date(9999), date(9999, 3, 18))
+
+    def test_new_year_date_approximation(self):
+        # The leap years approximation used for 1901-2100 years.
+        for year in range(1901, 2101):
+            day = 21
+            if (
+                (year % 4 == 1 and year >= 2029)
+                or (year % 4 == 2 and year >= 2062)
+                or (year % 4 == 3 and year >= 2095)
+                or (year % 4 == 0 and 1996 <= year <= 2096)
+            ):
+                day = 20
+            elif (year % 4 == 2 and year <= 1926) or (year % 4 == 3 and year <= 1959):
+                day = 22
+            self.assertEqual(self.calendar.new_year_date(year), date(year, 3, day), year)
 
     def test_new_year_date(self):
         for year, day in (
@@ -11,11 +11,12 @@
 #  License: MIT (see LICENSE file)
 
 import unittest
+import weakref
 from datetime import date
 
 from holidays import calendars
 from holidays.calendars.gregorian import JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG, SEP, OCT, NOV
-from holidays.calendars.thai import KHMER_CALENDAR
+from holidays.calendars.thai import KHMER_CALENDAR, _get_thai_year_starts
 
 
 class TestThaiLunisolarCalendar(unittest.TestCase):
@@ -26,6 +27,23 @@ class TestThaiLunisolarCalendar(unittest.TestCase):
     def test_check_calendar(self):
         self.assertRaises(ValueError, lambda: calendars._ThaiLunisolar("INVALID_CALENDAR"))
 
+    def test_year_starts(self):
+        year_starts = _get_thai_year_starts()
+        self.assertEqual(len(year_starts), self.calendar.END_YEAR - self.calendar.START_YEAR + 1)
+        self.assertEqual(date.fromordinal(year_starts[0]), self.calendar.START_DATE)
+        for year, dt in (
+            (2010, date(2009, NOV, 18)),
+            (2157, date(2156, NOV, 13)),
+        ):
+            self.assertEqual(self.calendar._get_start_date(year), dt)
+
+    def test_no_instance_cache(self):
+        calendar = calendars._ThaiLunisolar()
+        calendar.visakha_bucha_date(2024)
+        calendar_ref = weakref.ref(calendar)
+        del calendar
+        self.assertIsNone(calendar_ref())
+
     def test_asarnha_bucha_date(self):
         # THAI_CALENDAR
         asarnha_bucha_year_date = {
@@ -540,6 +540,16 @@ class TestMalaysia(CommonCountryTests, TestCase):
         self.assertHoliday(dt)
         self.assertNoNonObservedHoliday(dt)
 
+    def test_weekend(self):
+        my_holidays = Malaysia(years=2014)
+        johor_holidays = Malaysia(subdiv="01", years=(2013, 2014, 2025))
+        for dt in ("2014-03-07", "2014-03-08", "2014-03-09"):
+            self.assertEqual(my_holidays.is_working_day(dt), dt == "2014-03-07")
+        for dt in ("2013-03-08", "2014-03-09", "2025-03-07"):
+            self.assertTrue(johor_holidays.is_working_day(dt))
+        for dt in ("2013-03-10", "2014-03-07", "2025-03-09"):
+            self.assertFalse(johor_holidays.is_working_day(dt))
+
     def test_birthday_of_sultan_of_johor(self):
         name = "Hari Keputeraan Sultan Johor"
         self.assertNoHolidayName(name)
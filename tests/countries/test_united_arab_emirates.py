@@ -10,6 +10,7 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+from datetime import date
 from unittest import TestCase
 
 from holidays.countries.united_arab_emirates import UnitedArabEmirates, AE, ARE
@@ -43,6 +44,14 @@ class TestUnitedArabEmirates(CommonCountryTests, TestCase):
             "2020-12-03",
         )
 
+    def test_weekend(self):
+        ae_holidays = UnitedArabEmirates(years=range(2021, 2023))
+        for dt in ("2021-12-24", "2021-12-25", "2022-01-08", "2022-01-09"):
+            self.assertFalse(ae_holidays.is_working_day(dt))
+        for dt in ("2021-12-26", "2022-01-07"):
+            self.assertTrue(ae_holidays.is_working_day(dt))
+        self.assertEqual(ae_holidays.business_day_offset("2021-12-30", +2), date(2022, 1, 4))
+
     def test_commemoration_day(self):
         self.assertNoHoliday("2014-11-30")
         self.assertNoHolidayName("يوم الشهيد", 2014, 2023)
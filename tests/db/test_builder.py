@@ -0,0 +1,98 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import runpy
+import sys
+import warnings
+from contextlib import redirect_stderr
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+from holidays.db.builder import CalendarTask, build_database, get_calendar, get_calendar_tasks
+from holidays.db.reader import HolidayDatabase
+
+
+class TestCalendarTasks(TestCase):
+    def test_get_calendar_tasks(self):
+        tasks = get_calendar_tasks(("US",), ("NYSE",))
+        self.assertEqual(tasks[0], CalendarTask("US", None, ("public",), None))
+        self.assertEqual(tasks[-1], CalendarTask("XNYS", None, ("public",), None))
+        self.assertIn(CalendarTask("US", "CA", ("public",), None), tasks)
+        self.assertIn(CalendarTask("US", "CA", ("public", "unofficial"), None), tasks)
+        self.assertEqual(len(tasks), len(set(tasks)))
+        self.assertEqual(
+            get_calendar_tasks(("GB", "UK"), ("NYSE", "XNYS")),
+            get_calendar_tasks(("GB",), ("XNYS",)),
+        )
+        self.assertEqual(
+            get_calendar_tasks(("AW",), languages=("en_US", "nl")),
+            [
+                CalendarTask("AW", None, ("public",), "en_US"),
+                CalendarTask("AW", None, ("public",), "nl"),
+            ],
+        )
+
+    def test_get_all_calendar_tasks(self):
+        entities = {task.entity for task in get_calendar_tasks()}
+        self.assertIn("US", entities)
+        self.assertIn("XNYS", entities)
+        self.assertNotIn("NYSE", entities)
+
+    def test_unknown_entity(self):
+        self.assertRaises(ValueError, lambda: get_calendar_tasks(("US", "XX")))
+
+    def test_get_calendar(self):
+        calendar = get_calendar(CalendarTask("RU", None, ("public",), "en_US"), range(2024, 2025))
+        self.assertEqual(calendar.holidays[0], (738886, "New Year Holidays"))
+        self.assertEqual(len(calendar.workdays), 5)
+        self.assertEqual(calendar.weekends, bytes((0b1100000,)))
+
+
+class TestBuildDatabase(TestCase):
+    def test_build_database(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "holidays.db"
+            self.assertEqual(build_database(path, ("AE",), years=(2024, 2020), processes=2), 1)
+            with HolidayDatabase(path) as db:
+                self.assertEqual((db.start_year, db.end_year), (2020, 2024))
+                self.assertEqual(db.get("AE", "2022-12-02"), "اليوم الوطني")
+
+
+class TestDatabaseCli(TestCase):
+    def _run_cli(self, *args):
+        argv = ["holidays.db", "--start-year", "2024", "--end-year", "2024", "-j", "1"]
+        with warnings.catch_warnings(), mock.patch.object(sys, "argv", argv + list(args)):
+            runpy.run_module("holidays.db", run_name="__main__")
+
+    def test_cli(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "holidays.db")
+            self._run_cli("-c", "US", "-m", "NYSE", "-l", "en_US", "-o", path)
+            with HolidayDatabase(path) as db:
+                self.assertEqual(
+                    db.get("XNYS", "2024-07-04", language="en_US"), "Independence Day"
+                )
+                self.assertTrue(db.is_working_day("US", "2024-07-05", language="en_US"))
+
+    def test_cli_import(self):
+        filters = warnings.filters[:]
+        with mock.patch.object(sys, "argv", ["holidays.db"]):
+            runpy.run_module("holidays.db")
+
+        self.assertEqual(warnings.filters, filters)
+
+    def test_cli_errors(self):
+        for args in (("-c", "XX"), ("--start-year", "2025")):
+            with redirect_stderr(StringIO()), self.assertRaises(SystemExit):
+                self._run_cli(*args)
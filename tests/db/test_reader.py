@@ -0,0 +1,135 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import json
+import os
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+import holidays
+from holidays.db.builder import build_database
+from holidays.db.reader import HolidayDatabase, get_calendar_key
+from holidays.snapshots import SNAPSHOT_LANGUAGE, get_snapshot_cases
+
+SNAPSHOTS_PATH = Path(__file__).parents[2] / "snapshots"
+
+
+class TestHolidayDatabase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = TemporaryDirectory()
+        cls.path = Path(cls.tmp_dir.name) / "holidays.db"
+        build_database(cls.path, ("AE", "MY", "RU"), ("XNYS",), (None, "en_US"), processes=1)
+        cls.db = HolidayDatabase(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+        cls.tmp_dir.cleanup()
+
+    def _get_days(self, start, end):
+        dt = start
+        while dt <= end:
+            yield dt
+            dt += timedelta(days=1)
+
+    def test_get_calendar_key(self):
+        self.assertEqual(get_calendar_key("US"), "US\t\t\t")
+        self.assertEqual(
+            get_calendar_key("US", "CA", ("unofficial", "public", "public"), "en_US"),
+            "US\tCA\tpublic,unofficial\ten_US",
+        )
+        self.assertEqual(get_calendar_key("US", categories="public"), "US\t\tpublic\t")
+
+    def test_snapshots(self):
+        for entity_cls in (holidays.AE, holidays.MY, holidays.RU, holidays.XNYS):
+            for case in get_snapshot_cases(entity_cls):
+                with open(SNAPSHOTS_PATH / f"{case.name}.json", encoding="UTF-8") as file:
+                    snapshot = json.load(file)
+
+                entity = getattr(entity_cls, "country", getattr(entity_cls, "market", None))
+                db_holidays = {}
+                for dt in self._get_days(date(1950, 1, 1), date(2050, 12, 31)):
+                    name = self.db.get(
+                        entity,
+                        dt,
+                        subdiv=case.subdiv,
+                        categories=entity_cls.supported_categories,
+                        language=SNAPSHOT_LANGUAGE,
+                    )
+                    if name is not None:
+                        db_holidays[str(dt)] = name
+                self.assertEqual(db_holidays, snapshot, case.name)
+
+    def test_live_holidays(self):
+        for entity, entity_cls, subdivs in (
+            ("AE", holidays.AE, (None,)),
+            ("MY", holidays.MY, (None, "01", "02", "13")),
+            ("RU", holidays.RU, (None,)),
+            ("XNYS", holidays.XNYS, (None,)),
+        ):
+            for subdiv in subdivs:
+                live_holidays = entity_cls(
+                    subdiv=subdiv, language=entity_cls.default_language, years=range(2000, 2026)
+                )
+                for dt in self._get_days(date(2000, 1, 1), date(2025, 12, 31)):
+                    self.assertEqual(self.db.get(entity, dt, subdiv), live_holidays.get(dt))
+                    self.assertEqual(self.db.is_holiday(entity, dt, subdiv), dt in live_holidays)
+                    self.assertEqual(
+                        self.db.is_working_day(entity, dt, subdiv),
+                        live_holidays.is_working_day(dt),
+                        f"{entity} {subdiv} {dt}",
+                    )
+
+    def test_keys(self):
+        self.assertEqual(self.db.get("RU", "2024-01-07"), "Рождество Христово")
+        self.assertEqual(self.db.get("RU", date(2024, 1, 7), language="en_US"), "Christmas Day")
+        self.assertEqual(
+            self.db.get("RU", date(2024, 1, 7), categories="public"), "Рождество Христово"
+        )
+        self.assertEqual(self.db.get("RU", 1704585600), "Рождество Христово")
+        self.assertEqual(self.db.get("RU", date(2024, 1, 10), default="-"), "-")
+        self.assertTrue(self.db.is_working_day("RU", "2024-04-27"))
+        self.assertFalse(self.db.is_working_day("RU", "2024-04-28"))
+        self.assertRaises(TypeError, lambda: self.db.get("RU", []))
+
+    def test_default_language(self):
+        with mock.patch.dict(os.environ, {"LANGUAGE": "en_US"}):
+            self.assertEqual(self.db.get("RU", "2024-01-07"), "Рождество Христово")
+            self.assertEqual(self.db.get("RU", "2060-01-07"), "Рождество Христово")
+
+    def test_fallback(self):
+        # Out of the precomputed years range.
+        self.assertEqual(self.db.get("RU", "2060-01-07", language="en_US"), "Christmas Day")
+        self.assertTrue(self.db.is_holiday("AE", "2100-12-02"))
+        self.assertFalse(self.db.is_working_day("AE", "2100-12-04"))
+        # Not precomputed entities, categories and languages.
+        self.assertEqual(self.db.get("US", "2024-07-04"), "Independence Day")
+        self.assertEqual(self.db.get("NYSE", "2024-07-04"), "Independence Day")
+        self.assertFalse(self.db.is_working_day("US", "2024-02-14", categories="unofficial"))
+        self.assertEqual(self.db.get("AE", "2024-12-02", language="ar"), "اليوم الوطني")
+        self.assertRaises(ValueError, lambda: self.db.get("XX", "2024-01-01"))
+
+    def test_byteorder(self):
+        with mock.patch.object(sys, "byteorder", "big"), TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "holidays.db"
+            build_database(path, ("RU",), years=range(2024, 2025), processes=1)
+            with HolidayDatabase(path) as db:
+                self.assertEqual((db.start_year, db.end_year), (2024, 2024))
+                self.assertEqual(db.get("RU", "2024-01-07"), "Рождество Христово")
+                self.assertTrue(db.is_working_day("RU", "2024-04-27"))
+
+    def test_not_a_database(self):
+        self.assertRaises(ValueError, lambda: HolidayDatabase(Path(__file__)))
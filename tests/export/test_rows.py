@@ -0,0 +1,140 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+from datetime import date
+from unittest import TestCase
+
+from holidays.export.rows import (
+    ExportTask,
+    HolidayRow,
+    get_export_tasks,
+    get_task_rows,
+    iter_rows,
+    iter_task_rows,
+)
+
+
+class TestExportTasks(TestCase):
+    def test_get_export_tasks(self):
+        tasks = get_export_tasks(("US",), ("NYSE",))
+        self.assertEqual(tasks[0], ExportTask("US", None, "public", None))
+        self.assertEqual(tasks[-1], ExportTask("XNYS", None, "public", None))
+        self.assertIn(ExportTask("US", "CA", "public", None), tasks)
+        self.assertIn(ExportTask("US", "CA", "unofficial", None), tasks)
+        self.assertIn(ExportTask("XNYS", None, "half_day", None), tasks)
+        self.assertEqual(len(tasks), len(set(tasks)))
+        self.assertEqual(
+            get_export_tasks(("GB", "UK"), ("NYSE", "XNYS")), get_export_tasks(("GB",), ("XNYS",))
+        )
+
+        self.assertEqual(
+            get_export_tasks(("DE",), languages=("en_US", "de"))[:3],
+            [
+                ExportTask("DE", None, "catholic", "de"),
+                ExportTask("DE", None, "catholic", "en_US"),
+                ExportTask("DE", None, "public", "de"),
+            ],
+        )
+        self.assertEqual(
+            get_export_tasks(("AW",), languages=("ko",)),
+            [ExportTask("AW", None, "public", "pap_AW")],
+        )
+        self.assertEqual(len({task.language for task in get_export_tasks(("AW",))}), 4)
+
+    def test_get_all_export_tasks(self):
+        entities = {task.entity for task in get_export_tasks()}
+        self.assertIn("US", entities)
+        self.assertIn("XNYS", entities)
+        self.assertNotIn("NYSE", entities)
+
+    def test_unknown_entity(self):
+        self.assertRaises(ValueError, lambda: get_export_tasks(("US", "XX")))
+
+
+class TestExportRows(TestCase):
+    def test_iter_task_rows(self):
+        rows = list(iter_task_rows(ExportTask("US", None, "public", None), range(2021, 2023)))
+        self.assertIn(
+            HolidayRow(
+                "US",
+                None,
+                "public",
+                None,
+                date(2021, 12, 24),
+                "Christmas Day (observed)",
+                True,
+                False,
+            ),
+            rows,
+        )
+        self.assertIn(
+            HolidayRow(
+                "US", None, "public", None, date(2021, 12, 25), "Christmas Day", False, False
+            ),
+            rows,
+        )
+        self.assertEqual([row.date for row in rows], sorted(row.date for row in rows))
+
+    def test_observed_without_label(self):
+        rows = get_task_rows(ExportTask("XNYS", None, "public", None), range(2021, 2022))
+        self.assertEqual(
+            {row.date for row in rows if row.observed}, {date(2021, 7, 5), date(2021, 12, 24)}
+        )
+
+    def test_estimated(self):
+        rows = get_task_rows(ExportTask("AE", None, "public", "en_US"), range(2030, 2031))
+        self.assertIn(
+            HolidayRow(
+                "AE",
+                None,
+                "public",
+                "en_US",
+                date(2030, 4, 13),
+                "Eid al-Adha (estimated)",
+                False,
+                True,
+            ),
+            rows,
+        )
+        self.assertFalse(any(row.estimated for row in rows if row.name == "New Year's Day"))
+
+        rows = get_task_rows(ExportTask("SA", None, "public", "en_US"), range(2030, 2031))
+        self.assertIn(
+            HolidayRow(
+                "SA",
+                None,
+                "public",
+                "en_US",
+                date(2030, 4, 16),
+                "Eid al-Adha Holiday (observed, estimated)",
+                True,
+                True,
+            ),
+            rows,
+        )
+
+    def test_multiple_names(self):
+        rows = get_task_rows(ExportTask("IR", None, "public", "en_US"), range(2015, 2016))
+        self.assertEqual(
+            [(row.name, row.estimated) for row in rows if row.date == date(2015, 3, 23)],
+            [("Martyrdom of Fatima (estimated)", True), ("Persian New Year", False)],
+        )
+
+    def test_iter_rows(self):
+        tasks = get_export_tasks(("US",), ("NYSE",))[:3] + get_export_tasks(markets=("NYSE",))
+        rows = list(iter_rows(tasks, range(2024, 2025), processes=1))
+        self.assertEqual(list(iter_rows(tasks, range(2024, 2025), processes=2)), rows)
+        self.assertEqual([row.entity for row in rows], sorted(row.entity for row in rows))
+        self.assertEqual(
+            rows,
+            [row for task in tasks for row in get_task_rows(task, range(2024, 2025))],
+        )
@@ -0,0 +1,147 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import csv
+import json
+import runpy
+import sys
+import warnings
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import date
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from holidays.export.rows import HolidayRow
+from holidays.export.writers import write_arrow, write_csv, write_jsonl
+
+ROWS = [
+    HolidayRow(
+        "US", None, "public", None, date(2021, 12, 24), "Christmas Day (observed)", True, False
+    ),
+    HolidayRow(
+        "AE", "DU", "public", "en_US", date(2030, 4, 13), "Eid al-Adha (estimated)", False, True
+    ),
+]
+
+
+class TestWriters(TestCase):
+    def test_write_csv(self):
+        with StringIO() as file:
+            self.assertEqual(write_csv(iter(ROWS), file), 2)
+            lines = file.getvalue().splitlines()
+
+        self.assertEqual(lines[0], "entity,subdiv,category,language,date,name,observed,estimated")
+        self.assertEqual(lines[1], "US,,public,,2021-12-24,Christmas Day (observed),true,false")
+        self.assertEqual(
+            next(csv.reader(lines[2:])),
+            [
+                "AE",
+                "DU",
+                "public",
+                "en_US",
+                "2030-04-13",
+                "Eid al-Adha (estimated)",
+                "false",
+                "true",
+            ],
+        )
+
+    def test_write_jsonl(self):
+        with StringIO() as file:
+            self.assertEqual(write_jsonl(iter(ROWS), file), 2)
+            items = [json.loads(line) for line in file.getvalue().splitlines()]
+
+        self.assertEqual(
+            items[0],
+            {
+                "entity": "US",
+                "subdiv": None,
+                "category": "public",
+                "language": None,
+                "date": "2021-12-24",
+                "name": "Christmas Day (observed)",
+                "observed": True,
+                "estimated": False,
+            },
+        )
+        self.assertEqual(items[1]["subdiv"], "DU")
+
+    def test_write_arrow(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "holidays.arrow")
+            self.assertEqual(write_arrow(iter(ROWS), path, batch_size=1), 2)
+            with pa.memory_map(path) as source:
+                table = pa.ipc.open_file(source).read_all()
+
+            self.assertEqual(table.column_names, list(HolidayRow._fields))
+            self.assertEqual([HolidayRow(**item) for item in table.to_pylist()], ROWS)
+
+            path = str(Path(tmp_dir) / "holidays.parquet")
+            self.assertEqual(write_arrow(iter(ROWS), path, "parquet"), 2)
+            self.assertEqual(
+                [HolidayRow(**item) for item in pq.read_table(path).to_pylist()], ROWS
+            )
+
+            self.assertRaises(ValueError, lambda: write_arrow(ROWS, path, "orc"))
+
+
+class TestExportCli(TestCase):
+    def _run_cli(self, *args):
+        argv = ["holidays.export", "--start-year", "2024", "--end-year", "2024", "-j", "1"]
+        with warnings.catch_warnings(), mock.patch.object(sys, "argv", argv + list(args)):
+            with redirect_stdout(StringIO()) as stdout:
+                runpy.run_module("holidays.export", run_name="__main__")
+
+        return stdout.getvalue()
+
+    def test_cli(self):
+        lines = self._run_cli("-c", "US", "-m", "NYSE").splitlines()
+        self.assertEqual(lines[0], "entity,subdiv,category,language,date,name,observed,estimated")
+        self.assertEqual(lines[1], "US,,public,,2024-01-01,New Year's Day,false,false")
+        self.assertEqual(lines[-1], "XNYS,,public,,2024-12-25,Christmas Day,false,false")
+
+        items = [
+            json.loads(line)
+            for line in self._run_cli("-c", "AW", "-l", "nl", "-f", "jsonl").splitlines()
+        ]
+        self.assertEqual({item["language"] for item in items}, {"nl"})
+
+    def test_cli_output(self):
+        with TemporaryDirectory() as tmp_dir:
+            for file_format, file_name in (
+                ("csv", "holidays.csv"),
+                ("parquet", "holidays.parquet"),
+            ):
+                path = str(Path(tmp_dir) / file_name)
+                self.assertEqual(self._run_cli("-c", "US", "-f", file_format, "-o", path), "")
+                self.assertTrue(Path(path).stat().st_size)
+
+            with open(Path(tmp_dir) / "holidays.csv", encoding="UTF-8") as file:
+                self.assertEqual(sum(1 for _ in file), 1 + pq.read_metadata(path).num_rows)
+
+    def test_cli_import(self):
+        filters = warnings.filters[:]
+        with mock.patch.object(sys, "argv", ["holidays.export"]):
+            runpy.run_module("holidays.export")
+
+        self.assertEqual(warnings.filters, filters)
+
+    def test_cli_errors(self):
+        for args in (("-c", "XX"), ("-f", "arrow"), ("-f", "parquet", "-o", "holidays.parquet")):
+            with mock.patch.dict(sys.modules, {"pyarrow": None}), redirect_stderr(StringIO()):
+                with self.assertRaises(SystemExit):
+                    self._run_cli(*args)
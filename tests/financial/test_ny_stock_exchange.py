@@ -31,6 +31,7 @@ from holidays.calendars.gregorian import (
     SAT,
     SUN,
 )
+from holidays.constants import HALF_DAY
 from holidays.financial.ny_stock_exchange import NewYorkStockExchange, XNYS, NYSE
 from tests.common import CommonFinancialTests
 
@@ -489,3 +490,48 @@ class TestNewYorkStockExchange(CommonFinancialTests, TestCase):
             ("2023-11-23", "Thanksgiving Day"),
             ("2023-12-25", "Christmas Day"),
         )
+
+    def test_half_day(self):
+        half_day_holidays = NewYorkStockExchange(categories=HALF_DAY, years=range(1863, 2050))
+        self.assertNoHolidays(NewYorkStockExchange(categories=HALF_DAY, years=range(1863, 1993)))
+
+        name = "Day before Independence Day"
+        self.assertHolidayName(
+            name,
+            half_day_holidays,
+            "1995-07-03",
+            "1997-07-03",
+            "2001-07-03",
+            "2012-07-03",
+            "2013-07-03",
+            "2019-07-03",
+            "2024-07-03",
+            "2025-07-03",
+        )
+        self.assertNoHolidayName(
+            name,
+            half_day_holidays,
+            range(1993, 1995),
+            "2002-07-03",
+            "2015-07-03",
+            "2020-07-03",
+        )
+
+        name = "Day after Independence Day"
+        self.assertHolidayName(name, half_day_holidays, "1996-07-05", "2002-07-05")
+        self.assertNoHolidayName(name, half_day_holidays, range(1993, 1995), range(2013, 2050))
+
+        self.assertHolidayName(
+            "Day after Thanksgiving",
+            half_day_holidays,
+            "1993-11-26",
+            "2000-11-24",
+            "2023-11-24",
+            "2024-11-29",
+        )
+
+        name = "Christmas Eve"
+        self.assertHolidayName(
+            name, half_day_holidays, "1996-12-24", "2018-12-24", "2019-12-24", "2024-12-24"
+        )
+        self.assertNoHolidayName(name, half_day_holidays, "1999-12-24", "2022-12-24")
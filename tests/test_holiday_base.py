@@ -12,11 +12,14 @@
 
 import pickle
 import unittest
+import warnings
 from datetime import date, datetime
 from datetime import timedelta as td
+from unittest import mock
 
 from holidays.calendars.gregorian import JAN, FEB, OCT, DEC, MON, TUE, SAT, SUN
 from holidays.constants import HOLIDAY_NAME_DELIMITER, OPTIONAL, PUBLIC, SCHOOL
+from holidays.deprecations.v1_incompatibility import FutureIncompatibilityWarning
 from holidays.groups.christian import ChristianHolidays
 from holidays.groups.custom import StaticHolidays
 from holidays.holiday_base import HolidayBase
@@ -290,6 +293,21 @@ class TestCategories(unittest.TestCase):
 
 
 class TestDeprecationWarnings(unittest.TestCase):
+    def test_future_incompatibility_warning(self):
+        with mock.patch(
+            "holidays.deprecations.v1_incompatibility._is_future_incompatibility_warned", False
+        ):
+            with self.assertWarns(FutureIncompatibilityWarning):
+                CountryStub1()
+
+            with warnings.catch_warnings(record=True) as ctx:
+                warnings.simplefilter("always")
+                CountryStub1()
+                CountryStub2()
+            self.assertFalse(
+                [w for w in ctx if issubclass(w.category, FutureIncompatibilityWarning)]
+            )
+
     def test_prov_deprecation(self):
         with self.assertWarns(Warning):
             CountryStub1(prov="Subdiv 1")
@@ -584,6 +602,18 @@ class TestHelperMethods(unittest.TestCase):
             self.assertFalse(self.hb._is_weekend(dt))
             self.assertFalse(self.hb._is_weekend(*dt))
 
+    def test_get_weekend(self):
+        self.assertEqual(self.hb._get_weekend(1999), {SAT, SUN})
+
+        self.hb.weekend_history = {2000: {MON, TUE}, 2010: {SUN}}
+        self.assertEqual(self.hb._get_weekend(1999), {MON, TUE})
+        self.assertEqual(self.hb._get_weekend(2000), {SUN})
+        self.assertEqual(self.hb._get_weekend(2009), {SUN})
+        self.assertEqual(self.hb._get_weekend(2010), {SAT, SUN})
+        self.assertTrue(self.hb._is_weekend(date(1999, 12, 28)))
+        self.assertFalse(self.hb._is_weekend(date(2000, 1, 1)))
+        self.assertTrue(self.hb._is_weekend(date(2000, 1, 2)))
+
 
 class TestHolidaySum(unittest.TestCase):
     def setUp(self) -> None:
@@ -730,6 +760,7 @@ class TestKeyTransforms(unittest.TestCase):
     def test_exception(self):
         self.assertRaises((TypeError, ValueError), lambda: "abc" in self.hb)
         self.assertRaises((TypeError, ValueError), lambda: self.hb.get("abc123"))
+        self.assertRaises(ValueError, lambda: self.hb.get("2014-02-30"))
         self.assertRaises(TypeError, lambda: self.hb.get({"123"}))
         self.assertRaises((TypeError, ValueError), self.hb.__setitem__, "abc", "Test")
         self.assertRaises((TypeError, ValueError), lambda: {} in self.hb)
@@ -1152,6 +1183,89 @@ class TestWorkdays(unittest.TestCase):
         self.assertFalse(self.hb.is_working_day("2024-05-02"))
         self.assertTrue(self.hb.is_working_day("2024-05-03"))
 
+    def test_business_day_offset(self):
+        self.assertEqual(self.hb.business_day_offset("2024-02-15", 0), date(2024, 2, 15))
+        self.assertEqual(self.hb.business_day_offset("2024-02-15", +7), date(2024, 2, 26))
+        self.assertEqual(self.hb.business_day_offset("2024-02-26", -7), date(2024, 2, 15))
+        self.assertEqual(self.hb.business_day_offset("2024-02-24", 0), date(2024, 2, 24))
+        self.assertEqual(self.hb.business_day_offset("2024-05-01", +1), date(2024, 5, 6))
+        self.assertEqual(self.hb.business_day_offset("2023-12-29", +1), date(2024, 1, 2))
+        self.assertEqual(self.hb.business_day_offset("2024-01-02", -1), date(2023, 12, 29))
+
+        self.hb.weekend_history = {2023: {SUN}}
+        self.assertEqual(self.hb.business_day_offset("2022-12-30", +1), date(2022, 12, 31))
+        self.assertEqual(self.hb.business_day_offset("2022-12-31", +1), date(2023, 1, 3))
+        for n in (-520, +520):
+            self.assertEqual(
+                self.hb.business_day_offset("2024-01-02", n),
+                self.hb.get_nth_working_day("2024-01-02", n),
+            )
+
+    def test_business_day_offset_tables(self):
+        self.hb.business_day_offset("2024-02-15", +1)
+        tables = self.hb._working_days_tables.copy()
+        self.assertEqual(list(tables), [2024])
+        # The tables are built on the first call only.
+        self.hb.business_day_offset(["2024-03-15", "2024-04-15"], +1)
+        self.assertIs(self.hb._working_days_tables[2024], tables[2024])
+
+        for change in (
+            lambda: self.hb.update({"2024-02-16": "Test"}),
+            lambda: self.hb.pop("2024-02-16"),
+            lambda: self.hb.__delitem__(date(2024, 5, 1)),
+            self.hb.popitem,
+            lambda: setattr(self.hb, "weekend_history", {2025: {SUN}}),
+            lambda: self.hb._populate(2025),
+            self.hb.clear,
+        ):
+            self.hb.business_day_offset("2024-02-15", +1)
+            self.assertTrue(self.hb._working_days_tables)
+            change()
+            self.assertFalse(self.hb._working_days_tables)
+
+        self.hb.business_day_offset("2024-02-15", +1)
+        for hb in (self.hb.copy(), pickle.loads(pickle.dumps(self.hb))):
+            self.assertEqual(hb._working_days_tables, {})
+            self.assertEqual(hb.business_day_offset("2024-02-15", +1), date(2024, 2, 16))
+
+    def test_business_day_offset_roll(self):
+        for dt, roll, expected_dt in (
+            ("2024-02-17", "following", date(2024, 2, 20)),
+            ("2024-02-17", "preceding", date(2024, 2, 16)),
+            ("2024-02-17", "modified_following", date(2024, 2, 20)),
+            ("2024-02-17", "modified_preceding", date(2024, 2, 16)),
+            ("2024-03-31", "following", date(2024, 4, 1)),
+            ("2024-03-31", "modified_following", date(2024, 3, 29)),
+            ("2024-06-01", "preceding", date(2024, 5, 31)),
+            ("2024-06-01", "modified_preceding", date(2024, 6, 3)),
+            ("2024-06-03", "modified_preceding", date(2024, 6, 3)),
+        ):
+            self.assertEqual(self.hb.business_day_offset(dt, 0, roll), expected_dt)
+
+        self.assertEqual(
+            self.hb.business_day_offset("2024-03-31", +1, "modified_following"), date(2024, 4, 1)
+        )
+        self.assertRaises(ValueError, lambda: self.hb.business_day_offset("2024-03-31", 0, "nat"))
+
+    def test_business_day_offset_arrays(self):
+        import numpy as np
+
+        dts = ["2024-02-17", date(2024, 5, 1)]
+        self.assertEqual(
+            self.hb.business_day_offset(dts, +1), [date(2024, 2, 21), date(2024, 5, 6)]
+        )
+        self.assertEqual(self.hb.business_day_offset((), +1), [])
+
+        dts = np.array([["2024-02-17", "2024-05-01"]], dtype="datetime64[D]")
+        offset_dts = self.hb.business_day_offset(dts, +1)
+        self.assertEqual(offset_dts.dtype, np.dtype("datetime64[D]"))
+        self.assertEqual(offset_dts.tolist(), [[date(2024, 2, 21), date(2024, 5, 6)]])
+
+        for dt in (np.datetime64("2024-05-01"), np.datetime64("2024-05-01T12:00")):
+            offset_dt = self.hb.business_day_offset(dt, +1)
+            self.assertIsInstance(offset_dt, np.datetime64)
+            self.assertEqual(offset_dt, np.datetime64("2024-05-06"))
+
     def test_get_nth_working_day(self):
         self.assertEqual(self.hb.get_nth_working_day("2024-01-04", 0), date(2024, 1, 4))
         self.assertEqual(self.hb.get_nth_working_day("2024-01-04", +1), date(2024, 1, 5))
@@ -1189,3 +1303,47 @@ class TestWorkdays(unittest.TestCase):
         self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-04"), 3)
         self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-05"), 3)
         self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-06"), 4)
+
+    def test_to_busdaycalendar(self):
+        import numpy as np
+
+        calendar = self.hb.to_busdaycalendar("2021-01-01", "2023-12-31")
+        self.assertEqual(calendar.weekmask.tolist(), [True] * 5 + [False] * 2)
+        self.assertIn(np.datetime64("2022-07-04"), calendar.holidays)
+        self.assertNotIn(np.datetime64("2020-12-25"), calendar.holidays)
+        self.assertNotIn(np.datetime64("2024-01-01"), calendar.holidays)
+
+        for start, end in (("2021-01-01", "2023-12-31"), ("2024-12-31", "2023-01-01")):
+            calendar = self.hb.to_busdaycalendar(start, end)
+            days = np.arange(np.datetime64(min(start, end)), np.datetime64(max(start, end)) + 1)
+            self.assertEqual(
+                np.is_busday(days, busdaycal=calendar).tolist(),
+                [self.hb.is_working_day(day.item()) for day in days],
+            )
+
+        self.hb.weekend_history = {2023: {SUN}}
+        calendar = self.hb.to_busdaycalendar("2022-06-01", "2023-06-30")
+        self.assertEqual(calendar.weekmask.tolist(), [True] * 7)
+        days = np.arange(np.datetime64("2022-06-01"), np.datetime64("2023-07-01"))
+        self.assertEqual(
+            np.is_busday(days, busdaycal=calendar).tolist(),
+            [self.hb.is_working_day(day.item()) for day in days],
+        )
+        self.assertTrue(np.is_busday("2022-12-31", busdaycal=calendar))
+        self.assertFalse(np.is_busday("2023-01-07", busdaycal=calendar))
+        self.hb.weekend_history = {}
+
+        self.hb["2024-02-24"] = "Moved Holiday"
+        calendar = self.hb.to_busdaycalendar("2024-01-01", "2024-12-31")
+        self.assertEqual(calendar.weekmask.tolist(), [True] * 7)
+        self.assertFalse(np.is_busday("2024-02-17", busdaycal=calendar))
+        self.assertTrue(np.is_busday("2024-02-24", busdaycal=calendar))
+        self.assertEqual(np.busday_count("2024-02-15", "2024-02-26", busdaycal=calendar), 7)
+
+    def test_to_pandas_offset(self):
+        import pandas as pd
+
+        offset = self.hb.to_pandas_offset("2024-01-01", "2024-12-31", n=2)
+        self.assertEqual(pd.Timestamp("2024-02-15") + offset, pd.Timestamp("2024-02-20"))
+        self.assertEqual(pd.Timestamp("2024-02-22") + offset, pd.Timestamp("2024-02-24"))
+        self.assertEqual(pd.Timestamp("2024-04-29") + offset, pd.Timestamp("2024-05-03"))
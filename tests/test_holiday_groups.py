@@ -65,7 +65,7 @@ class TestPersianCalendarHolidays(TestCase):
     def test_add_persian_calendar_holiday(self):
         # Check for out-of-range dates.
         class TestHolidays(HolidayBase, PersianCalendarHolidays):
-            end_year = 2102
+            start_year = 1
 
             def __init__(self, *args, **kwargs):
                 PersianCalendarHolidays.__init__(self)
@@ -73,15 +73,17 @@ class TestPersianCalendarHolidays(TestCase):
 
         test_holidays = TestHolidays()
 
-        test_holidays._populate(2102)
+        test_holidays._populate(1)
+        test_holidays._add_islamic_revolution_day("Islamic Revolution Day")
+        test_holidays._add_oil_nationalization_day("Iranian Oil Industry Nationalization Day")
+        self.assertEqual(0, len(test_holidays))
+
         test_holidays._add_nowruz_day("Persian New Year")
         test_holidays._add_islamic_republic_day("Islamic Republic Day")
         test_holidays._add_natures_day("Nature's Day")
         test_holidays._add_death_of_khomeini_day("Death of Khomeini")
         test_holidays._add_khordad_uprising_day("Khordad National Uprising")
-        test_holidays._add_islamic_revolution_day("Islamic Revolution Day")
-        test_holidays._add_oil_nationalization_day("Iranian Oil Industry Nationalization Day")
-        self.assertEqual(0, len(test_holidays))
+        self.assertEqual(5, len(test_holidays))
 
 
 class TestThaiCalendarHolidays(TestCase):
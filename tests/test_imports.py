@@ -10,6 +10,8 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+import subprocess
+import sys
 from unittest import TestCase
 
 import holidays
@@ -47,3 +49,28 @@ class TestHolidaysImports(TestCase):
             "list_supported_financial",
         ):
             self.assertImport(name)
+
+    def test_future_incompatibility_warning(self):
+        # The warning is emitted on the first holidays object instantiation.
+        stderr = subprocess.run(
+            (sys.executable, "-W", "always", "-c", "import holidays"),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stderr
+        self.assertNotIn("FutureIncompatibilityWarning", stderr)
+
+    def test_lazy_dependencies(self):
+        # Run in a clean interpreter as test modules may import these on their own.
+        modules = subprocess.run(
+            (
+                sys.executable,
+                "-c",
+                "import sys; import holidays; holidays.US(years=2024); print(*sys.modules)",
+            ),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+        for name in ("dateutil.easter", "dateutil.parser"):
+            self.assertNotIn(name, modules)
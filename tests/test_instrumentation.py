@@ -0,0 +1,126 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import logging
+from datetime import date
+from unittest import TestCase, mock
+
+from holidays import country_holidays
+from holidays.holiday_base import HolidayBase
+from holidays.instrumentation import (
+    CATALOG_CACHE_HIT,
+    CATALOG_CACHE_MISS,
+    CATALOG_LOAD,
+    EXPAND,
+    POPULATE_END,
+    POPULATE_START,
+    CounterListener,
+    Event,
+    LoggingListener,
+    add_listener,
+    instrument,
+    remove_listener,
+)
+
+
+class TestInstrumentation(TestCase):
+    def setUp(self):
+        self.events = []
+        patcher = mock.patch.dict(HolidayBase._HolidayBase__translations, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_add_remove_listener(self):
+        add_listener(self.events.append)
+        country_holidays("US", years=2024)
+        remove_listener(self.events.append)
+        country_holidays("US", years=2024)
+
+        self.assertEqual(
+            [event.name for event in self.events],
+            [CATALOG_CACHE_MISS, CATALOG_LOAD, POPULATE_START, POPULATE_END],
+        )
+        self.assertRaises(ValueError, lambda: remove_listener(self.events.append))
+
+    def test_catalog_events(self):
+        with instrument(self.events.append):
+            country_holidays("UA", language="uk")
+            country_holidays("UA", language="uk")
+            country_holidays("UA", language="en_US")
+
+        self.assertEqual(
+            [(event.name, event.entity, event.language) for event in self.events],
+            [
+                (CATALOG_CACHE_MISS, "UA", "uk"),
+                (CATALOG_LOAD, "UA", "uk"),
+                (CATALOG_CACHE_HIT, "UA", "uk"),
+                (CATALOG_CACHE_MISS, "UA", "en_US"),
+                (CATALOG_LOAD, "UA", "en_US"),
+            ],
+        )
+        self.assertGreater(self.events[1].duration, 0)
+
+    def test_catalog_cache_environment(self):
+        for language, name in (("uk", "Новий рік"), ("en_US", "New Year's Day")):
+            with mock.patch.dict("os.environ", {"LANGUAGE": language}):
+                self.assertEqual(country_holidays("UA", years=2021)["2021-01-01"], name)
+
+    def test_populate_events(self):
+        with instrument(self.events.append):
+            us_holidays = country_holidays("US", subdiv="CA")
+            self.assertIn(date(2024, 1, 1), us_holidays)
+            self.assertIn(date(2024, 7, 4), us_holidays)
+            us_holidays.observed = False
+
+        self.assertEqual(
+            self.events[2:],
+            [
+                Event(EXPAND, "US", "CA", 2024),
+                Event(POPULATE_START, "US", "CA", 2024),
+                Event(POPULATE_END, "US", "CA", 2024, duration=self.events[4].duration),
+                Event(POPULATE_START, "US", "CA", 2024),
+                Event(POPULATE_END, "US", "CA", 2024, duration=self.events[6].duration),
+            ],
+        )
+        self.assertGreater(self.events[4].duration, 0)
+
+    def test_counter_listener(self):
+        with instrument(CounterListener()) as counter:
+            country_holidays("US", years=(2023, 2024))
+            country_holidays("US", subdiv="CA").get("2024-01-01")
+            country_holidays("UA", language="en_US")
+
+        counters = counter.counters
+        self.assertEqual(counters['holidays_populate_total{entity="US"}'], 2)
+        self.assertEqual(counters['holidays_populate_total{entity="US",subdiv="CA"}'], 1)
+        self.assertGreater(counters['holidays_populate_seconds_total{entity="US"}'], 0)
+        self.assertEqual(counters['holidays_expand_total{entity="US",subdiv="CA"}'], 1)
+        self.assertEqual(counters['holidays_catalog_cache_misses_total{entity="US"}'], 1)
+        self.assertEqual(counters['holidays_catalog_cache_hits_total{entity="US"}'], 1)
+        self.assertEqual(counters['holidays_catalog_loads_total{entity="US"}'], 1)
+        self.assertEqual(counters['holidays_catalog_loads_total{entity="UA",language="en_US"}'], 1)
+        self.assertGreater(counters['holidays_catalog_load_seconds_total{entity="US"}'], 0)
+        self.assertNotIn(POPULATE_START, "".join(counters))
+
+    def test_logging_listener(self):
+        with self.assertLogs("holidays", logging.DEBUG) as ctx:
+            with instrument(LoggingListener()):
+                country_holidays("US", years=2024)
+
+        self.assertEqual(len(ctx.output), 4)
+        self.assertEqual(ctx.output[2], "DEBUG:holidays:name=populate_start entity=US year=2024")
+
+        logger = logging.getLogger("test")
+        with self.assertLogs(logger, logging.INFO) as ctx:
+            with instrument(LoggingListener(logger, logging.INFO)):
+                country_holidays("US", years=2024)
+        self.assertEqual(len(ctx.output), 3)
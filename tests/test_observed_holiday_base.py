@@ -10,10 +10,12 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+import copy
+import pickle
 from datetime import date
 from unittest import TestCase
 
-from holidays.calendars.gregorian import MON, SUN
+from holidays.calendars.gregorian import MON, TUE, WED, SAT, SUN
 from holidays.observed_holiday_base import ObservedHolidayBase, ObservedRule
 
 
@@ -28,6 +30,66 @@ class TestObservedHolidayBase(TestCase):
         self.ohb.observed_label = "%s (Observed Label)"
         self.ohb._populate(2024)
 
+    def test_observed_rule_shifts(self):
+        self.assertEqual(self.MON_TO_TUE.shifts, (+1, 0, 0, 0, 0, 0, 0))
+        self.assertEqual(
+            (self.SUN_TO_NONE + ObservedRule({SAT: +7})).shifts, (0, 0, 0, 0, 0, +7, None)
+        )
+
+    def test_observed_rule_changes(self):
+        rule = ObservedRule({MON: +1})
+        self.assertEqual(rule.shifts, (+1, 0, 0, 0, 0, 0, 0))
+        for change, shifts in (
+            (lambda: rule.__setitem__(SUN, None), (+1, 0, 0, 0, 0, 0, None)),
+            (lambda: rule.update({SAT: +2}), (+1, 0, 0, 0, 0, +2, None)),
+            (lambda: rule.__ior__({TUE: -1}), (+1, -1, 0, 0, 0, +2, None)),
+            (lambda: rule.__delitem__(MON), (0, -1, 0, 0, 0, +2, None)),
+            (lambda: rule.pop(TUE), (0, 0, 0, 0, 0, +2, None)),
+            (lambda: rule.setdefault(WED, +7), (0, 0, +7, 0, 0, +2, None)),
+            (rule.popitem, (0, 0, 0, 0, 0, +2, None)),
+            (rule.clear, (0, 0, 0, 0, 0, 0, 0)),
+        ):
+            change()
+            self.assertEqual(rule.shifts, shifts)
+
+    def test_observed_rule_copy(self):
+        for rule in (copy.deepcopy(self.MON_TO_TUE), pickle.loads(pickle.dumps(self.MON_TO_TUE))):
+            self.assertIsInstance(rule, ObservedRule)
+            self.assertEqual(rule, self.MON_TO_TUE)
+            self.assertEqual(rule.shifts, (+1, 0, 0, 0, 0, 0, 0))
+
+    def test_get_next_workday(self):
+        self.ohb._add_holiday("Test Holiday", self.MONDAY)
+        self.assertEqual(self.ohb._get_next_workday(self.SUNDAY), date(2024, 5, 14))
+        self.assertEqual(self.ohb._get_next_workday(self.MONDAY, -1), date(2024, 5, 10))
+        self.assertEqual(self.ohb._get_next_workday(date(2024, 12, 31)), date(2024, 12, 31))
+
+    def test_get_next_workday_is_weekend(self):
+        class MondayWeekendHolidays(ObservedHolidayBase):
+            def _is_weekend(self, *args):
+                return args[0].weekday() == MON
+
+        ohb = MondayWeekendHolidays()
+        ohb._populate(2024)
+        self.assertEqual(ohb._get_next_workday(self.SUNDAY), date(2024, 5, 14))
+        self.assertEqual(ohb._get_next_workday(date(2024, 5, 14), -1), self.SUNDAY)
+
+    def test_observed_estimated_labels(self):
+        ohb = ObservedHolidayBase(observed_rule=self.MON_TO_TUE)
+        ohb.estimated_label = "%s (estimated)"
+        ohb.observed_label = "%s (observed)"
+        ohb.observed_estimated_label = "%s (observed, estimated)"
+        ohb._populate(2024)
+        ohb._add_observed(ohb._add_holiday("Test Holiday (estimated)", self.MONDAY))
+        ohb._add_observed(ohb._add_holiday("Test Holiday", date(2024, 5, 20)))
+
+        self.assertEqual(
+            ohb._get_observed_labels(),
+            ("%s (observed)", "%s (observed)", "estimated", "%s (observed, estimated)"),
+        )
+        self.assertEqual(ohb[date(2024, 5, 14)], "Test Holiday (observed, estimated)")
+        self.assertEqual(ohb[date(2024, 5, 21)], "Test Holiday (observed)")
+
     def test_get_observed_date(self):
         self.assertIsNone(self.ohb._get_observed_date(self.SUNDAY, rule=self.SUN_TO_NONE))
 
@@ -54,3 +116,18 @@ class TestObservedHolidayBase(TestCase):
             },
             self.ohb,
         )
+
+    def test_populate_observed_out_of_range(self):
+        ohb = ObservedHolidayBase(observed_rule=self.MON_TO_TUE)
+        ohb.observed_label = "%s (Observed Label)"
+        ohb._populate(2024)
+        ohb._populate_observed({None, ohb._add_holiday("Test Holiday", self.MONDAY)})
+
+        self.assertEqual(
+            dict(ohb),
+            {
+                date(2024, 5, 13): "Test Holiday",
+                date(2024, 5, 14): "Test Holiday (Observed Label)",
+            },
+            ohb,
+        )
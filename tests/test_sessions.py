@@ -0,0 +1,301 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+
+from datetime import date, datetime, time, timezone
+from unittest import TestCase, mock
+from zoneinfo import ZoneInfoNotFoundError
+
+from holidays.countries.united_states import UnitedStates
+from holidays.financial.ny_stock_exchange import NewYorkStockExchange
+from holidays.countries.germany import Germany
+from holidays.countries.united_kingdom import UnitedKingdom
+from holidays.sessions import (
+    DIFFERENCE,
+    INTERSECTION,
+    MAX_EMPTY_YEARS,
+    UNION,
+    CombinedSessions,
+    SessionSchedule,
+    TradingSchedule,
+    TradingSessions,
+    _Sessions,
+)
+from holidays.utils import financial_holidays
+
+
+class TestTradingSessions(TestCase):
+    def setUp(self):
+        self.sessions = TradingSessions("XNYS")
+
+    def test_init(self):
+        self.assertIsInstance(self.sessions.holidays, NewYorkStockExchange)
+
+        sessions = TradingSessions(UnitedStates(), years=range(2020, 2025))
+        self.assertEqual(list(sessions._sessions), [2020, 2021, 2022, 2023, 2024])
+        self.assertEqual(len(sessions._sessions[2024]), 251)
+        sessions = TradingSessions(UnitedStates(), years=2024)
+        self.assertEqual(list(sessions._sessions), [2024])
+
+    def test_is_session(self):
+        for dt in ("2024-07-03", "2024-07-05", date(2024, 12, 31)):
+            self.assertTrue(self.sessions.is_session(dt), dt)
+        for dt in ("2024-07-04", "2024-07-06", "2024-12-25", "2012-10-29", "9999-12-25"):
+            self.assertFalse(self.sessions.is_session(dt), dt)
+
+    def test_next_session(self):
+        self.assertEqual(self.sessions.next_session("2024-07-03"), date(2024, 7, 5))
+        self.assertEqual(self.sessions.next_session("2024-12-31"), date(2025, 1, 2))
+        self.assertEqual(self.sessions.next_session("2012-10-26"), date(2012, 10, 31))
+
+    def test_previous_session(self):
+        self.assertEqual(self.sessions.previous_session("2024-07-05"), date(2024, 7, 3))
+        self.assertEqual(self.sessions.previous_session("2024-01-02"), date(2023, 12, 29))
+        self.assertEqual(self.sessions.previous_session("2024-01-01"), date(2023, 12, 29))
+
+    def test_session_offset(self):
+        self.assertEqual(self.sessions.session_offset("2024-12-20", 5), date(2024, 12, 30))
+        self.assertEqual(self.sessions.session_offset("2024-12-20", 0), date(2024, 12, 20))
+        self.assertEqual(self.sessions.session_offset("2024-12-21", 0), date(2024, 12, 21))
+        self.assertEqual(self.sessions.session_offset("2025-01-02", -2), date(2024, 12, 30))
+
+    def test_session_offset_working_days(self):
+        for market in ("XNYS", "B3", "ECB", "IFEU"):
+            sessions = TradingSessions(market)
+            holidays = financial_holidays(market)
+            for dt in ("2020-01-01", "2024-07-04", "2024-12-24", "2025-12-31"):
+                for n in (-300, -25, -1, 0, 1, 25, 300):
+                    self.assertEqual(
+                        sessions.session_offset(dt, n),
+                        holidays.get_nth_working_day(dt, n),
+                        (market, dt, n),
+                    )
+
+    def test_sessions_in_range(self):
+        self.assertEqual(
+            self.sessions.sessions_in_range("2024-12-20", "2024-12-27"),
+            [
+                date(2024, 12, 20),
+                date(2024, 12, 23),
+                date(2024, 12, 24),
+                date(2024, 12, 26),
+                date(2024, 12, 27),
+            ],
+        )
+        self.assertEqual(
+            self.sessions.sessions_in_range("2024-12-27", "2024-12-20"),
+            self.sessions.sessions_in_range("2024-12-20", "2024-12-27"),
+        )
+        self.assertEqual(self.sessions.sessions_in_range("2024-12-25", "2024-12-25"), [])
+        self.assertEqual(
+            len(self.sessions.sessions_in_range("2000-01-01", "2024-12-31")),
+            financial_holidays("XNYS").get_working_days_count("2000-01-01", "2024-12-31"),
+        )
+
+    def test_weekend_workdays(self):
+        sessions = TradingSessions(financial_holidays("XNYS"))
+        sessions.holidays.weekend_workdays.add(date(2024, 7, 6))
+        self.assertTrue(sessions.is_session("2024-07-06"))
+        self.assertEqual(sessions.next_session("2024-07-05"), date(2024, 7, 6))
+
+    def test_bitmaps(self):
+        self.sessions.is_session("2024-01-01")
+        self.assertEqual(list(self.sessions._bitmaps), [2024])
+        self.assertEqual(bin(self.sessions._bitmaps[2024]).count("1"), 252)
+        # Jan 1 (Monday, New Year's Day) and Jan 2 (Tuesday).
+        self.assertEqual(self.sessions._bitmaps[2024] & 0b11, 0b10)
+
+        class IncompleteSessions(_Sessions):
+            def _to_date(self, key):
+                return date.fromisoformat(key)
+
+        self.assertRaises(TypeError, _Sessions)
+        self.assertRaises(TypeError, IncompleteSessions)
+
+
+class TestCombinedSessions(TestCase):
+    def setUp(self):
+        self.nyse = TradingSessions("XNYS")
+        self.target = TradingSessions("ECB")
+
+    def test_init(self):
+        self.assertRaises(ValueError, lambda: CombinedSessions("xor", self.nyse))
+        self.assertRaises(ValueError, lambda: CombinedSessions(UNION))
+
+        lse = TradingSessions(UnitedKingdom())
+        for operation, sessions in (
+            (INTERSECTION, self.nyse & self.target & lse),
+            (UNION, self.nyse | (self.target | lse)),
+            (DIFFERENCE, self.nyse - self.target - lse),
+        ):
+            self.assertEqual(sessions.operation, operation)
+            self.assertEqual(sessions.operands, [self.nyse, self.target, lse])
+
+        sessions = self.nyse - (self.target - lse)
+        self.assertEqual(sessions.operands[0], self.nyse)
+        self.assertEqual(sessions.operands[1].operands, [self.target, lse])
+        sessions = (self.nyse | self.target) & lse
+        self.assertEqual(sessions.operands[0].operands, [self.nyse, self.target])
+
+    def test_intersection(self):
+        sessions = self.nyse & self.target
+        for dt in ("2024-07-04", "2024-12-25", "2024-12-26", "2024-05-01", "2024-07-06"):
+            self.assertFalse(sessions.is_session(dt), dt)
+        self.assertTrue(sessions.is_session("2024-12-27"))
+        self.assertEqual(sessions.session_offset("2024-12-23", 2), date(2024, 12, 27))
+        self.assertEqual(sessions.previous_session("2025-01-02"), date(2024, 12, 31))
+        self.assertEqual(
+            sessions.sessions_in_range("2024-12-20", "2024-12-31"),
+            [
+                date(2024, 12, 20),
+                date(2024, 12, 23),
+                date(2024, 12, 24),
+                date(2024, 12, 27),
+                date(2024, 12, 30),
+                date(2024, 12, 31),
+            ],
+        )
+
+    def test_union(self):
+        sessions = self.nyse | self.target
+        for dt in ("2024-07-04", "2024-12-26", "2024-05-01"):
+            self.assertTrue(sessions.is_session(dt), dt)
+        for dt in ("2024-12-25", "2024-01-01", "2024-07-06"):
+            self.assertFalse(sessions.is_session(dt), dt)
+        self.assertEqual(sessions.next_session("2024-12-24"), date(2024, 12, 26))
+
+    def test_difference(self):
+        self.assertEqual(
+            (self.nyse - self.target).sessions_in_range("2024-01-01", "2024-12-31"),
+            [date(2024, 4, 1), date(2024, 5, 1), date(2024, 12, 26)],
+        )
+        self.assertEqual(
+            (self.target - self.nyse).sessions_in_range("2024-01-01", "2024-06-30"),
+            [date(2024, 1, 15), date(2024, 2, 19), date(2024, 5, 27), date(2024, 6, 19)],
+        )
+        self.assertEqual(
+            ((self.nyse | self.target) - TradingSessions(Germany())).sessions_in_range(
+                "2024-01-01", "2024-12-31"
+            ),
+            [
+                date(2024, 4, 1),
+                date(2024, 5, 1),
+                date(2024, 5, 9),
+                date(2024, 5, 20),
+                date(2024, 10, 3),
+                date(2024, 12, 26),
+            ],
+        )
+        self.assertEqual(
+            (self.target - self.nyse - TradingSessions(Germany())).sessions_in_range(
+                "2024-01-01", "2024-12-31"
+            ),
+            [],
+        )
+
+    def test_no_sessions(self):
+        sessions = self.nyse - self.nyse
+        for n in (+1, -1):
+            self.assertRaises(ValueError, lambda: sessions.session_offset("2024-07-04", n))
+        self.assertEqual(len(sessions._bitmaps), 2 * MAX_EMPTY_YEARS + 1)
+
+    def test_working_days(self):
+        us = UnitedStates()
+        uk = UnitedKingdom()
+        sessions = TradingSessions(us) & TradingSessions(uk)
+        for dt in sessions.sessions_in_range("2020-01-01", "2025-12-31")[::7]:
+            self.assertTrue(us.is_working_day(dt) and uk.is_working_day(dt), dt)
+        self.assertEqual(
+            len(sessions.sessions_in_range("2020-01-01", "2025-12-31")),
+            sum(
+                us.is_working_day(dt) and uk.is_working_day(dt)
+                for dt in (
+                    date.fromordinal(ordinal)
+                    for ordinal in range(
+                        date(2020, 1, 1).toordinal(), date(2025, 12, 31).toordinal() + 1
+                    )
+                )
+            ),
+        )
+
+
+class TestTradingSchedule(TestCase):
+    def setUp(self):
+        self.schedule = TradingSchedule("XNYS")
+
+    def assertSessionTimes(self, dt, open_time, close_time, schedule=None):  # noqa: N802
+        open_dt, close_dt = (schedule or self.schedule).get_session_times(dt)
+        self.assertEqual((open_dt.time(), close_dt.time()), (open_time, close_time), dt)
+
+    def test_init(self):
+        schedule = TradingSchedule(financial_holidays("XNYS"), years=range(2023, 2025))
+        self.assertEqual(list(schedule._schedules), [2023, 2024])
+        self.assertEqual(len(schedule._schedules[2024][0]), len(schedule._sessions[2024]))
+
+        self.assertIsNone(TradingSchedule("ECB")._half_days)
+        self.assertRaises(ValueError, lambda: TradingSchedule("B3"))
+        self.assertRaises(ValueError, lambda: TradingSchedule(UnitedStates()))
+
+        with mock.patch("zoneinfo.ZoneInfo", side_effect=ZoneInfoNotFoundError):
+            self.assertRaises(ZoneInfoNotFoundError, lambda: TradingSchedule("XNYS"))
+
+    def test_get_session_times(self):
+        open_dt, close_dt = self.schedule.get_session_times("2024-07-05")
+        self.assertEqual(open_dt, datetime(2024, 7, 5, 13, 30, tzinfo=timezone.utc))
+        self.assertEqual(close_dt, datetime(2024, 7, 5, 20, tzinfo=timezone.utc))
+        open_dt, close_dt = self.schedule.get_session_times("2024-12-20")
+        self.assertEqual(open_dt, datetime(2024, 12, 20, 14, 30, tzinfo=timezone.utc))
+
+        self.assertRaises(ValueError, lambda: self.schedule.get_session_times("2024-07-04"))
+
+    def test_session_hours_changes(self):
+        self.assertSessionTimes("1900-06-01", time(10), time(15))
+        self.assertSessionTimes("1952-09-26", time(10), time(15))
+        self.assertSessionTimes("1952-09-29", time(10), time(15, 30))
+        self.assertSessionTimes("1974-10-01", time(10), time(16))
+        self.assertSessionTimes("1985-09-26", time(10), time(16))
+        self.assertSessionTimes("1985-09-30", time(9, 30), time(16))
+
+        ecb = TradingSchedule("ECB")
+        self.assertSessionTimes("2024-12-24", time(7), time(18), ecb)
+        self.assertEqual(ecb.get_session_times("2024-07-01")[0].utcoffset().seconds, 7200)
+
+    def test_half_days(self):
+        for dt in ("2024-07-03", "2024-11-29", "2024-12-24", "2002-07-05"):
+            self.assertSessionTimes(dt, time(9, 30), time(13))
+        for dt in ("2024-07-02", "2024-12-23", "2002-07-03", "1992-11-27"):
+            self.assertEqual(self.schedule.get_session_times(dt)[1].hour, 16, dt)
+
+    def test_get_schedule(self):
+        schedule = self.schedule.get_schedule("2024-12-27", "2024-12-20")
+        self.assertIsInstance(schedule, SessionSchedule)
+        self.assertEqual(
+            [date.fromordinal(ordinal) for ordinal in schedule.sessions],
+            self.schedule.sessions_in_range("2024-12-20", "2024-12-27"),
+        )
+        self.assertEqual(
+            schedule.opens[2], datetime(2024, 12, 24, 14, 30, tzinfo=timezone.utc).timestamp()
+        )
+        self.assertEqual(
+            [close_ts - open_ts for open_ts, close_ts in zip(schedule.opens, schedule.closes)],
+            [23400, 23400, 12600, 23400, 23400],
+        )
+
+        schedule = self.schedule.get_schedule("2023-12-29", "2024-01-02")
+        self.assertEqual(len(schedule.sessions), 2)
+        for field in schedule:
+            self.assertEqual(field.typecode, "q")
+            self.assertEqual(field.itemsize, 8)
+        for open_ts, session in zip(schedule.opens, schedule.sessions):
+            open_dt = datetime.fromtimestamp(open_ts, self.schedule.timezone)
+            self.assertEqual(open_dt.date().toordinal(), session)
+            self.assertEqual(open_dt.time(), time(9, 30))
@@ -0,0 +1,53 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see AUTHORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import json
+from pathlib import Path
+from unittest import TestCase
+
+from holidays.countries.united_states import UnitedStates
+from holidays.financial.ny_stock_exchange import NewYorkStockExchange
+from holidays.snapshots import SNAPSHOT_YEARS, SnapshotCase, get_snapshot_cases
+
+SNAPSHOTS_PATH = Path(__file__).parents[1] / "snapshots"
+
+
+class TestSnapshots(TestCase):
+    def test_get_snapshot_cases(self):
+        cases = get_snapshot_cases(UnitedStates)
+        self.assertEqual(len(cases), len(UnitedStates.subdivisions) + 1)
+        self.assertEqual(cases[0], SnapshotCase("countries/US_COMMON", UnitedStates, None))
+        self.assertIn(SnapshotCase("countries/US_CA", UnitedStates, "CA"), cases)
+        for case in cases:
+            self.assertTrue((SNAPSHOTS_PATH / f"{case.name}.json").exists(), case.name)
+
+        self.assertEqual(
+            get_snapshot_cases(NewYorkStockExchange),
+            [SnapshotCase("financial/XNYS", NewYorkStockExchange, None)],
+        )
+
+    def test_get_holidays(self):
+        for case in (
+            SnapshotCase("countries/US_CA", UnitedStates, "CA"),
+            SnapshotCase("financial/XNYS", NewYorkStockExchange, None),
+        ):
+            holidays = case.get_holidays()
+            self.assertEqual(holidays.years, set(SNAPSHOT_YEARS))
+            with open(SNAPSHOTS_PATH / f"{case.name}.json", encoding="UTF-8") as file:
+                self.assertEqual(
+                    {str(dt): name for dt, name in sorted(holidays.items())}, json.load(file)
+                )
+
+        self.assertEqual(
+            SnapshotCase("countries/US_COMMON", UnitedStates, None).get_holidays(years=None).years,
+            set(),
+        )